@@ -1,10 +1,54 @@
 """OpenAI-powered agents for extracting and formatting investment update information."""
+import asyncio
+import atexit
+import copy
+import functools
+import hashlib
 import json
+import re
+import threading
 import time
+from collections import Counter, OrderedDict
+import httpx
+import numpy as np
 import openai
-from config import OPENAI_API_KEY, OPENAI_MODEL, OPENAI_TEMPERATURE, EXTRACTION_MODEL, FORMATTING_MODEL
+from openai import DefaultAioHttpClient
+from config import (
+    OPENAI_API_KEY, OPENAI_MODEL, OPENAI_TEMPERATURE, EXTRACTION_MODEL, FORMATTING_MODEL,
+    LLM_CACHE_DIR, LLM_CACHE_TTL_DAYS, LLM_CACHE_BYPASS
+)
 from benchmark_lookup import BenchmarkLookup
-from text_chunker import estimate_tokens, chunk_text
+from response_cache import ResponseCache, cache_key
+from text_chunker import estimate_tokens, chunk_text_by_sections
+import scoring_kernels
+
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON; fall back to the stdlib parser
+    orjson = None
+
+_json_loads = orjson.loads if orjson else json.loads
+
+
+def _json_dumps_pretty(data):
+    """Indented, key-sorted JSON text for prompts (orjson when available; stdlib for anything it rejects)."""
+    if orjson:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, sort_keys=True)
+
+try:
+    import h2  # noqa: F401 -- presence enables HTTP/2 in httpx
+    _HTTP2 = True
+except ImportError:  # Optional; the shared client falls back to HTTP/1.1 keep-alive
+    _HTTP2 = False
+
+try:
+    import ahocorasick
+except ImportError:  # Optional single-pass keyword automaton; fall back to precompiled regexes
+    ahocorasick = None
 
 
 # System prompt for the extraction agent
@@ -62,61 +106,62 @@ from text_chunker import estimate_tokens, chunk_text
 # - Be thorough but selective - capture important performance and news, skip generic descriptions."""
 
 
-# # System prompt for the formatting agent
-# FORMATTING_PROMPT = """You are an investment update formatter. Your task is to format extracted investment information (provided as JSON) into a standardized text format.
-
-# You will receive a JSON object with the following structure:
-# - fund_name: The fund/company name
-# - asset_class: The asset class
-# - deal_type: The deal type (Fund or Direct Investment)
-# - vintage: The vintage year (or null)
-# - performance_summary: Brief performance summary (As Expected, Outperforming, or Underperforming)
-# - investment_performance: Array of investment performance details (including benchmark comparisons)
-# - key_takeaways: Array of key takeaways
-# - business_updates: Array of business updates and market commentary
-
-# Format the information as follows:
-
-# {Fund/Company Name} Update - {Performance Summary}
-
-# **Quantitative Performance:**
-#   • Net IRR: [net_irr]%[ (vs benchmark [benchmark_irr]% - [benchmark_category]) if benchmark_irr_comparison exists]
-#   • Net MOIC: *OMIT IF DIRECT INVESTMENT* [net_moic]x[ (vs benchmark [benchmark_moic]x - [benchmark_category]) if benchmark_moic_comparison exists]
-#   • Net DPI: *OMIT IF DIRECT INVESTMENT* [net_dpi]x[ (vs benchmark [benchmark_dpi]x - [benchmark_category]) if benchmark_dpi_comparison exists]
-#   • [First bullet point from investment_performance array]
-#   • [Second bullet point from investment_performance array]
-#   • [Continue for all items...]
-
-# **Key Takeaways and Business Updates:**
-#   • [First bullet point from key_takeaways array]
-#   • [Second bullet point from key_takeaways array]
-#   • [Continue for all items...]
-
-# **Market Commentary:**
-#   • [First bullet point from business_updates array]
-#   • [Second bullet point from business_updates array]
-#   • [Continue for all items...]
-
-# Guidelines:
-# - Your job is to deduce what is most essential, even if it is only one sentence. Quality is more important than verbosity. The update should not exceed 250 words.
-# - Use the fund_name and performance_summary from the JSON for the header
-# - For IRR/MOIC/DPI lines: If benchmark_comparison data exists (benchmark_irr_comparison, benchmark_moic_comparison, benchmark_dpi_comparison), include the benchmark comparison inline in parentheses. Format: "Net IRR: 15.5% (vs benchmark 13.1% - Above Median)" or similar.
-# - Only include benchmark comparisons if they are present in the JSON (they will only be present if asset_class and vintage are available)
-# - Section titles (Quantitative Performance:, Key Takeaways and Business Updates:, Market Commentary:) MUST be bolded using **text** markdown syntax
-# - Use the bullet character (•) for all bullet points - this will be automatically converted to proper Google Docs bullet formatting
-# - Use indented bullet points with two spaces of indentation before each bullet: "  • "
-# - Convert each array item into a bullet point
-# - Use clear, concise bullet points
-# - CRITICAL: Each section (Investment Performance, Key Takeaways, Business Updates/Market Commentary) must NOT exceed 200 words total
-# - PRIORITIZE: Performance metrics, returns, financial data, new developments, portfolio company news
-# - EXCLUDE: Generic overview statements like "this fund focuses on X" or "the fund invests in Y"
-# - If a section would exceed 200 words, prioritize the most important/insightful items and remove less critical ones
-# - Ensure each section has at least one bullet point
-# - Use professional language
-# - If an array is empty or has no relevant information, include a bullet like "  • No significant updates"
-# - The Performance Summary in the header should be brief (e.g., "Strong Q4 Performance", "Challenging Market Conditions", "Up 15% YoY")
-# - Make sure every bullet point starts with "  • " (two spaces, bullet character •, space)
-# - Focus on actionable insights and quantitative data over descriptive overviews"""
+# System prompt for the formatting agent
+FORMATTING_PROMPT = """You are an investment update formatter. Your task is to format extracted investment information (provided as JSON) into a standardized text format.
+
+You will receive a JSON object with the following structure:
+- fund_name: The fund/company name
+- asset_class: The asset class
+- deal_type: The deal type (Fund or Direct Investment)
+- vintage: The vintage year (or null)
+- performance_summary: Brief performance summary (As Expected, Outperforming, or Underperforming)
+- investment_performance: Array of investment performance details (including benchmark comparisons)
+- key_takeaways: Array of key takeaways
+- business_updates: Array of business updates and market commentary
+
+Format the information as follows:
+
+{Fund/Company Name} Update - {Performance Summary}
+
+**Quantitative Performance:**
+  • Net IRR: [net_irr]%[ (vs benchmark [benchmark_irr]% - [benchmark_category]) if benchmark_irr_comparison exists]
+  • Net MOIC: *OMIT IF DIRECT INVESTMENT* [net_moic]x[ (vs benchmark [benchmark_moic]x - [benchmark_category]) if benchmark_moic_comparison exists]
+  • Net DPI: *OMIT IF DIRECT INVESTMENT* [net_dpi]x[ (vs benchmark [benchmark_dpi]x - [benchmark_category]) if benchmark_dpi_comparison exists]
+  • [First bullet point from investment_performance array]
+  • [Second bullet point from investment_performance array]
+  • [Continue for all items...]
+
+**Key Takeaways and Business Updates:**
+  • [First bullet point from key_takeaways array]
+  • [Second bullet point from key_takeaways array]
+  • [Continue for all items...]
+
+**Market Commentary:**
+  • [First bullet point from business_updates array]
+  • [Second bullet point from business_updates array]
+  • [Continue for all items...]
+
+Guidelines:
+- Your job is to deduce what is most essential, even if it is only one sentence. Quality is more important than verbosity. The update should not exceed 250 words.
+- Use the fund_name and performance_summary from the JSON for the header
+- For IRR/MOIC/DPI lines: If benchmark_comparison data exists (benchmark_irr_comparison, benchmark_moic_comparison, benchmark_dpi_comparison), include the benchmark comparison inline in parentheses. Format: "Net IRR: 15.5% (vs benchmark 13.1% - Above Median)" or similar.
+- Only include benchmark comparisons if they are present in the JSON (they will only be present if asset_class and vintage are available)
+- Section titles (Quantitative Performance:, Key Takeaways and Business Updates:, Market Commentary:) MUST be bolded using **text** markdown syntax
+- Use the bullet character (•) for all bullet points - this will be automatically converted to proper Google Docs bullet formatting
+- Use indented bullet points with two spaces of indentation before each bullet: "  • "
+- Convert each array item into a bullet point
+- Use clear, concise bullet points
+- CRITICAL: Each section (Investment Performance, Key Takeaways, Business Updates/Market Commentary) must NOT exceed 200 words total
+- PRIORITIZE: Performance metrics, returns, financial data, new developments, portfolio company news
+- EXCLUDE: Generic overview statements like "this fund focuses on X" or "the fund invests in Y"
+- If a section would exceed 200 words, prioritize the most important/insightful items and remove less critical ones
+- Ensure each section has at least one bullet point
+- Use professional language
+- If an array is empty or has no relevant information, include a bullet like "  • No significant updates"
+- The Performance Summary in the header should be brief (e.g., "Strong Q4 Performance", "Challenging Market Conditions", "Up 15% YoY")
+- Make sure every bullet point starts with "  • " (two spaces, bullet character •, space)
+- Focus on actionable insights and quantitative data over descriptive overviews"""
+
 EXTRACTION_PROMPT = """You are a highly experienced investment specialist. You are reviewing investment updates that come in a wide array of presentations and formats, in an effort to distill key performance metrics, both qualitative and quantitative. Your task is to extract critical information from investment update documents and return it as structured JSON.
 
 CRITICAL: Always extract fund-level Net IRR, Net MOIC (or TVPI), and Net DPI as separate numeric fields. These are essential for benchmarking.
@@ -175,12 +220,378 @@ IMPORTANT:
 - Use arrays for the three detail sections (investment_performance, key_takeaways, business_updates) - each item should be a clear, concise statement.
 - Be thorough but selective - capture important performance and news, skip generic descriptions."""
 
+# Extraction request message parts, built once (the system message is shared, never mutated)
+_SYSTEM_MSG = {"role": "system", "content": EXTRACTION_PROMPT}
+_FORMATTING_SYSTEM_MSG = {"role": "system", "content": FORMATTING_PROMPT}
+
+# Provider prompt-cache routing keys: requests sharing a key and a byte-identical system
+# prefix are routed together so the static prompt is served from cache
+EXTRACTION_PROMPT_CACHE_KEY = "extraction_agent_v1"
+FORMATTING_PROMPT_CACHE_KEY = "formatting_agent_v1"
+_USER_PREFIX = "Extract information from the following investment update:\n\n"
+
+# Token overhead of the (constant) extraction prompt, computed once at import
+_PROMPT_OVERHEAD = estimate_tokens(EXTRACTION_PROMPT, EXTRACTION_MODEL) + 100
+
+# Multi-document extraction (extract_information_batch): documents are delimited with "===DOC i==="
+# and the model returns {"results": [...]} with one EXTRACTION_PROMPT object (plus "doc": i) per document
+EXTRACTION_BATCH_SIZE = 8
+_BATCH_USER_PREFIX = (
+    "The following are {n} separate investment updates, each starting with a ===DOC i=== line. "
+    "Extract information from each one independently, exactly as specified above. Return a JSON object "
+    '{{"results": [...]}} with one object per document, each including "doc": i for its document number.\n\n'
+)
+_BATCH_PROMPT_OVERHEAD = _PROMPT_OVERHEAD + estimate_tokens(_BATCH_USER_PREFIX, EXTRACTION_MODEL)
+_BATCH_RESPONSE_SCHEMA = {
+    "name": "extraction_batch",
+    "schema": {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "doc": {"type": "integer"},
+                        "fund_name": {"type": ["string", "null"]},
+                        "asset_class": {"type": ["string", "null"]},
+                        "deal_type": {"type": ["string", "null"]},
+                        "vintage": {"type": ["integer", "null"]},
+                        "net_irr": {"type": ["number", "null"]},
+                        "net_moic": {"type": ["number", "null"]},
+                        "net_dpi": {"type": ["number", "null"]},
+                        "performance_summary": {"type": ["string", "null"]},
+                        "investment_performance": {"type": "array", "items": {"type": "string"}},
+                        "key_takeaways": {"type": "array", "items": {"type": "string"}},
+                        "business_updates": {"type": "array", "items": {"type": "string"}}
+                    },
+                    "required": ["doc"]
+                }
+            }
+        },
+        "required": ["results"]
+    }
+}
+
+# Qualitative (sentiment) assessment, used when benchmarks are unavailable
+_QUALITATIVE_SYSTEM_MSG = {"role": "system", "content": "You are an investment analyst assessing fund performance based on qualitative indicators in investor updates."}
+_QUALITATIVE_PROMPT = """Based on the following investment update content, assess the overall performance sentiment. Consider:
+- Language used (positive, negative, neutral)
+- Management commentary tone
+- Market conditions described
+- Portfolio performance descriptions
+- Strategic outlook
+
+Return ONLY a JSON object of the form {{"v": "Outperforming" | "Underperforming" | "AsExpected"}}
+
+Content:
+{content}"""
+_QUALITATIVE_BATCH_PROMPT = """Based on the content of each of the following {n} investment updates, assess each update's overall performance sentiment independently. Consider:
+- Language used (positive, negative, neutral)
+- Management commentary tone
+- Market conditions described
+- Portfolio performance descriptions
+- Strategic outlook
+
+Return ONLY a JSON object of the form {{"verdicts": [{{"id": <DOC number>, "verdict": "Outperforming" | "Underperforming" | "AsExpected"}}, ...]}} with one entry per update.
+
+{content}"""
+
+# Keyword indicators for the qualitative assessment: a clear margin settles it without the LLM
+_POSITIVE_INDICATORS = (
+    'strong performance', 'outperforming', 'exceeded', 'above expectations',
+    'record', 'best', 'top', 'excellent', 'outstanding', 'significant gains',
+    'successful', 'bullish', 'improving', 'positive momentum', 'strong returns'
+)
+_NEGATIVE_INDICATORS = (
+    'underperforming', 'below expectations', 'challenging', 'disappointing',
+    'weak', 'declining', 'concerns', 'headwinds', 'difficult', 'struggling',
+    'losses', 'negative', 'bearish', 'deteriorating', 'under pressure'
+)
+KEYWORD_CONFIDENCE_MARGIN = 2
+
+# Wording in the document's own performance summary -> qualitative verdict (checked in this order)
+_SUMMARY_VERDICTS = {
+    'outperforming': 'outperforming',
+    'strong': 'outperforming',
+    'excellent': 'outperforming',
+    'underperforming': 'underperforming',
+    'weak': 'underperforming',
+    'challenging': 'underperforming',
+    'disappointing': 'underperforming',
+    'as expected': 'as_expected',
+    'meeting': 'as_expected',
+    'on track': 'as_expected',
+}
+
+# Structured outputs for the qualitative verdict: the model can only answer with one of the enum values
+_VERDICT_ENUM = ["Outperforming", "Underperforming", "AsExpected"]
+_VERDICT_SCHEMA = {
+    "name": "verdict",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {"v": {"type": "string", "enum": _VERDICT_ENUM}},
+        "required": ["v"],
+        "additionalProperties": False
+    }
+}
+_VERDICT_BATCH_SCHEMA = {
+    "name": "verdicts",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "verdicts": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer"},
+                        "verdict": {"type": "string", "enum": _VERDICT_ENUM}
+                    },
+                    "required": ["id", "verdict"],
+                    "additionalProperties": False
+                }
+            }
+        },
+        "required": ["verdicts"],
+        "additionalProperties": False
+    }
+}
+
+# Maximum number of documents assessed in one batched qualitative completion
+QUALITATIVE_BATCH_SIZE = 12
+
+# Maximum number of chunk extractions in flight at once (keeps us under OpenAI rate limits)
+EXTRACTION_CONCURRENCY = 8
+
+# Completion budget for one extraction: base + a quarter of the input tokens, capped
+# (the JSON schema is bounded, so this only trims rambling / worst-case output cost; a reply cut off
+# at the budget is retried uncapped by _extract_single)
+EXTRACTION_COMPLETION_BASE = 400
+EXTRACTION_COMPLETION_CAP = 2000
+
+# Whole-analysis cache (AnalysisAgent.analyze_update): bump ANALYSIS_CACHE_VERSION when post-processing
+# logic changes; prompt edits change PROMPT_VERSION and invalidate cached results automatically
+ANALYSIS_CACHE_VERSION = 1
+PROMPT_VERSION = cache_key(EXTRACTION_PROMPT, FORMATTING_PROMPT, _QUALITATIVE_PROMPT, _QUALITATIVE_BATCH_PROMPT)[:12]
+# Qualitative verdict cache entries (single and batched assessments share keys) are invalidated by edits to
+# either qualitative prompt
+QUALITATIVE_PROMPT_VERSION = cache_key(
+    _QUALITATIVE_SYSTEM_MSG['content'], _QUALITATIVE_PROMPT, _QUALITATIVE_BATCH_PROMPT
+)[:12]
+
+# Maximum number of documents analyzed at once by AnalysisAgent.analyze_updates_concurrent
+ANALYSIS_CONCURRENCY = 4
+
+# Detail sections produced by the extraction agent
+ARRAY_KEYS = ('investment_performance', 'key_takeaways', 'business_updates')
+
+# Cap on merged detail-section length so the formatting prompt stays bounded for long documents
+MAX_MERGED_ITEMS = 30
+
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+# JSON object in a model response: inside a ``` / ```json fence, or bare
+_JSON_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```|(\{.*\})', re.DOTALL)
+
+# Benchmark percentiles counted as top / bottom performance in the performance summary
+_TOP_PERCENTILES = frozenset(('top_decile', 'top_quartile'))
+_BOTTOM_PERCENTILES = frozenset(('bottom_decile', 'bottom_quartile'))
+_BENCHMARK_KEYS = ('benchmark_irr_comparison', 'benchmark_moic_comparison', 'benchmark_dpi_comparison')
+
+# Reasonable thresholds for private investments when no benchmark is available: (metric, low, high).
+# Below low = underperforming, above high = outperforming, otherwise as expected.
+# IRR: 5-12%, MOIC: 1.2-2.0x, DPI: 0.5-1.0x
+_THRESHOLDS = (
+    ('net_irr', 5, 12),
+    ('net_moic', 1.2, 2.0),
+    ('net_dpi', 0.5, 1.0),
+)
+
+# Texts shorter than this (after stripping) are not sent to the extraction model
+MIN_EXTRACTION_CHARS = 50
+
+# In-process LRU cache of extraction results keyed on a blake2b digest of the document text
+EXTRACTION_CACHE_SIZE = 256
+_EXTRACTION_CACHE = OrderedDict()
+_EXTRACTION_CACHE_LOCK = threading.Lock()
+
+
+def _extraction_cache_get(key):
+    """Return a copy of the cached extraction for key (marking it most recently used), or None."""
+    with _EXTRACTION_CACHE_LOCK:
+        extracted_data = _EXTRACTION_CACHE.get(key)
+        if extracted_data is None:
+            return None
+        _EXTRACTION_CACHE.move_to_end(key)
+    return copy.deepcopy(extracted_data)
+
+
+def _extraction_cache_put(key, extracted_data):
+    """Store a copy of an extraction, evicting the least recently used entry when full."""
+    extracted_data = copy.deepcopy(extracted_data)
+    with _EXTRACTION_CACHE_LOCK:
+        _EXTRACTION_CACHE[key] = extracted_data
+        _EXTRACTION_CACHE.move_to_end(key)
+        if len(_EXTRACTION_CACHE) > EXTRACTION_CACHE_SIZE:
+            _EXTRACTION_CACHE.popitem(last=False)
+
+def _qualitative_from_summary(original_performance_summary):
+    """Qualitative verdict implied by the document's own performance summary wording, or None."""
+    if not original_performance_summary:
+        return None
+    original_lower = original_performance_summary.lower()
+    return next((verdict for phrase, verdict in _SUMMARY_VERDICTS.items() if phrase in original_lower), None)
+
+def _qualitative_text(extracted_data):
+    """Detail-section bullets joined for qualitative analysis (canonical dedup, as in _merge_extractions)."""
+    all_text = {}
+    for section in ARRAY_KEYS:
+        items = extracted_data.get(section, [])
+        if isinstance(items, str):
+            items = [items]
+        elif not isinstance(items, list):
+            continue
+        for item in items:
+            all_text.setdefault(_canon(item), item)
+    return '\n'.join(map(str, all_text.values()))
+
+def _build_indicator_automaton():
+    """One Aho-Corasick automaton over both indicator lists, values tagged (is_positive, indicator)."""
+    automaton = ahocorasick.Automaton()
+    for indicator in _POSITIVE_INDICATORS:
+        automaton.add_word(indicator, (True, indicator))
+    for indicator in _NEGATIVE_INDICATORS:
+        automaton.add_word(indicator, (False, indicator))
+    automaton.make_automaton()
+    return automaton
+
+_INDICATOR_AUTOMATON = _build_indicator_automaton() if ahocorasick else None
+
+# Regex fallback: a zero-width lookahead finds indicators starting at every position (overlaps
+# included), so the distinct matches equal the per-indicator substring checks in one C-level pass
+_POSITIVE_RE = re.compile('(?=(' + '|'.join(map(re.escape, _POSITIVE_INDICATORS)) + '))')
+_NEGATIVE_RE = re.compile('(?=(' + '|'.join(map(re.escape, _NEGATIVE_INDICATORS)) + '))')
+
+@functools.lru_cache(maxsize=128)
+def _indicator_counts(text):
+    """
+    Number of distinct positive and negative indicators occurring in text (case-insensitive).
+    Memoized: the keyword gate, the batched prefetch and the keyword fallback all count the same text.
+    """
+    text_lower = text.lower()
+    if _INDICATOR_AUTOMATON is not None:
+        found = {value for _, value in _INDICATOR_AUTOMATON.iter(text_lower)}
+        positive_count = sum(1 for is_positive, _ in found if is_positive)
+        return positive_count, len(found) - positive_count
+    return len(set(_POSITIVE_RE.findall(text_lower))), len(set(_NEGATIVE_RE.findall(text_lower)))
+
+def _confident_keyword_verdict(text):
+    """Keyword verdict when one side leads by KEYWORD_CONFIDENCE_MARGIN indicators, else None (escalate to the LLM)."""
+    positive_count, negative_count = _indicator_counts(text)
+    if positive_count - negative_count >= KEYWORD_CONFIDENCE_MARGIN:
+        return 'outperforming'
+    if negative_count - positive_count >= KEYWORD_CONFIDENCE_MARGIN:
+        return 'underperforming'
+    return None
+
+def _parse_verdict(result):
+    """Map a model's one-word qualitative answer to 'outperforming' / 'underperforming' / 'as_expected', or None."""
+    result = result.strip().lower()
+    if 'outperforming' in result:
+        return 'outperforming'
+    elif 'underperforming' in result:
+        return 'underperforming'
+    elif 'asexpected' in result or 'as expected' in result:
+        return 'as_expected'
+    return None
+
+def _cached_tokens(usage):
+    """Prompt tokens served from the provider prompt cache, 0 when not reported."""
+    details = getattr(usage, 'prompt_tokens_details', None)
+    return (getattr(details, 'cached_tokens', None) or 0) if details else 0
+
+def _as_float(value):
+    """Numeric metric value as float, NaN when missing or non-numeric (for the batch scoring kernels)."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return float('nan')
+
+# Process-wide OpenAI client, benchmark table and LLM response cache, shared by every agent instance
+_CLIENT = None
+_BENCH = None
+_RESPONSE_CACHE = None
+_RESPONSE_CACHE_OPENED = False
+_SINGLETON_LOCK = threading.Lock()
+
+
+def _get_client():
+    """Return the shared synchronous OpenAI client (one connection pool per process, closed at exit)."""
+    global _CLIENT
+    if _CLIENT is None:
+        with _SINGLETON_LOCK:
+            if _CLIENT is None:
+                # Keep-alive pool (and HTTP/2 multiplexing when h2 is installed) shared by every agent
+                http_client = openai.DefaultHttpxClient(
+                    http2=_HTTP2,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+                )
+                _CLIENT = openai.OpenAI(api_key=OPENAI_API_KEY, http_client=http_client)
+                atexit.register(_CLIENT.close)
+    return _CLIENT
+
+
+def _get_bench():
+    """Return the shared BenchmarkLookup (benchmarks.json is loaded once per process)."""
+    global _BENCH
+    if _BENCH is None:
+        with _SINGLETON_LOCK:
+            if _BENCH is None:
+                _BENCH = BenchmarkLookup()
+    return _BENCH
+
+
+def _get_response_cache():
+    """Return the shared persistent LLM response cache, or None when bypassed or unavailable."""
+    global _RESPONSE_CACHE, _RESPONSE_CACHE_OPENED
+    if LLM_CACHE_BYPASS:
+        return None
+    if not _RESPONSE_CACHE_OPENED:
+        with _SINGLETON_LOCK:
+            if not _RESPONSE_CACHE_OPENED:
+                try:
+                    _RESPONSE_CACHE = ResponseCache(LLM_CACHE_DIR, LLM_CACHE_TTL_DAYS * 86400)
+                except Exception as e:
+                    print(f"LLM response cache unavailable ({e}); continuing without it")
+                _RESPONSE_CACHE_OPENED = True
+    return _RESPONSE_CACHE
+
+
+def _canon(item):
+    """
+    Canonical dedup key for a bullet: lowercase alphanumeric runs separated by single spaces.
+    Non-string items (the prompt does not forbid dicts/lists) are keyed on their repr so they stay hashable.
+    """
+    if not isinstance(item, str):
+        return repr(item)
+    return _NON_ALNUM_RE.sub(' ', item.lower()).strip()
+
+
 class ExtractionAgent:
     """Agent responsible for extracting structured information from investment update text."""
     
-    def __init__(self):
-        self.client = openai.OpenAI(api_key=OPENAI_API_KEY)
-        self.benchmark_lookup = BenchmarkLookup()
+    def __init__(self, use_cache=True):
+        """
+        Args:
+            use_cache: Reuse cached extractions and LLM verdicts for identical inputs
+        """
+        self.client = _get_client()
+        self.benchmark_lookup = _get_bench()
+        self.use_cache = use_cache
+        # Qualitative verdicts fetched ahead of time by _prefetch_qualitative, keyed like the response cache
+        self._qualitative_verdicts = {}
     
     def extract_information(self, text, investment_name=None):
         """
@@ -193,103 +604,260 @@ class ExtractionAgent:
         Returns:
             Tuple of (extracted_data_dict, metadata_dict, metrics_dict)
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        # Estimate tokens and check if chunking is needed
-        prompt_overhead = estimate_tokens(EXTRACTION_PROMPT, EXTRACTION_MODEL) + 100
-        max_tokens = 6000  # Leave room for response
+        if len((text or '').strip()) < MIN_EXTRACTION_CHARS:
+            # Nothing meaningful to extract (e.g. image-only PDF without OCR text): skip the API call
+            extracted_data, token_info = {}, {}
+        else:
+            text_key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+            extracted_data = _extraction_cache_get(text_key) if self.use_cache else None
+            
+            if extracted_data is not None:
+                # Same text already extracted in this process (re-upload / retry): no API call, no cost
+                token_info = {}
+            else:
+                # Estimate tokens and check if chunking is needed
+                prompt_overhead = _PROMPT_OVERHEAD
+                max_tokens = 6000  # Leave room for response
+                
+                text_tokens = estimate_tokens(text, EXTRACTION_MODEL)
+                
+                chunked = text_tokens + prompt_overhead > max_tokens
+                extracted_data, token_info = asyncio.run(self._extract_async(text, investment_name, chunked))
+                if self.use_cache:
+                    _extraction_cache_put(text_key, extracted_data)
         
-        text_tokens = estimate_tokens(text, EXTRACTION_MODEL)
+        latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000  # Convert to milliseconds
         
-        if text_tokens + prompt_overhead <= max_tokens:
-            # Single extraction
-            extracted_data, token_info = self._extract_single(text, investment_name)
-        else:
-            # Chunked extraction
-            extracted_data, token_info = self._extract_from_chunks(text, investment_name)
+        metadata = self._build_metadata(extracted_data, investment_name)
+        metrics = self._build_metrics(token_info, latency_ms)
         
-        latency_ms = (time.time() - start_time) * 1000  # Convert to milliseconds
+        return extracted_data, metadata, metrics
+    
+    def extract_information_batch(self, documents):
+        """
+        Extract structured information from several documents, packing short ones into shared completions.
         
-        # Calculate cost for extraction agent (gpt-5.2)
-        # Pricing: Input $1.75/1M tokens, Output $14.00/1M tokens
-        prompt_tokens = token_info.get('prompt_tokens', 0)
-        completion_tokens = token_info.get('completion_tokens', 0)
-        extraction_cost = (prompt_tokens / 1_000_000 * 1.75) + (completion_tokens / 1_000_000 * 14.00)
+        Documents are grouped greedily (in order) while their combined token estimate stays within the
+        single-extraction budget, so the system prompt is sent once per group rather than once per document.
+        Documents that do not fit a group, and groups that fail to parse, go through extract_information.
+        With use_cache, texts already extracted in this process are answered from the extraction cache
+        and only the misses are sent.
+        
+        Args:
+            documents: List of (text, investment_name) tuples; a None or near-empty text yields an
+                empty extraction
+            
+        Returns:
+            List of (extracted_data_dict, metadata_dict, metrics_dict) tuples, in input order
+        """
+        max_tokens = 6000  # Same input budget as a single extraction
+        results = [None] * len(documents)
+        batches = []
+        batch, batch_tokens = [], _BATCH_PROMPT_OVERHEAD
+        
+        text_keys = {}
+        for i, (text, investment_name) in enumerate(documents):
+            if len((text or '').strip()) < MIN_EXTRACTION_CHARS:
+                continue  # No (or too little) text: extract_information returns an empty extraction
+            if self.use_cache:
+                # Already extracted in this process: answer from the cache instead of re-sending the text
+                start_ns = time.perf_counter_ns()
+                text_keys[i] = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+                extracted_data = _extraction_cache_get(text_keys[i])
+                if extracted_data is not None:
+                    latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                    results[i] = (extracted_data, self._build_metadata(extracted_data, investment_name), self._build_metrics({}, latency_ms))
+                    continue
+            doc_tokens = estimate_tokens(text, EXTRACTION_MODEL) + 10  # + document delimiter
+            if _BATCH_PROMPT_OVERHEAD + doc_tokens > max_tokens:
+                continue  # Needs chunked extraction
+            if batch and (batch_tokens + doc_tokens > max_tokens or len(batch) >= EXTRACTION_BATCH_SIZE):
+                batches.append(batch)
+                batch, batch_tokens = [], _BATCH_PROMPT_OVERHEAD
+            batch.append(i)
+            batch_tokens += doc_tokens
+        if batch:
+            batches.append(batch)
+        
+        for batch in batches:
+            if len(batch) < 2:
+                continue
+            start_ns = time.perf_counter_ns()
+            try:
+                extractions, token_info = asyncio.run(self._extract_batch_async([documents[i][0] for i in batch]))
+            except Exception as e:
+                print(f"Batched extraction failed, falling back to per-document extraction: {e}")
+                continue
+            latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            
+            # Token usage is shared by the batch; split it evenly, spreading the remainder over the first
+            # documents so the integer shares add up to the request's usage
+            n = len(batch)
+            for position, (i, extracted_data) in enumerate(zip(batch, self._postprocess_batch(extractions))):
+                share = {key: value // n + (1 if position < value % n else 0) for key, value in token_info.items()}
+                investment_name = documents[i][1]
+                if self.use_cache:
+                    _extraction_cache_put(text_keys[i], extracted_data)
+                results[i] = (extracted_data, self._build_metadata(extracted_data, investment_name), self._build_metrics(share, latency_ms))
+        
+        for i, (text, investment_name) in enumerate(documents):
+            if results[i] is None:
+                results[i] = self.extract_information(text, investment_name)
+        
+        return results
+    
+    async def _extract_batch_async(self, texts):
+        """Extract several documents in one completion. Returns (list_of_extracted_data, token_info_dict)."""
+        user_message = _BATCH_USER_PREFIX.format(n=len(texts)) + '\n\n'.join(
+            f"===DOC {i}===\n{text}" for i, text in enumerate(texts)
+        )
+        
+        async with openai.AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=DefaultAioHttpClient()) as aclient:
+            response = await aclient.chat.completions.create(
+                model=EXTRACTION_MODEL,
+                messages=[_SYSTEM_MSG, {"role": "user", "content": user_message}],
+                temperature=OPENAI_TEMPERATURE,
+                response_format={"type": "json_schema", "json_schema": _BATCH_RESPONSE_SCHEMA},
+                prompt_cache_key=EXTRACTION_PROMPT_CACHE_KEY
+            )
+        
+        token_info = {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0, 'cached_tokens': 0}
+        if response.usage:
+            token_info = {
+                'prompt_tokens': response.usage.prompt_tokens or 0,
+                'completion_tokens': response.usage.completion_tokens or 0,
+                'total_tokens': response.usage.total_tokens or 0,
+                'cached_tokens': _cached_tokens(response.usage)
+            }
         
-        # Extract metadata
-        metadata = {
+        items = _json_loads(response.choices[0].message.content)['results']
+        by_doc = {item.get('doc'): item for item in items if isinstance(item, dict)}
+        if sorted(by_doc) != list(range(len(texts))):
+            raise ValueError(f"Expected results for documents 0..{len(texts) - 1}, got {sorted(by_doc, key=str)}")
+        
+        extractions = []
+        for i in range(len(texts)):
+            extracted_data = by_doc[i]
+            extracted_data.pop('doc', None)
+            extractions.append(extracted_data)
+        return extractions, token_info
+    
+    @staticmethod
+    def _build_metadata(extracted_data, investment_name=None):
+        """Metadata dict returned alongside extracted data."""
+        return {
             'fund_name': extracted_data.get('fund_name') or investment_name or 'Unknown',
             'asset_class': extracted_data.get('asset_class') or 'Unknown',
             'vintage': extracted_data.get('vintage') or None,
             'performance_summary': extracted_data.get('performance_summary') or 'Unknown'
         }
+    
+    @staticmethod
+    def _build_metrics(token_info, latency_ms):
+        """Extraction metrics dict from token usage and latency."""
+        # Calculate cost for extraction agent (gpt-5.2)
+        # Pricing: Input $1.75/1M tokens, Output $14.00/1M tokens
+        prompt_tokens = token_info.get('prompt_tokens', 0)
+        completion_tokens = token_info.get('completion_tokens', 0)
+        extraction_cost = (prompt_tokens / 1_000_000 * 1.75) + (completion_tokens / 1_000_000 * 14.00)
         
-        metrics = {
+        return {
             'extraction_tokens': token_info.get('total_tokens', 0),
             'extraction_prompt_tokens': prompt_tokens,
             'extraction_completion_tokens': completion_tokens,
+            'extraction_cached_tokens': token_info.get('cached_tokens', 0),
             'extraction_cost': extraction_cost,
             'extraction_latency_ms': latency_ms
         }
+    
+    def _postprocess(self, extracted_data):
+        """Add benchmark comparisons and the benchmark-driven performance summary to extracted data."""
+        # Store original performance summary before benchmark comparison
+        original_performance_summary = extracted_data.get('performance_summary')
         
-        return extracted_data, metadata, metrics
+        # Add benchmark comparisons if asset class and vintage are available
+        extracted_data = self._add_benchmark_comparisons(extracted_data)
+        
+        # Determine performance summary based on benchmark comparisons (falls back to original if benchmarks unavailable)
+        extracted_data['performance_summary'] = self._determine_performance_summary(extracted_data, original_performance_summary)
+        
+        return extracted_data
+    
+    def _postprocess_batch(self, extractions):
+        """
+        _postprocess for several extractions, batching the qualitative LLM assessments of those
+        that have no benchmark comparison into shared completions.
+        """
+        original_summaries = [extracted_data.get('performance_summary') for extracted_data in extractions]
+        extractions = [self._add_benchmark_comparisons(extracted_data) for extracted_data in extractions]
+        
+        self._prefetch_qualitative([
+            (extracted_data, original)
+            for extracted_data, original in zip(extractions, original_summaries)
+            if extracted_data.keys().isdisjoint(_BENCHMARK_KEYS)
+        ])
+        
+        for extracted_data, original in zip(extractions, original_summaries):
+            extracted_data['performance_summary'] = self._determine_performance_summary(extracted_data, original)
+        return extractions
+    
+    async def _extract_async(self, text, investment_name=None, chunked=False):
+        """
+        Run single or chunked extraction on an aiohttp-backed AsyncOpenAI client.
+        
+        The client is opened per call so its connection pool is bound to the event loop
+        created by asyncio.run(); all chunks of one document share that pool.
+        """
+        async with openai.AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=DefaultAioHttpClient()) as aclient:
+            if chunked:
+                return await self._extract_from_chunks(aclient, text, investment_name)
+            return await self._extract_single(aclient, text, investment_name)
     
-    def _extract_single(self, text, investment_name=None):
-        """Extract information from a single text chunk. Returns (extracted_data, token_info_dict)."""
+    async def _extract_single(self, aclient, text, investment_name=None, skip_postprocess=False):
+        """
+        Extract information from a single text chunk. Returns (extracted_data, token_info_dict).
+        
+        With skip_postprocess=True the raw extraction is returned without benchmark comparisons or
+        performance summary; the chunked path uses this and post-processes once after merging.
+        """
+        max_completion_tokens = min(
+            EXTRACTION_COMPLETION_CAP,
+            EXTRACTION_COMPLETION_BASE + estimate_tokens(text, EXTRACTION_MODEL) // 4
+        )
         try:
-            user_message = f"Extract information from the following investment update:\n\n{text}"
-            
-            response = self.client.chat.completions.create(
-                model=EXTRACTION_MODEL,
-                messages=[
-                    {"role": "system", "content": EXTRACTION_PROMPT},
-                    {"role": "user", "content": user_message}
-                ],
-                temperature=OPENAI_TEMPERATURE
-            )
-            
-            # Track token usage
+            # Track token usage (summed over both attempts when the first reply is cut off)
             prompt_tokens = 0
             completion_tokens = 0
             total_tokens = 0
-            if hasattr(response, 'usage') and response.usage:
-                prompt_tokens = response.usage.prompt_tokens or 0
-                completion_tokens = response.usage.completion_tokens or 0
-                total_tokens = response.usage.total_tokens or 0
-            
-            extracted_text = response.choices[0].message.content.strip()
+            cached_tokens = 0
+            while True:
+                extracted_text, usage, finish_reason = await self._stream_extraction(aclient, text, max_completion_tokens)
+                if usage:
+                    prompt_tokens += usage.prompt_tokens or 0
+                    completion_tokens += usage.completion_tokens or 0
+                    total_tokens += usage.total_tokens or 0
+                    cached_tokens += _cached_tokens(usage)
+                if finish_reason != 'length' or max_completion_tokens is None:
+                    break
+                # A metric-dense document outran the estimated budget: the JSON is truncated, so ask again uncapped
+                print(f"Extraction reply hit max_completion_tokens={max_completion_tokens}; retrying without a cap")
+                max_completion_tokens = None
             
-            # Parse JSON response
-            try:
-                extracted_data = json.loads(extracted_text)
-            except json.JSONDecodeError:
-                # Try to extract JSON from markdown code blocks
-                if '```json' in extracted_text:
-                    json_start = extracted_text.find('```json') + 7
-                    json_end = extracted_text.find('```', json_start)
-                    extracted_text = extracted_text[json_start:json_end].strip()
-                    extracted_data = json.loads(extracted_text)
-                elif '```' in extracted_text:
-                    json_start = extracted_text.find('```') + 3
-                    json_end = extracted_text.find('```', json_start)
-                    extracted_text = extracted_text[json_start:json_end].strip()
-                    extracted_data = json.loads(extracted_text)
-                else:
-                    raise
-            
-            # Store original performance summary before benchmark comparison
-            original_performance_summary = extracted_data.get('performance_summary')
-            
-            # Add benchmark comparisons if asset class and vintage are available
-            extracted_data = self._add_benchmark_comparisons(extracted_data)
-            
-            # Determine performance summary based on benchmark comparisons (falls back to original if benchmarks unavailable)
-            extracted_data['performance_summary'] = self._determine_performance_summary(extracted_data, original_performance_summary)
+            # Parse JSON response (json_object mode returns bare JSON; the regex also tolerates code fences)
+            match = _JSON_RE.search(extracted_text)
+            if not match:
+                raise ValueError(f"No JSON object found in extraction response: {extracted_text[:200]!r}")
+            extracted_data = _json_loads(match.group(1) or match.group(2))
+            if not skip_postprocess:
+                extracted_data = self._postprocess(extracted_data)
             
             token_info = {
                 'prompt_tokens': prompt_tokens,
                 'completion_tokens': completion_tokens,
-                'total_tokens': total_tokens
+                'total_tokens': total_tokens,
+                'cached_tokens': cached_tokens
             }
             
             return extracted_data, token_info
@@ -297,25 +865,73 @@ class ExtractionAgent:
             print(f"Error extracting information with OpenAI: {e}")
             raise
     
-    def _extract_from_chunks(self, text, investment_name=None):
-        """Extract information from multiple text chunks and merge results. Returns (extracted_data, token_info_dict)."""
-        chunks = chunk_text(text, max_tokens=6000, model=EXTRACTION_MODEL, overlap=200)
+    async def _stream_extraction(self, aclient, text, max_completion_tokens=None):
+        """
+        Stream one extraction completion. Returns (response_text, usage, finish_reason).
+        
+        max_completion_tokens=None leaves the completion uncapped.
+        """
+        kwargs = {'max_completion_tokens': max_completion_tokens} if max_completion_tokens is not None else {}
+        response = await aclient.chat.completions.create(
+            model=EXTRACTION_MODEL,
+            messages=[_SYSTEM_MSG, {"role": "user", "content": _USER_PREFIX + text}],
+            temperature=OPENAI_TEMPERATURE,
+            response_format={"type": "json_object"},
+            prompt_cache_key=EXTRACTION_PROMPT_CACHE_KEY,
+            stream=True,
+            stream_options={"include_usage": True},
+            **kwargs
+        )
+        
+        # Accumulate streamed content; usage arrives on the final (choice-less) chunk
+        parts = []
+        usage = None
+        finish_reason = None
+        async for chunk in response:
+            if chunk.choices:
+                choice = chunk.choices[0]
+                if choice.delta.content:
+                    parts.append(choice.delta.content)
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+            if chunk.usage:
+                usage = chunk.usage
+        return ''.join(parts).strip(), usage, finish_reason
+    
+    async def _extract_from_chunks(self, aclient, text, investment_name=None):
+        """Extract information from multiple text chunks concurrently and merge results. Returns (extracted_data, token_info_dict)."""
+        # Split on section boundaries without overlap: no tokens are paid for twice and fewer
+        # duplicate bullets reach _merge_extractions
+        chunks = chunk_text_by_sections(text, max_tokens=6000, model=EXTRACTION_MODEL)
         extractions = []
         total_prompt_tokens = 0
         total_completion_tokens = 0
         total_tokens = 0
+        total_cached_tokens = 0
         
-        for i, chunk in enumerate(chunks):
-            print(f"Processing chunk {i+1}/{len(chunks)}...")
-            try:
-                extracted, token_info = self._extract_single(chunk, investment_name)
-                extractions.append(extracted)
-                total_prompt_tokens += token_info.get('prompt_tokens', 0)
-                total_completion_tokens += token_info.get('completion_tokens', 0)
-                total_tokens += token_info.get('total_tokens', 0)
-            except Exception as e:
-                print(f"Error extracting from chunk {i+1}: {e}")
+        # Created per call: asyncio primitives are bound to the event loop that first waits on them
+        semaphore = asyncio.Semaphore(EXTRACTION_CONCURRENCY)
+        
+        async def extract_chunk(i, chunk):
+            async with semaphore:
+                print(f"Processing chunk {i+1}/{len(chunks)}...")
+                return await self._extract_single(aclient, chunk, investment_name, skip_postprocess=True)
+        
+        results = await asyncio.gather(
+            *(extract_chunk(i, chunk) for i, chunk in enumerate(chunks)),
+            return_exceptions=True
+        )
+        
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                print(f"Error extracting from chunk {i+1}: {result}")
                 continue
+            extracted, token_info = result
+            extractions.append(extracted)
+            total_prompt_tokens += token_info.get('prompt_tokens', 0)
+            total_completion_tokens += token_info.get('completion_tokens', 0)
+            total_tokens += token_info.get('total_tokens', 0)
+            total_cached_tokens += token_info.get('cached_tokens', 0)
         
         if not extractions:
             raise Exception("Failed to extract information from any chunk")
@@ -325,7 +941,8 @@ class ExtractionAgent:
         token_info = {
             'prompt_tokens': total_prompt_tokens,
             'completion_tokens': total_completion_tokens,
-            'total_tokens': total_tokens
+            'total_tokens': total_tokens,
+            'cached_tokens': total_cached_tokens
         }
         return merged_data, token_info
     
@@ -337,18 +954,16 @@ class ExtractionAgent:
         # Start with the first extraction
         merged = extractions[0].copy()
         
-        # Merge arrays (deduplicate and combine)
-        for key in ['investment_performance', 'key_takeaways', 'business_updates']:
-            if key not in merged:
-                merged[key] = []
-            
-            seen = set(merged[key])
-            for extraction in extractions[1:]:
-                if key in extraction:
-                    for item in extraction[key]:
-                        if item not in seen:
-                            merged[key].append(item)
-                            seen.add(item)
+        # Merge arrays in a single order-preserving pass over the extractions, deduplicating on the
+        # canonical form so bullets differing only in case/punctuation/whitespace (chunk overlap) collapse
+        seen = {key: {} for key in ARRAY_KEYS}
+        for extraction in extractions:
+            for key in ARRAY_KEYS:
+                seen_key = seen[key]
+                for item in extraction.get(key) or ():
+                    seen_key.setdefault(_canon(item), item)
+        for key in ARRAY_KEYS:
+            merged[key] = list(seen[key].values())[:MAX_MERGED_ITEMS]
         
         # For scalar fields, prefer non-null values
         # For numeric metrics (IRR, MOIC, DPI), prefer higher values as they're more likely to be fund-level
@@ -371,16 +986,8 @@ class ExtractionAgent:
                         # If types don't match, keep current
                         pass
         
-        # Store original performance summary before benchmark comparison
-        original_performance_summary = merged.get('performance_summary')
-        
-        # Add benchmark comparisons after merging
-        merged = self._add_benchmark_comparisons(merged)
-        
-        # Determine performance summary based on benchmark comparisons (falls back to original if benchmarks unavailable)
-        merged['performance_summary'] = self._determine_performance_summary(merged, original_performance_summary)
-        
-        return merged
+        # Add benchmark comparisons and performance summary once, on the merged result
+        return self._postprocess(merged)
     
     def _add_benchmark_comparisons(self, extracted_data):
         """Add benchmark comparison data to extracted_data for inline formatting."""
@@ -391,37 +998,21 @@ class ExtractionAgent:
         if not self.benchmark_lookup or not asset_class or not vintage:
             return extracted_data
         
-        # Compare IRR
-        net_irr = extracted_data.get('net_irr')
-        if net_irr is not None:
-            irr_comparison = self.benchmark_lookup.compare_irr(asset_class, vintage, net_irr)
-            if irr_comparison:
-                extracted_data['benchmark_irr_comparison'] = {
-                    'median': irr_comparison['median'],
-                    'category': irr_comparison['category'],
-                    'percentile': irr_comparison['percentile']
-                }
-        
-        # Compare MOIC
-        net_moic = extracted_data.get('net_moic')
-        if net_moic is not None:
-            moic_comparison = self.benchmark_lookup.compare_moic(asset_class, vintage, net_moic)
-            if moic_comparison:
-                extracted_data['benchmark_moic_comparison'] = {
-                    'median': moic_comparison['median'],
-                    'category': moic_comparison['category'],
-                    'percentile': moic_comparison['percentile']
-                }
-        
-        # Compare DPI
-        net_dpi = extracted_data.get('net_dpi')
-        if net_dpi is not None:
-            dpi_comparison = self.benchmark_lookup.compare_dpi(asset_class, vintage, net_dpi)
-            if dpi_comparison:
-                extracted_data['benchmark_dpi_comparison'] = {
-                    'median': dpi_comparison['median'],
-                    'category': dpi_comparison['category'],
-                    'percentile': dpi_comparison['percentile']
+        # One benchmark row lookup for all three metrics
+        comparisons = self.benchmark_lookup.compare_all(
+            asset_class, vintage,
+            extracted_data.get('net_irr'),
+            extracted_data.get('net_moic'),
+            extracted_data.get('net_dpi')
+        )
+        
+        for metric in ('irr', 'moic', 'dpi'):
+            comparison = comparisons[metric]
+            if comparison:
+                extracted_data[f'benchmark_{metric}_comparison'] = {
+                    'median': comparison['median'],
+                    'category': comparison['category'],
+                    'percentile': comparison['percentile']
                 }
         
         return extracted_data
@@ -438,29 +1029,19 @@ class ExtractionAgent:
         Returns:
             Performance summary: 'Outperforming', 'Underperforming', or 'As Expected'
         """
-        asset_class = extracted_data.get('asset_class')
-        vintage = extracted_data.get('vintage')
-        
-        # Collect all performance percentiles from benchmark comparisons
-        # Use the comparison data already stored in extracted_data if available
+        # Collect all performance percentiles from the benchmark comparisons stored in extracted_data
         percentiles = []
-        
-        if 'benchmark_irr_comparison' in extracted_data:
-            percentiles.append(extracted_data['benchmark_irr_comparison']['percentile'])
-        
-        if 'benchmark_moic_comparison' in extracted_data:
-            percentiles.append(extracted_data['benchmark_moic_comparison']['percentile'])
-        
-        if 'benchmark_dpi_comparison' in extracted_data:
-            percentiles.append(extracted_data['benchmark_dpi_comparison']['percentile'])
+        for key in _BENCHMARK_KEYS:
+            comparison = extracted_data.get(key)
+            if comparison:
+                percentiles.append(comparison['percentile'])
         
         # If benchmark comparisons are available, use them
         if percentiles:
-            top_performances = ['top_decile', 'top_quartile']
-            bottom_performances = ['bottom_decile', 'bottom_quartile']
-            
-            top_count = sum(1 for p in percentiles if p in top_performances)
-            bottom_count = sum(1 for p in percentiles if p in bottom_performances)
+            top_count = bottom_count = 0
+            for p in percentiles:
+                top_count += p in _TOP_PERCENTILES
+                bottom_count += p in _BOTTOM_PERCENTILES
             
             if top_count > bottom_count and top_count >= len(percentiles) / 2:
                 return 'Outperforming'
@@ -472,6 +1053,48 @@ class ExtractionAgent:
         # If benchmarks unavailable (no vintage or asset_class), use combined quantitative + qualitative assessment
         return self._assess_performance_without_benchmarks(extracted_data, original_performance_summary)
     
+    def score_batch(self, extractions):
+        """
+        Determine performance summaries for many already-extracted funds in one vectorized pass.
+        
+        Mirrors _determine_performance_summary (benchmark percentiles first, then the _THRESHOLDS
+        quantitative scores, then the document's own summary) but skips the per-fund qualitative
+        LLM assessment, so it is suitable for scoring large portfolios.
+        
+        Args:
+            extractions: List of extracted data dicts (with benchmark_*_comparison keys where available)
+            
+        Returns:
+            List of performance summaries: 'Outperforming', 'Underperforming', or 'As Expected'
+        """
+        if not extractions:
+            return []
+        
+        codes = np.array([
+            [scoring_kernels.PERCENTILE_CODES.get((data.get(key) or {}).get('percentile'), -1) for key in _BENCHMARK_KEYS]
+            for data in extractions
+        ], dtype=np.int8)
+        values = np.array([
+            [_as_float(data.get(key)) for key, _, _ in _THRESHOLDS]
+            for data in extractions
+        ], dtype=np.float64)
+        lows = np.array([low for _, low, _ in _THRESHOLDS], dtype=np.float64)
+        highs = np.array([high for _, _, high in _THRESHOLDS], dtype=np.float64)
+        
+        from_percentiles = scoring_kernels.score_from_percentiles(codes)
+        from_metrics = scoring_kernels.score_quant(values, lows, highs)
+        
+        summaries = []
+        for data, by_percentile, by_metrics in zip(extractions, from_percentiles, from_metrics):
+            label = by_percentile if by_percentile != scoring_kernels.NO_SCORE else by_metrics
+            if label != scoring_kernels.NO_SCORE:
+                summaries.append(scoring_kernels.SUMMARY_LABELS[label])
+            elif data.get('performance_summary') in scoring_kernels.SUMMARY_LABELS:
+                summaries.append(data['performance_summary'])
+            else:
+                summaries.append('As Expected')
+        return summaries
+    
     def _assess_performance_without_benchmarks(self, extracted_data, original_performance_summary=None):
         """
         Assess performance using both quantitative metrics and qualitative information from the document.
@@ -483,41 +1106,13 @@ class ExtractionAgent:
         Returns:
             Performance summary: 'Outperforming', 'Underperforming', or 'As Expected'
         """
-        # Quantitative assessment based on metrics
-        net_irr = extracted_data.get('net_irr')
-        net_moic = extracted_data.get('net_moic')
-        net_dpi = extracted_data.get('net_dpi')
-        
+        # Quantitative assessment based on metrics (see _THRESHOLDS)
         quantitative_scores = []
-        
-        # Reasonable thresholds for private investments:
-        # IRR: <5% = Underperforming, 5-12% = As Expected, >12% = Outperforming
-        # MOIC: <1.2x = Underperforming, 1.2-2.0x = As Expected, >2.0x = Outperforming
-        # DPI: <0.5x = Underperforming, 0.5-1.0x = As Expected, >1.0x = Outperforming
-        
-        if net_irr is not None:
-            if net_irr < 5:
-                quantitative_scores.append('underperforming')
-            elif net_irr > 12:
-                quantitative_scores.append('outperforming')
-            else:
-                quantitative_scores.append('as_expected')
-        
-        if net_moic is not None:
-            if net_moic < 1.2:
-                quantitative_scores.append('underperforming')
-            elif net_moic > 2.0:
-                quantitative_scores.append('outperforming')
-            else:
-                quantitative_scores.append('as_expected')
-        
-        if net_dpi is not None:
-            if net_dpi < 0.5:
-                quantitative_scores.append('underperforming')
-            elif net_dpi > 1.0:
-                quantitative_scores.append('outperforming')
-            else:
-                quantitative_scores.append('as_expected')
+        for key, low, high in _THRESHOLDS:
+            value = extracted_data.get(key)
+            if value is None:
+                continue
+            quantitative_scores.append('underperforming' if value < low else 'outperforming' if value > high else 'as_expected')
         
         # Qualitative assessment from document content
         qualitative_score = self._assess_qualitative_performance(extracted_data, original_performance_summary)
@@ -529,8 +1124,10 @@ class ExtractionAgent:
         
         # If we have any scores, determine based on majority
         if all_scores:
-            underperforming_count = sum(1 for s in all_scores if s == 'underperforming')
-            outperforming_count = sum(1 for s in all_scores if s == 'outperforming')
+            # 'as_expected' scores count toward the total but only under- vs outperforming decides
+            counts = Counter(all_scores)
+            underperforming_count = counts['underperforming']
+            outperforming_count = counts['outperforming']
             
             if underperforming_count > outperforming_count:
                 return 'Underperforming'
@@ -558,90 +1155,117 @@ class ExtractionAgent:
             'underperforming', 'outperforming', 'as_expected', or None
         """
         # Check original performance summary first
-        if original_performance_summary:
-            original_lower = original_performance_summary.lower()
-            if 'outperforming' in original_lower or 'strong' in original_lower or 'excellent' in original_lower:
-                return 'outperforming'
-            elif 'underperforming' in original_lower or 'weak' in original_lower or 'challenging' in original_lower or 'disappointing' in original_lower:
-                return 'underperforming'
-            elif 'as expected' in original_lower or 'meeting' in original_lower or 'on track' in original_lower:
-                return 'as_expected'
-        
-        # Combine all text sections for qualitative analysis
-        all_text = []
-        
-        for section in ['investment_performance', 'key_takeaways', 'business_updates']:
-            items = extracted_data.get(section, [])
-            if isinstance(items, list):
-                all_text.extend(items)
-            elif isinstance(items, str):
-                all_text.append(items)
-        
-        if not all_text:
+        from_summary = _qualitative_from_summary(original_performance_summary)
+        if from_summary:
+            return from_summary
+        
+        combined_text = _qualitative_text(extracted_data)
+        if not combined_text:
             return None
         
-        combined_text = '\n'.join(all_text)
+        # Cheap keyword scan first; only ambiguous content goes to the LLM
+        from_keywords = _confident_keyword_verdict(combined_text)
+        if from_keywords:
+            return from_keywords
+        
+        # Verdict already fetched by a batched assessment (see _prefetch_qualitative)
+        key = cache_key('qualitative', QUALITATIVE_PROMPT_VERSION, EXTRACTION_MODEL, combined_text)
+        prefetched = self._qualitative_verdicts.pop(key, None)
+        if prefetched is not None:
+            return prefetched
+        
+        # Identical content was already assessed (reruns, evals on fixed fixtures): reuse the verdict
+        response_cache = _get_response_cache() if self.use_cache else None
+        if response_cache is not None:
+            cached = response_cache.get(key)
+            if cached is not None:
+                return cached
         
         # Use LLM to assess qualitative performance
         try:
-            qualitative_prompt = """Based on the following investment update content, assess the overall performance sentiment. Consider:
-- Language used (positive, negative, neutral)
-- Management commentary tone
-- Market conditions described
-- Portfolio performance descriptions
-- Strategic outlook
-
-Return ONLY one word: "Outperforming", "Underperforming", or "AsExpected"
-
-Content:
-{content}"""
-
             response = self.client.chat.completions.create(
                 model=EXTRACTION_MODEL,
                 messages=[
-                    {"role": "system", "content": "You are an investment analyst assessing fund performance based on qualitative indicators in investor updates."},
-                    {"role": "user", "content": qualitative_prompt.format(content=combined_text)}
+                    _QUALITATIVE_SYSTEM_MSG,
+                    {"role": "user", "content": _QUALITATIVE_PROMPT.format(content=combined_text)}
                 ],
-                temperature=0.3,
-                max_tokens=10
+                temperature=0,
+                max_completion_tokens=16,  # {"v":"Underperforming"} is ~7 tokens
+                response_format={"type": "json_schema", "json_schema": _VERDICT_SCHEMA}
             )
             
-            result = response.choices[0].message.content.strip().lower()
-            
-            if 'outperforming' in result:
-                return 'outperforming'
-            elif 'underperforming' in result:
-                return 'underperforming'
-            elif 'asexpected' in result or 'as expected' in result:
-                return 'as_expected'
+            assessment = _parse_verdict(_json_loads(response.choices[0].message.content)['v'])
+            if assessment is not None and response_cache is not None:
+                response_cache.set(key, assessment)
+            return assessment
             
         except Exception as e:
             print(f"Error in qualitative assessment: {e}")
             # Fallback to keyword-based analysis
             return self._assess_qualitative_keywords(combined_text)
+    
+    def _prefetch_qualitative(self, pending):
+        """
+        Fetch LLM qualitative verdicts for several documents with one completion per group.
         
-        return None
+        Only documents that _assess_qualitative_performance would send to the LLM are included
+        (no decisive original summary or keyword margin, not already cached). Verdicts are stashed for
+        _assess_qualitative_performance to pick up; on any failure the documents simply take
+        the per-document path.
+        
+        Args:
+            pending: List of (extracted_data, original_performance_summary) tuples
+        """
+        response_cache = _get_response_cache() if self.use_cache else None
+        texts = {}
+        for extracted_data, original_performance_summary in pending:
+            if _qualitative_from_summary(original_performance_summary):
+                continue
+            combined_text = _qualitative_text(extracted_data)
+            if not combined_text or _confident_keyword_verdict(combined_text):
+                continue
+            key = cache_key('qualitative', QUALITATIVE_PROMPT_VERSION, EXTRACTION_MODEL, combined_text)
+            if key in self._qualitative_verdicts or (response_cache is not None and response_cache.get(key) is not None):
+                continue
+            texts[key] = combined_text
+        
+        keys = list(texts)
+        for start in range(0, len(keys), QUALITATIVE_BATCH_SIZE):
+            group = keys[start:start + QUALITATIVE_BATCH_SIZE]
+            if len(group) < 2:
+                break  # A lone document gains nothing from the batch prompt
+            content = '\n\n'.join(f"===DOC {i}===\n{texts[key]}" for i, key in enumerate(group))
+            try:
+                response = self.client.chat.completions.create(
+                    model=EXTRACTION_MODEL,
+                    messages=[
+                        _QUALITATIVE_SYSTEM_MSG,
+                        {"role": "user", "content": _QUALITATIVE_BATCH_PROMPT.format(n=len(group), content=content)}
+                    ],
+                    temperature=0,
+                    max_completion_tokens=20 * len(group) + 20,
+                    response_format={"type": "json_schema", "json_schema": _VERDICT_BATCH_SCHEMA}
+                )
+                verdicts = _json_loads(response.choices[0].message.content)['verdicts']
+            except Exception as e:
+                print(f"Batched qualitative assessment failed, falling back to per-document calls: {e}")
+                continue
+            
+            for item in verdicts:
+                doc_id = item.get('id') if isinstance(item, dict) else None
+                if not isinstance(doc_id, int) or not 0 <= doc_id < len(group):
+                    continue
+                assessment = _parse_verdict(item.get('verdict') or '')
+                if assessment is None:
+                    continue
+                key = group[doc_id]
+                self._qualitative_verdicts[key] = assessment
+                if response_cache is not None:
+                    response_cache.set(key, assessment)
     
     def _assess_qualitative_keywords(self, text):
         """Fallback keyword-based qualitative assessment."""
-        text_lower = text.lower()
-        
-        # Positive performance indicators
-        positive_indicators = [
-            'strong performance', 'outperforming', 'exceeded', 'above expectations',
-            'record', 'best', 'top', 'excellent', 'outstanding', 'significant gains',
-            'successful', 'bullish', 'improving', 'positive momentum', 'strong returns'
-        ]
-        
-        # Negative performance indicators
-        negative_indicators = [
-            'underperforming', 'below expectations', 'challenging', 'disappointing',
-            'weak', 'declining', 'concerns', 'headwinds', 'difficult', 'struggling',
-            'losses', 'negative', 'bearish', 'deteriorating', 'under pressure'
-        ]
-        
-        positive_count = sum(1 for indicator in positive_indicators if indicator in text_lower)
-        negative_count = sum(1 for indicator in negative_indicators if indicator in text_lower)
+        positive_count, negative_count = _indicator_counts(text)
         
         # If clear qualitative signals, use them
         if positive_count > negative_count and positive_count >= 2:
@@ -654,11 +1278,41 @@ Content:
         return None
 
 
+# Section headers whose bullets _enforce_word_limits caps at 200 words
+_WORD_LIMIT_SECTION_HEADERS = ('Investment Performance:', 'Key Takeaways:', 'Business Updates/Market Commentary:')
+
+# Streaming word limit: section headers of the formatted update (FORMATTING_PROMPT's bolded
+# headers plus the legacy ones above) and the final sections, after which output can stop
+FORMATTING_SECTION_WORD_LIMIT = 200
+_FORMAT_SECTION_HEADERS = frozenset((
+    'Quantitative Performance:', 'Key Takeaways and Business Updates:', 'Market Commentary:'
+) + _WORD_LIMIT_SECTION_HEADERS)
+_FINAL_FORMAT_SECTIONS = frozenset(('Market Commentary:', 'Business Updates/Market Commentary:'))
+
+# Backstop on formatter output; generous because gpt-5-mini's reasoning tokens count toward it
+FORMATTING_MAX_COMPLETION_TOKENS = 6000
+
+
+def _format_section_header(line):
+    """Normalized section header for a formatted-update line (bold markers stripped), or None."""
+    if line.startswith(' '):
+        return None
+    header = line.strip().strip('*').strip()
+    return header if header in _FORMAT_SECTION_HEADERS else None
+
+
 class FormattingAgent:
     """Agent responsible for formatting extracted information into the standardized update format."""
     
-    def __init__(self):
-        self.client = openai.OpenAI(api_key=OPENAI_API_KEY)
+    def __init__(self, use_cache=True):
+        """
+        Args:
+            use_cache: Reuse stored formatted updates for identical extracted data
+        """
+        self.client = _get_client()
+        self.use_cache = use_cache
+        # Static, byte-identical system prefix on every call so provider prompt caching can hit
+        self._system_messages = [_FORMATTING_SYSTEM_MSG]
     
     def format_update(self, extracted_data):
         """
@@ -671,37 +1325,63 @@ class FormattingAgent:
         Returns:
             Tuple of (formatted_update_text, metrics_dict)
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
-            # Convert JSON to string for the LLM
-            json_str = json.dumps(extracted_data, indent=2)
+            # Convert JSON to string for the LLM (sorted keys: identical data always yields identical text)
+            json_str = _json_dumps_pretty(extracted_data)
             
             # Add note about benchmark comparisons if they exist
             benchmark_note = ""
-            if any(key in extracted_data for key in ['benchmark_irr_comparison', 'benchmark_moic_comparison', 'benchmark_dpi_comparison']):
+            if not extracted_data.keys().isdisjoint(_BENCHMARK_KEYS):
                 benchmark_note = "\n\nNote: Benchmark comparison data is included in the JSON. Format IRR/MOIC/DPI lines with inline benchmark comparisons like: 'Net IRR: 15.5% (vs benchmark 13.1% - Above Median)'"
             
             user_message = f"Format the following extracted investment information (JSON) into the standardized format:\n\n{json_str}\n\nRemember: Each section must not exceed 200 words. Prioritize performance metrics and new developments over generic overview information.{benchmark_note}"
             
+            # Same extracted data formatted before: reuse the stored update and skip the API call
+            response_cache = _get_response_cache() if self.use_cache else None
+            key = cache_key('formatting', FORMATTING_MODEL, FORMATTING_PROMPT, user_message)
+            if response_cache is not None:
+                cached_text = response_cache.get(key)
+                if cached_text is not None:
+                    return cached_text, {
+                        'formatting_tokens': 0,
+                        'formatting_prompt_tokens': 0,
+                        'formatting_completion_tokens': 0,
+                        'formatting_cached_tokens': 0,
+                        'formatting_cost': 0.0,
+                        'formatting_latency_ms': (time.perf_counter_ns() - start_ns) / 1_000_000,
+                        'formatting_cache_hit': True
+                    }
+            
+            messages = self._system_messages + [{"role": "user", "content": user_message}]
             response = self.client.chat.completions.create(
                 model=FORMATTING_MODEL,
-                messages=[
-                    {"role": "system", "content": FORMATTING_PROMPT},
-                    {"role": "user", "content": user_message}
-                ]
+                messages=messages,
+                prompt_cache_key=FORMATTING_PROMPT_CACHE_KEY,
+                max_completion_tokens=FORMATTING_MAX_COMPLETION_TOKENS,
+                stream=True,
+                stream_options={"include_usage": True}
             )
+            formatted_text, usage = self._read_formatting_stream(response)
             
             # Track token usage
             prompt_tokens = 0
             completion_tokens = 0
             total_tokens = 0
-            if hasattr(response, 'usage') and response.usage:
-                prompt_tokens = response.usage.prompt_tokens or 0
-                completion_tokens = response.usage.completion_tokens or 0
-                total_tokens = response.usage.total_tokens or 0
+            cached_tokens = 0
+            if usage:
+                prompt_tokens = usage.prompt_tokens or 0
+                completion_tokens = usage.completion_tokens or 0
+                total_tokens = usage.total_tokens or 0
+                cached_tokens = _cached_tokens(usage)
+            else:
+                # Stream stopped early, so the final usage chunk never arrived: estimate from the text
+                prompt_tokens = sum(estimate_tokens(message['content'], FORMATTING_MODEL) for message in messages)
+                completion_tokens = estimate_tokens(formatted_text, FORMATTING_MODEL)
+                total_tokens = prompt_tokens + completion_tokens
             
-            latency_ms = (time.time() - start_time) * 1000  # Convert to milliseconds
+            latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000  # Convert to milliseconds
             
             # Calculate cost for formatting agent (gpt-5-mini)
             # Pricing: Input $0.25/1M tokens, Output $2.00/1M tokens
@@ -711,20 +1391,66 @@ class FormattingAgent:
                 'formatting_tokens': total_tokens,
                 'formatting_prompt_tokens': prompt_tokens,
                 'formatting_completion_tokens': completion_tokens,
+                'formatting_cached_tokens': cached_tokens,
                 'formatting_cost': formatting_cost,
-                'formatting_latency_ms': latency_ms
+                'formatting_latency_ms': latency_ms,
+                'formatting_cache_hit': False
             }
             
-            formatted_text = response.choices[0].message.content.strip()
-            
             # Verify and enforce 200-word limit per section
             formatted_text = self._enforce_word_limits(formatted_text)
             
+            if response_cache is not None:
+                response_cache.set(key, formatted_text)
+            
             return formatted_text, metrics
         except Exception as e:
             print(f"Error formatting update with OpenAI: {e}")
             raise
     
+    def _read_formatting_stream(self, stream):
+        """
+        Consume a streamed formatting completion. Returns (text, usage); usage is None if stopped early.
+        
+        Complete lines are tracked per section; once the final section would exceed
+        FORMATTING_SECTION_WORD_LIMIT words nothing more can be kept, so the stream is closed
+        (ending generation and billing) and the final section is trimmed with _limit_section_words,
+        the same way _enforce_word_limits trims the non-streamed output (partial last bullet included).
+        """
+        parts = []
+        kept_lines = []
+        pending = ''
+        section = None
+        section_start = 0
+        section_words = 0
+        usage = None
+        
+        for chunk in stream:
+            if chunk.usage:
+                usage = chunk.usage
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            parts.append(delta)
+            
+            *lines, pending = (pending + delta).split('\n')
+            for line in lines:
+                header = _format_section_header(line)
+                if header:
+                    section, section_start, section_words = header, len(kept_lines) + 1, 0
+                elif section:
+                    line_words = len(line.split())
+                    if section in _FINAL_FORMAT_SECTIONS and section_words + line_words > FORMATTING_SECTION_WORD_LIMIT:
+                        stream.close()
+                        body = self._limit_section_words(kept_lines[section_start:] + [line], FORMATTING_SECTION_WORD_LIMIT)
+                        return '\n'.join(kept_lines[:section_start] + body).strip(), None
+                    section_words += line_words
+                kept_lines.append(line)
+        
+        return ''.join(parts).strip(), usage
+    
     def _enforce_word_limits(self, text):
         """
         Ensure each section does not exceed 200 words.
@@ -737,14 +1463,9 @@ class FormattingAgent:
         in_bullet_section = False
         
         for line in lines:
-            # Check if this is a section header
-            is_section_header = (
-                line.strip().endswith(':') and 
-                not line.startswith('  ') and
-                (line.startswith('Investment Performance:') or 
-                 line.startswith('Key Takeaways:') or 
-                 line.startswith('Business Updates/Market Commentary:'))
-            )
+            stripped = line.strip()
+            # Check if this is a section header (startswith with a tuple tests all headers in one call)
+            is_section_header = stripped.endswith(':') and line.startswith(_WORD_LIMIT_SECTION_HEADERS)
             
             if is_section_header:
                 # Process previous section if exists
@@ -754,12 +1475,12 @@ class FormattingAgent:
                 # Start new section
                 result_lines.append(line)
                 current_section = []
-                current_section_name = line.strip()
+                current_section_name = stripped
                 in_bullet_section = True
             elif in_bullet_section:
                 if line.startswith('  • '):
                     current_section.append(line)
-                elif line.strip() == '':
+                elif not stripped:
                     # End of bullet section
                     if current_section:
                         result_lines.extend(self._limit_section_words(current_section, 200))
@@ -784,27 +1505,24 @@ class FormattingAgent:
         Limit a section's bullet points to not exceed max_words.
         Prioritizes earlier bullets (assumed to be more important).
         """
-        total_words = sum(len(line.split()) for line in bullet_lines)
+        # Count words per bullet once; bullets are kept in their original order
+        word_counts = [len(line.split()) for line in bullet_lines]
         
-        if total_words <= max_words:
+        if sum(word_counts) <= max_words:
             return bullet_lines
         
-        # Count words per bullet and prioritize
-        bullet_word_counts = [(i, len(line.split())) for i, line in enumerate(bullet_lines)]
-        bullet_word_counts.sort(key=lambda x: x[0])  # Keep original order
-        
         result_lines = []
         current_words = 0
         
-        for i, word_count in bullet_word_counts:
+        for line, word_count in zip(bullet_lines, word_counts):
             if current_words + word_count <= max_words:
-                result_lines.append(bullet_lines[i])
+                result_lines.append(line)
                 current_words += word_count
             else:
                 # Try to fit partial bullet if possible
                 remaining_words = max_words - current_words
                 if remaining_words > 10:  # Only truncate if meaningful space remains
-                    words = bullet_lines[i].split()
+                    words = line.split()
                     truncated = ' '.join(words[:remaining_words]) + '...'
                     result_lines.append(truncated)
                 break
@@ -815,13 +1533,21 @@ class FormattingAgent:
 class AnalysisAgent:
     """Orchestrates the extraction and formatting agents to analyze investment updates."""
     
-    def __init__(self):
-        self.extraction_agent = ExtractionAgent()
-        self.formatting_agent = FormattingAgent()
+    def __init__(self, use_cache=True):
+        """
+        Args:
+            use_cache: Reuse stored results for identical inputs (text, name, models, prompts); False
+                re-runs every model call
+        """
+        self.extraction_agent = ExtractionAgent(use_cache=use_cache)
+        self.formatting_agent = FormattingAgent(use_cache=use_cache)
+        self.use_cache = use_cache
     
     def analyze_update(self, text, investment_name=None):
         """
         Analyze an investment update and return formatted text, metadata, and metrics.
+        Identical inputs analyzed before (e.g. eval reruns) are served from the persistent response
+        cache with metrics['cache_hit'] = True, zero cost and no latency fields (nothing was timed).
         
         Args:
             text: The text content from the PDF
@@ -830,6 +1556,23 @@ class AnalysisAgent:
         Returns:
             Tuple of (formatted_update_text, metadata_dict, metrics_dict)
         """
+        response_cache = _get_response_cache() if self.use_cache else None
+        # Benchmark comparisons and the performance summary come from benchmarks.json, so a refreshed file
+        # (populate_benchmarks.py) changes the key too
+        key = cache_key(
+            'analysis', str(ANALYSIS_CACHE_VERSION), PROMPT_VERSION, _get_bench().digest, EXTRACTION_MODEL,
+            FORMATTING_MODEL, investment_name or '', text
+        )
+        if response_cache is not None:
+            cached = response_cache.get(key)
+            if cached is not None:
+                formatted_text, metadata, all_metrics = cached
+                all_metrics.update(cache_hit=True, extraction_cost=0.0, formatting_cost=0.0, total_cost=0.0)
+                # The stored latencies are from the original run; drop them so latency stats only see real calls
+                all_metrics.pop('extraction_latency_ms', None)
+                all_metrics.pop('formatting_latency_ms', None)
+                return formatted_text, metadata, all_metrics
+        
         # Step 1: Extract information
         extracted_data, metadata, extraction_metrics = self.extraction_agent.extract_information(text, investment_name)
         
@@ -841,5 +1584,81 @@ class AnalysisAgent:
         
         # Calculate total cost
         all_metrics['total_cost'] = extraction_metrics.get('extraction_cost', 0) + formatting_metrics.get('formatting_cost', 0)
+        all_metrics['cache_hit'] = False
+        
+        if response_cache is not None:
+            response_cache.set(key, [formatted_text, metadata, all_metrics])
         
         return formatted_text, metadata, all_metrics
+    
+    async def analyze_update_async(self, text, investment_name=None):
+        """
+        Awaitable analyze_update: runs the blocking extraction and formatting calls in a worker thread
+        so several documents can be in flight on one event loop.
+        
+        Args:
+            text: The text content from the PDF
+            investment_name: Optional name of the investment
+            
+        Returns:
+            Tuple of (formatted_update_text, metadata_dict, metrics_dict)
+        """
+        return await asyncio.to_thread(self.analyze_update, text, investment_name)
+    
+    def analyze_updates_concurrent(self, texts, investment_names=None, max_concurrency=ANALYSIS_CONCURRENCY):
+        """
+        Analyze several investment updates with up to max_concurrency documents in flight at once.
+        
+        Within one document the steps stay sequential: the formatter needs the performance summary,
+        which depends on the qualitative assessment made during extraction.
+        
+        Args:
+            texts: List of text contents from the PDFs
+            investment_names: Optional list of investment names, parallel to texts
+            max_concurrency: Maximum number of documents analyzed concurrently
+            
+        Returns:
+            List, in input order, of (formatted_update_text, metadata_dict, metrics_dict) tuples,
+            or the raised Exception for documents that failed
+        """
+        if investment_names is None:
+            investment_names = [None] * len(texts)
+        
+        async def run_all():
+            # Created inside the running loop: asyncio primitives are bound to the loop that first waits on them
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def run_one(text, investment_name):
+                async with semaphore:
+                    return await self.analyze_update_async(text, investment_name)
+            
+            return await asyncio.gather(
+                *(run_one(text, investment_name) for text, investment_name in zip(texts, investment_names)),
+                return_exceptions=True
+            )
+        
+        return asyncio.run(run_all())
+    
+    def analyze_updates_batch(self, texts, investment_names=None):
+        """
+        Analyze several investment updates, sharing extraction and qualitative-assessment completions
+        between documents where possible (see ExtractionAgent.extract_information_batch).
+        
+        Args:
+            texts: List of text contents from the PDFs
+            investment_names: Optional list of investment names, parallel to texts
+            
+        Returns:
+            List of (formatted_update_text, metadata_dict, metrics_dict) tuples, in input order
+        """
+        if investment_names is None:
+            investment_names = [None] * len(texts)
+        
+        results = []
+        extractions = self.extraction_agent.extract_information_batch(list(zip(texts, investment_names)))
+        for extracted_data, metadata, extraction_metrics in extractions:
+            formatted_text, formatting_metrics = self.formatting_agent.format_update(extracted_data)
+            all_metrics = {**extraction_metrics, **formatting_metrics}
+            all_metrics['total_cost'] = extraction_metrics.get('extraction_cost', 0) + formatting_metrics.get('formatting_cost', 0)
+            results.append((formatted_text, metadata, all_metrics))
+        return results
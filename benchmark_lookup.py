@@ -1,6 +1,75 @@
 """Utility functions for looking up benchmark data."""
+import functools
+import hashlib
 import json
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
+
+from scoring_kernels import bucket_batch
+
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON; fall back to the stdlib parser
+    orjson = None
+
+# Percentile buckets from best to worst: (benchmark threshold key, percentile, category).
+# A value lands in the first bucket whose threshold it meets; below all thresholds is bottom_decile.
+_PERCENTILE_BUCKETS = (
+    ('top_decile', 'top_decile', 'Top 10%'),
+    ('top_quartile', 'top_quartile', 'Top 25%'),
+    ('median', 'above_median', 'Above Median'),
+    ('bottom_quartile', 'below_median', 'Below Median'),
+    ('bottom_decile', 'bottom_quartile', 'Bottom 25%'),
+)
+
+# Common asset class spellings -> benchmarks.json keys (anything else: lowercased, spaces to underscores)
+_ASSET_CLASS_MAP = MappingProxyType({
+    'private equity': 'private_equity',
+    'pe': 'private_equity',
+    'venture capital': 'venture_capital',
+    'vc': 'venture_capital',
+    'real estate': 'real_estate',
+    're': 'real_estate',
+    'private debt': 'private_debt',
+    'credit': 'private_debt',
+    'debt': 'private_debt'
+})
+
+# (parsed data, content digest) of benchmark files by resolved path, shared by every BenchmarkLookup in the process
+_BENCH_CACHE = {}
+
+# (percentile, category) by bucket index, including the below-all-thresholds bucket
+_BUCKET_LABELS = tuple((percentile, category) for _, percentile, category in _PERCENTILE_BUCKETS) + (
+    ('bottom_decile', 'Bottom 10%'),
+)
+
+# Metric -> (benchmarks.json section, threshold key prefix)
+_METRIC_SOURCES = {
+    'irr': ('irrs_by_vintage', ''),
+    'moic': ('multiples_by_vintage', 'tvpi_'),
+    'dpi': ('multiples_by_vintage', 'dpi_'),
+}
+
+
+def _freeze(value):
+    """Recursively wrap dicts in read-only MappingProxyType views (the loaded data is shared)."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    """Inverse of _freeze: plain dict/list copies of frozen data, for returning from public getters."""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
 
 
 class BenchmarkLookup:
@@ -9,38 +78,88 @@ class BenchmarkLookup:
     def __init__(self, benchmarks_file="benchmarks.json"):
         """Initialize with benchmarks data file."""
         self.benchmarks_file = Path(benchmarks_file)
-        self.data = self._load_benchmarks()
+        self.data, self.digest = self._load_benchmarks()
+        self._row_cache = {}  # (section, asset_key, vintage_str) -> benchmark row or None
+        self._build_threshold_tables()
     
     def _load_benchmarks(self):
-        """Load benchmarks from JSON file."""
+        """
+        Load benchmarks from JSON file (parsed once per process and shared read-only between instances).
+        
+        Returns:
+            Tuple of (data, digest): digest is a hex blake2b of the file bytes ('' when the file is missing),
+            so callers caching results derived from the benchmarks can key on it
+        """
+        cache_key = str(self.benchmarks_file.resolve())
+        cached = _BENCH_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
         if not self.benchmarks_file.exists():
             print(f"Warning: Benchmarks file not found: {self.benchmarks_file}")
-            return {}
+            return {}, ''
+        
+        raw = self.benchmarks_file.read_bytes()
+        data = orjson.loads(raw) if orjson else json.loads(raw)
         
-        with open(self.benchmarks_file, 'r') as f:
-            return json.load(f)
+        cached = (_freeze(data), hashlib.blake2b(raw, digest_size=16).hexdigest())
+        _BENCH_CACHE[cache_key] = cached
+        return cached
     
-    def normalize_asset_class(self, asset_class):
-        """Normalize asset class name to match benchmark keys."""
+    def _build_threshold_tables(self):
+        """
+        Build the structure-of-arrays form of the benchmarks used by compare_batch.
+        
+        Sets self._asset_idx {asset_key: row}, self._vintage_idx {vintage_str: col} and
+        self._thresholds {metric: (thresholds, medians)}, where thresholds is a contiguous float64
+        array (n_assets, n_vintages, 5) in _PERCENTILE_BUCKETS order (-inf where a threshold is
+        missing) and medians an object array (n_assets, n_vintages), None where no benchmark exists.
+        """
+        assets = [asset_key for asset_key, asset_data in self.data.items() if isinstance(asset_data, Mapping)]
+        vintages = sorted({
+            vintage
+            for asset_key in assets
+            for section, _ in _METRIC_SOURCES.values()
+            for vintage in (self.data[asset_key].get(section) or {})
+        })
+        self._asset_idx = {asset_key: i for i, asset_key in enumerate(assets)}
+        self._vintage_idx = {vintage: j for j, vintage in enumerate(vintages)}
+        self._thresholds = {}
+        
+        for metric, (section, prefix) in _METRIC_SOURCES.items():
+            thresholds = np.full((len(assets), len(vintages), len(_PERCENTILE_BUCKETS)), -np.inf)
+            medians = np.full((len(assets), len(vintages)), None, dtype=object)
+            for i, asset_key in enumerate(assets):
+                for vintage, row in (self.data[asset_key].get(section) or {}).items():
+                    if not row or row.get(prefix + 'median') is None:
+                        continue
+                    j = self._vintage_idx[vintage]
+                    medians[i, j] = row[prefix + 'median']
+                    thresholds[i, j] = [row.get(prefix + key, float('-inf')) for key, _, _ in _PERCENTILE_BUCKETS]
+            self._thresholds[metric] = (np.ascontiguousarray(thresholds), medians)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def normalize_asset_class(asset_class):
+        """Normalize asset class name to match benchmark keys (memoized; there are few distinct spellings)."""
         if not asset_class:
             return None
             
         asset_class_lower = asset_class.lower().strip()
         
         # Map common variations to standard keys
-        mapping = {
-            'private equity': 'private_equity',
-            'pe': 'private_equity',
-            'venture capital': 'venture_capital',
-            'vc': 'venture_capital',
-            'real estate': 'real_estate',
-            're': 'real_estate',
-            'private debt': 'private_debt',
-            'credit': 'private_debt',
-            'debt': 'private_debt'
-        }
-        
-        return mapping.get(asset_class_lower, asset_class_lower.replace(' ', '_'))
+        return _ASSET_CLASS_MAP.get(asset_class_lower, asset_class_lower.replace(' ', '_'))
+    
+    def _vintage_row(self, section, asset_key, vintage_str):
+        """Benchmark row for (asset_key, vintage) in one benchmarks.json section, or None (memoized per instance; self.data is not mutated after load)."""
+        key = (section, asset_key, vintage_str)
+        try:
+            return self._row_cache[key]
+        except KeyError:
+            pass
+        row = self.data[asset_key].get(section, {}).get(vintage_str) if asset_key in self.data else None
+        self._row_cache[key] = row
+        return row
     
     def get_irr_benchmarks(self, asset_class, vintage):
         """
@@ -51,18 +170,12 @@ class BenchmarkLookup:
             vintage: Vintage year as string or int (e.g., "2020" or 2020)
             
         Returns:
-            dict with IRR benchmark metrics, or None if not found
+            dict with IRR benchmark metrics (a copy the caller may modify), or None if not found
         """
         if not self.data:
             return None
-            
-        asset_key = self.normalize_asset_class(asset_class)
-        vintage_str = str(vintage)
-        
-        if asset_key not in self.data:
-            return None
         
-        return self.data[asset_key].get('irrs_by_vintage', {}).get(vintage_str)
+        return _thaw(self._vintage_row('irrs_by_vintage', self.normalize_asset_class(asset_class), str(vintage)))
     
     def get_multiples_benchmarks(self, asset_class, vintage):
         """
@@ -73,18 +186,65 @@ class BenchmarkLookup:
             vintage: Vintage year as string or int (e.g., "2020" or 2020)
             
         Returns:
-            dict with multiples benchmark metrics, or None if not found
+            dict with multiples benchmark metrics (a copy the caller may modify), or None if not found
         """
         if not self.data:
             return None
-            
+        
+        return _thaw(self._vintage_row('multiples_by_vintage', self.normalize_asset_class(asset_class), str(vintage)))
+    
+    def _benchmark_rows(self, asset_class, vintage):
+        """Resolve the (irr_row, multiples_row) benchmark dicts for an asset class and vintage; either may be None."""
+        if not self.data:
+            return None, None
+        
         asset_key = self.normalize_asset_class(asset_class)
         vintage_str = str(vintage)
+        return (self._vintage_row('irrs_by_vintage', asset_key, vintage_str),
+                self._vintage_row('multiples_by_vintage', asset_key, vintage_str))
+    
+    @staticmethod
+    def _categorize(actual, benchmarks, prefix=''):
+        """Bucket a value against one metric's benchmark thresholds (keys prefixed with e.g. 'tvpi_')."""
+        if not benchmarks:
+            return None
         
-        if asset_key not in self.data:
+        median = benchmarks.get(prefix + 'median')
+        if median is None:
             return None
         
-        return self.data[asset_key].get('multiples_by_vintage', {}).get(vintage_str)
+        for key, percentile, category in _PERCENTILE_BUCKETS:
+            if actual >= benchmarks.get(prefix + key, float('-inf')):
+                break
+        else:
+            percentile, category = 'bottom_decile', 'Bottom 10%'
+        
+        return {
+            'median': median,
+            'percentile': percentile,
+            'category': category
+        }
+    
+    def compare_all(self, asset_class, vintage, actual_irr=None, actual_tvpi=None, actual_dpi=None):
+        """
+        Compare IRR, MOIC (TVPI) and DPI against benchmarks with a single row lookup.
+        
+        Args:
+            asset_class: Asset class name
+            vintage: Vintage year
+            actual_irr: Actual IRR value (as percentage), or None to skip
+            actual_tvpi: Actual TVPI value, or None to skip
+            actual_dpi: Actual DPI value, or None to skip
+            
+        Returns:
+            dict with 'irr', 'moic', 'dpi' keys, each a comparison dict (as returned by compare_irr) or None
+        """
+        irr_row, multiples_row = self._benchmark_rows(asset_class, vintage)
+        return {
+            'irr': self._categorize(actual_irr, irr_row) if actual_irr is not None else None,
+            'moic': self._categorize(actual_tvpi, multiples_row, 'tvpi_') if actual_tvpi is not None else None,
+            'dpi': self._categorize(actual_dpi, multiples_row, 'dpi_') if actual_dpi is not None else None
+        }
     
     def compare_irr(self, asset_class, vintage, actual_irr):
         """
@@ -98,39 +258,7 @@ class BenchmarkLookup:
         Returns:
             dict with comparison results including 'median', 'percentile', 'category', or None if not found
         """
-        benchmarks = self.get_irr_benchmarks(asset_class, vintage)
-        if not benchmarks:
-            return None
-        
-        median = benchmarks.get('median')
-        if median is None:
-            return None
-        
-        # Determine percentile
-        if actual_irr >= benchmarks.get('top_decile', float('-inf')):
-            percentile = 'top_decile'
-            category = 'Top 10%'
-        elif actual_irr >= benchmarks.get('top_quartile', float('-inf')):
-            percentile = 'top_quartile'
-            category = 'Top 25%'
-        elif actual_irr >= benchmarks.get('median', float('-inf')):
-            percentile = 'above_median'
-            category = 'Above Median'
-        elif actual_irr >= benchmarks.get('bottom_quartile', float('-inf')):
-            percentile = 'below_median'
-            category = 'Below Median'
-        elif actual_irr >= benchmarks.get('bottom_decile', float('-inf')):
-            percentile = 'bottom_quartile'
-            category = 'Bottom 25%'
-        else:
-            percentile = 'bottom_decile'
-            category = 'Bottom 10%'
-        
-        return {
-            'median': median,
-            'percentile': percentile,
-            'category': category
-        }
+        return self._categorize(actual_irr, self._benchmark_rows(asset_class, vintage)[0])
     
     def compare_moic(self, asset_class, vintage, actual_tvpi):
         """
@@ -144,39 +272,7 @@ class BenchmarkLookup:
         Returns:
             dict with comparison results including 'median', 'percentile', 'category', or None if not found
         """
-        benchmarks = self.get_multiples_benchmarks(asset_class, vintage)
-        if not benchmarks:
-            return None
-        
-        median = benchmarks.get('tvpi_median')
-        if median is None:
-            return None
-        
-        # Determine percentile
-        if actual_tvpi >= benchmarks.get('tvpi_top_decile', float('-inf')):
-            percentile = 'top_decile'
-            category = 'Top 10%'
-        elif actual_tvpi >= benchmarks.get('tvpi_top_quartile', float('-inf')):
-            percentile = 'top_quartile'
-            category = 'Top 25%'
-        elif actual_tvpi >= benchmarks.get('tvpi_median', float('-inf')):
-            percentile = 'above_median'
-            category = 'Above Median'
-        elif actual_tvpi >= benchmarks.get('tvpi_bottom_quartile', float('-inf')):
-            percentile = 'below_median'
-            category = 'Below Median'
-        elif actual_tvpi >= benchmarks.get('tvpi_bottom_decile', float('-inf')):
-            percentile = 'bottom_quartile'
-            category = 'Bottom 25%'
-        else:
-            percentile = 'bottom_decile'
-            category = 'Bottom 10%'
-        
-        return {
-            'median': median,
-            'percentile': percentile,
-            'category': category
-        }
+        return self._categorize(actual_tvpi, self._benchmark_rows(asset_class, vintage)[1], 'tvpi_')
     
     def compare_dpi(self, asset_class, vintage, actual_dpi):
         """
@@ -190,39 +286,68 @@ class BenchmarkLookup:
         Returns:
             dict with comparison results including 'median', 'percentile', 'category', or None if not found
         """
-        benchmarks = self.get_multiples_benchmarks(asset_class, vintage)
-        if not benchmarks:
-            return None
+        return self._categorize(actual_dpi, self._benchmark_rows(asset_class, vintage)[1], 'dpi_')
+
+    
+    def compare_batch(self, metric, asset_classes, vintages, values):
+        """
+        Compare many funds' values for one metric against benchmarks in a single vectorized pass.
         
-        median = benchmarks.get('dpi_median')
-        if median is None:
-            return None
+        Args:
+            metric: 'irr', 'moic' (TVPI) or 'dpi'
+            asset_classes: Asset class names, one per fund
+            vintages: Vintage years, one per fund
+            values: Actual metric values, one per fund (None to skip)
+            
+        Returns:
+            List of comparison dicts (as returned by compare_irr), None where no benchmark or value exists
+        """
+        table_thresholds, table_medians = self._thresholds[metric]
+        n_funds = len(values)
+        rows = np.full(n_funds, -1, dtype=np.intp)
+        cols = np.full(n_funds, -1, dtype=np.intp)
+        actual = np.full(n_funds, np.nan)
+        medians = [None] * n_funds
         
-        # Determine percentile
-        if actual_dpi >= benchmarks.get('dpi_top_decile', float('-inf')):
-            percentile = 'top_decile'
-            category = 'Top 10%'
-        elif actual_dpi >= benchmarks.get('dpi_top_quartile', float('-inf')):
-            percentile = 'top_quartile'
-            category = 'Top 25%'
-        elif actual_dpi >= benchmarks.get('dpi_median', float('-inf')):
-            percentile = 'above_median'
-            category = 'Above Median'
-        elif actual_dpi >= benchmarks.get('dpi_bottom_quartile', float('-inf')):
-            percentile = 'below_median'
-            category = 'Below Median'
-        elif actual_dpi >= benchmarks.get('dpi_bottom_decile', float('-inf')):
-            percentile = 'bottom_quartile'
-            category = 'Bottom 25%'
-        else:
-            percentile = 'bottom_decile'
-            category = 'Bottom 10%'
+        for i, (asset_class, vintage, value) in enumerate(zip(asset_classes, vintages, values)):
+            if value is None:
+                continue
+            row = self._asset_idx.get(self.normalize_asset_class(asset_class))
+            col = self._vintage_idx.get(str(vintage))
+            if row is None or col is None or table_medians[row, col] is None:
+                continue
+            rows[i], cols[i] = row, col
+            medians[i] = table_medians[row, col]
+            actual[i] = value
         
-        return {
-            'median': median,
-            'percentile': percentile,
-            'category': category
-        }
+        # Gather every fund's threshold row in one indexing operation (inf where no benchmark: never met)
+        found = rows >= 0
+        thresholds = np.full((n_funds, len(_PERCENTILE_BUCKETS)), np.inf)
+        thresholds[found] = table_thresholds[rows[found], cols[found]]
+        
+        # First bucket whose threshold the value meets; no hit -> below all thresholds (bottom decile)
+        buckets = bucket_batch(thresholds, actual)
+        
+        results = []
+        for median, bucket in zip(medians, buckets.tolist()):
+            if median is None:
+                results.append(None)
+                continue
+            percentile, category = _BUCKET_LABELS[bucket]
+            results.append({'median': median, 'percentile': percentile, 'category': category})
+        return results
+    
+    def compare_irr_batch(self, asset_classes, vintages, actual_irrs):
+        """Batch form of compare_irr (see compare_batch)."""
+        return self.compare_batch('irr', asset_classes, vintages, actual_irrs)
+    
+    def compare_moic_batch(self, asset_classes, vintages, actual_tvpis):
+        """Batch form of compare_moic (see compare_batch)."""
+        return self.compare_batch('moic', asset_classes, vintages, actual_tvpis)
+    
+    def compare_dpi_batch(self, asset_classes, vintages, actual_dpis):
+        """Batch form of compare_dpi (see compare_batch)."""
+        return self.compare_batch('dpi', asset_classes, vintages, actual_dpis)
 
 
 # Example usage and validation
@@ -1,52 +1,94 @@
 """Configuration management for the Google Drive automation pipeline."""
+import functools
 import os
-from dotenv import load_dotenv
+from types import SimpleNamespace
 
-# Only load .env file if it exists (for local development)
-# In Cloud Run, all config comes from environment variables
-if os.path.exists('.env'):
-    load_dotenv()
 
-# Google Drive API
-GOOGLE_CREDENTIALS_FILE = os.getenv('GOOGLE_CREDENTIALS_FILE', 'credentials.json')
-GOOGLE_TOKEN_FILE = os.getenv('GOOGLE_TOKEN_FILE', 'token.json')
+@functools.lru_cache(maxsize=1)
+def get_config():
+    """
+    Read every setting from the environment once and return them as a read-only namespace.
 
-# Folder IDs
-PENDING_UPDATES_FOLDER_ID = os.getenv('PENDING_UPDATES_FOLDER_ID')
-DONE_UPDATES_FOLDER_ID = os.getenv('DONE_UPDATES_FOLDER_ID')
-WRITTEN_UPDATES_DOCUMENT_ID = os.getenv('WRITTEN_UPDATES_DOCUMENT_ID')
+    Module-level names (config.OPENAI_MODEL, from config import OPENAI_MODEL, ...) resolve through
+    this object. Call get_config.cache_clear() to re-read the environment (e.g. in tests).
+    """
+    # Only load .env file if it exists (for local development)
+    # In Cloud Run, all config comes from environment variables, so dotenv is never imported there
+    if os.path.exists('.env'):
+        from dotenv import load_dotenv
+        load_dotenv()
 
-# OpenAI Configuration
-OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
-OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4')  # Default/legacy, prefer EXTRACTION_MODEL and FORMATTING_MODEL
-OPENAI_TEMPERATURE = float(os.getenv('OPENAI_TEMPERATURE', '0.7'))
+    env = os.environ
+    return _FrozenNamespace(
+        # Google Drive API
+        GOOGLE_CREDENTIALS_FILE=env.get('GOOGLE_CREDENTIALS_FILE', 'credentials.json'),
+        GOOGLE_TOKEN_FILE=env.get('GOOGLE_TOKEN_FILE', 'token.json'),
 
-# Agent-specific model configuration
-EXTRACTION_MODEL = os.getenv('EXTRACTION_MODEL', 'gpt-5.2')
-FORMATTING_MODEL = os.getenv('FORMATTING_MODEL', 'gpt-5-mini')
+        # Folder IDs
+        PENDING_UPDATES_FOLDER_ID=env.get('PENDING_UPDATES_FOLDER_ID'),
+        DONE_UPDATES_FOLDER_ID=env.get('DONE_UPDATES_FOLDER_ID'),
+        WRITTEN_UPDATES_DOCUMENT_ID=env.get('WRITTEN_UPDATES_DOCUMENT_ID'),
+
+        # OpenAI Configuration
+        OPENAI_API_KEY=env.get('OPENAI_API_KEY'),
+        OPENAI_MODEL=env.get('OPENAI_MODEL', 'gpt-4'),  # Default/legacy, prefer EXTRACTION_MODEL and FORMATTING_MODEL
+        OPENAI_TEMPERATURE=float(env.get('OPENAI_TEMPERATURE', '0.7')),
+
+        # Agent-specific model configuration
+        EXTRACTION_MODEL=env.get('EXTRACTION_MODEL', 'gpt-5.2'),
+        FORMATTING_MODEL=env.get('FORMATTING_MODEL', 'gpt-5-mini'),
+
+        # LLM response cache (exact-match, persisted across runs); set LLM_CACHE_BYPASS=1 to force fresh responses
+        LLM_CACHE_DIR=env.get('LLM_CACHE_DIR', '.llm_cache'),
+        LLM_CACHE_TTL_DAYS=int(env.get('LLM_CACHE_TTL_DAYS', '30')),
+        LLM_CACHE_BYPASS=env.get('LLM_CACHE_BYPASS', '').lower() in ('1', 'true', 'yes'),
+
+        # Pipeline Configuration
+        POLL_INTERVAL_SECONDS=int(env.get('POLL_INTERVAL_SECONDS', '60')),  # Check every minute
+
+        # Set by Cloud Run
+        K_SERVICE=env.get('K_SERVICE'),
+    )
+
+
+class _FrozenNamespace(SimpleNamespace):
+    """SimpleNamespace that rejects attribute assignment after construction."""
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Configuration is read-only: cannot set {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Configuration is read-only: cannot delete {name}")
+
+
+def __getattr__(name):
+    """Resolve module-level setting names (e.g. config.OPENAI_API_KEY) from get_config()."""
+    try:
+        return getattr(get_config(), name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
-# Pipeline Configuration
-POLL_INTERVAL_SECONDS = int(os.getenv('POLL_INTERVAL_SECONDS', '60'))  # Check every minute
 
 def validate_config():
     """Validate that all required configuration is present."""
+    cfg = get_config()
     missing = []
-    
-    if not OPENAI_API_KEY:
+
+    if not cfg.OPENAI_API_KEY:
         missing.append('OPENAI_API_KEY')
-    if not PENDING_UPDATES_FOLDER_ID:
+    if not cfg.PENDING_UPDATES_FOLDER_ID:
         missing.append('PENDING_UPDATES_FOLDER_ID')
-    if not DONE_UPDATES_FOLDER_ID:
+    if not cfg.DONE_UPDATES_FOLDER_ID:
         missing.append('DONE_UPDATES_FOLDER_ID')
-    if not WRITTEN_UPDATES_DOCUMENT_ID:
+    if not cfg.WRITTEN_UPDATES_DOCUMENT_ID:
         missing.append('WRITTEN_UPDATES_DOCUMENT_ID')
-    
+
     # In Cloud Run, we use Application Default Credentials, so credentials.json is not required
     # Only check for it in local development
-    if not os.getenv('K_SERVICE') and not os.path.exists(GOOGLE_CREDENTIALS_FILE):
-        missing.append(f'Google credentials file: {GOOGLE_CREDENTIALS_FILE} (required for local development)')
-    
+    if not cfg.K_SERVICE and not os.path.exists(cfg.GOOGLE_CREDENTIALS_FILE):
+        missing.append(f'Google credentials file: {cfg.GOOGLE_CREDENTIALS_FILE} (required for local development)')
+
     if missing:
         raise ValueError(f"Missing required configuration: {', '.join(missing)}")
-    
+
     return True
@@ -6,21 +6,186 @@ This harness evaluates the pipeline by:
 - Tracking tokens and latency across all three sections (Quantitative Performance, Key Takeaways and Business Updates, Market Commentary)
 - No LLM judge is used - only deterministic string matching for metrics
 """
+import contextlib
+import functools
+import io
+import itertools
 import json
 import os
 import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from pdf_processor import extract_text_from_pdf
+from typing import Dict, Iterator, List, Tuple, Optional
+import numpy as np
+from pdf_processor import extract_text_from_pdf, extract_text_from_pdf_cached
 from analysis_agent import AnalysisAgent
 
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON; fall back to the stdlib parser and encoder
+    orjson = None
+
+_json_loads = orjson.loads if orjson else json.loads
+
+try:
+    from rapidfuzz import fuzz
+except ImportError:  # Optional C++ fuzzy matcher for PDF names; fall back to plain word overlap
+    fuzz = None
+
+
+# Test cases evaluated concurrently by run_evaluation (override with --workers)
+EVAL_WORKERS = 4
+
+# Extracted PDF text, one file per SHA-256 of the PDF bytes (reused across eval runs)
+PDF_TEXT_CACHE_DIR = Path('.cache') / 'pdf_text'
+
+# Words ignored when matching PDF file names to test case names
+_NAME_MATCH_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+                                    'update', 'report', 'quarterly', 'performance'})
+
+# Minimum name match score for picking a PDF: token-set similarity, or else at least 20% word overlap
+_NAME_MATCH_MIN_SCORE = 0.4 if fuzz is not None else 0.2
+
+# Patterns to match different metric formats, tried in order - group 1 is the number part
+_RAW_METRIC_PATTERNS = {
+    'irr': [
+        r'net\s+irr[:\s]+([\d.]+)\s*%',
+        r'irr[:\s]+([\d.]+)\s*%',
+        r'([\d.]+)\s*%\s*net\s+irr',
+        r'([\d.]+)\s*%\s*irr',
+    ],
+    'moic': [
+        r'net\s+moic[:\s]+([\d.]+)\s*x',
+        r'net\s+tvpi[:\s]+([\d.]+)\s*x',
+        r'moic[:\s]+([\d.]+)\s*x',
+        r'tvpi[:\s]+([\d.]+)\s*x',
+        r'([\d.]+)\s*x\s*net\s+moic',
+        r'([\d.]+)\s*x\s*moic',
+    ],
+    'dpi': [
+        r'net\s+dpi[:\s]+([\d.]+)\s*[x%]',
+        r'dpi[:\s]+([\d.]+)\s*[x%]',
+        r'([\d.]+)\s*[x%]\s*net\s+dpi',
+        r'([\d.]+)\s*[x%]\s*dpi',
+    ]
+}
+
+# Compiled once and matched against lowercased text: one str.lower() pass is cheaper than
+# re.IGNORECASE case-folding every character the patterns visit
+_METRIC_PATTERNS = {
+    metric: [re.compile(pattern) for pattern in patterns]
+    for metric, patterns in _RAW_METRIC_PATTERNS.items()
+}
+
+# Shortest text any metric pattern can match (e.g. '1%irr', '1xdpi'); shorter texts are skipped
+_MIN_METRIC_MATCH_LENGTH = 5
+
+# All of a metric's patterns as one alternation, used to skip texts without any match
+_METRIC_GATES = {
+    metric: re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+    for metric, patterns in _RAW_METRIC_PATTERNS.items()
+}
+
+# Section headers that indicate a new section starts (extract_section stops there)
+_SECTION_STOP_HEADERS = ('Quantitative Performance:', 'Key Takeaways and Business Updates:',
+                         'Market Commentary:', 'Key Takeaways:', 'Business Updates/Market Commentary:',
+                         'Business Updates:', 'Investment Performance:')
+
+
+class _ThreadOutputRouter:
+    """
+    sys.stdout stand-in that sends writes from threads inside capture() to that thread's buffer and
+    everything else to the real stream, so concurrently evaluated test cases don't interleave their reports.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer if buffer is not None else self._stream).write(text)
+    
+    def flush(self):
+        if getattr(self._local, 'buffer', None) is None:
+            self._stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+    
+    def capture(self, fn, *args):
+        """Call fn(*args) with this thread's output buffered. Returns (result, captured_output)."""
+        self._local.buffer = io.StringIO()
+        try:
+            return fn(*args), self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+
+@contextlib.contextmanager
+def _routed_stdout():
+    """Install a _ThreadOutputRouter as sys.stdout for the duration of the block and yield it."""
+    router = _ThreadOutputRouter(sys.stdout)
+    sys.stdout = router
+    try:
+        yield router
+    finally:
+        sys.stdout = router._stream
+
+
+def _one_line(text: str) -> str:
+    """Replace line breaks with spaces so a section's text fits in one CSV cell."""
+    # Chained str.replace beats str.translate here: replace returns the string itself when there is
+    # nothing to replace (usually '\r'), while translate is far slower, especially on non-ASCII text
+    return text.replace('\n', ' ').replace('\r', ' ')
+
+
+@functools.lru_cache(maxsize=None)
+def _section_header_pattern(section_name: str) -> re.Pattern:
+    """Compiled pattern for the first line containing both section_name and a colon."""
+    return re.compile(r'^(?=[^\n]*:)[^\n]*?' + re.escape(section_name), re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=None)
+def _stop_header_pattern(section_name: str) -> re.Pattern:
+    """Compiled alternation of every stop header other than section_name."""
+    return re.compile('|'.join(re.escape(header) for header in _SECTION_STOP_HEADERS if header != section_name))
+
+# What must follow a metric value: % for IRR, x or % for MOIC/DPI
+_IRR_SUFFIX = re.compile(r'\s*%')
+_MULTIPLE_SUFFIX = re.compile(r'\s*[x%]')
+
+
+@functools.lru_cache(maxsize=1024)
+def _value_pattern(metric: str, value_str: str) -> re.Pattern:
+    """Compiled pattern for a metric value string followed by its unit suffix."""
+    suffix = _IRR_SUFFIX if metric == 'irr' else _MULTIPLE_SUFFIX
+    return re.compile(re.escape(value_str) + suffix.pattern, re.IGNORECASE)
+
 
 class EvalHarness:
     """Evaluation harness for the investment updates pipeline."""
     
-    def __init__(self, test_cases_dir: str = "eval_test_cases"):
+    def __init__(self, test_cases_dir: str = "eval_test_cases", use_cache: bool = True):
         self.test_cases_dir = Path(test_cases_dir)
-        self.analysis_agent = AnalysisAgent()
+        self.use_cache = use_cache
+        self.analysis_agent = AnalysisAgent(use_cache=use_cache)
+    
+    def load_pdf_text(self, pdf_path: str) -> Optional[str]:
+        """
+        Extract text from a PDF, reusing the text cached on disk for identical PDF bytes.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Extracted text, or None if extraction failed (failures are not cached)
+        """
+        if not self.use_cache:
+            return extract_text_from_pdf(pdf_path)
+        return extract_text_from_pdf_cached(pdf_path, PDF_TEXT_CACHE_DIR)
     
     def extract_metric_value(self, text: str, metric_name: str) -> List[str]:
         """
@@ -34,50 +199,25 @@ class EvalHarness:
         Returns:
             List of number strings found (e.g., ['13.9', '15.7']), empty list if none found
         """
+        metric = metric_name.lower()
+        if metric not in _METRIC_PATTERNS or len(text) < _MIN_METRIC_MATCH_LENGTH:
+            return []
+        
         # Normalize text to lowercase for matching
         text_lower = text.lower()
         
-        # Patterns to match different formats - extract the number part
-        patterns = {
-            'irr': [
-                r'net\s+irr[:\s]+([\d.]+)\s*%',
-                r'irr[:\s]+([\d.]+)\s*%',
-                r'([\d.]+)\s*%\s*net\s+irr',
-                r'([\d.]+)\s*%\s*irr',
-            ],
-            'moic': [
-                r'net\s+moic[:\s]+([\d.]+)\s*x',
-                r'net\s+tvpi[:\s]+([\d.]+)\s*x',
-                r'moic[:\s]+([\d.]+)\s*x',
-                r'tvpi[:\s]+([\d.]+)\s*x',
-                r'([\d.]+)\s*x\s*net\s+moic',
-                r'([\d.]+)\s*x\s*moic',
-            ],
-            'dpi': [
-                r'net\s+dpi[:\s]+([\d.]+)\s*[x%]',
-                r'dpi[:\s]+([\d.]+)\s*[x%]',
-                r'([\d.]+)\s*[x%]\s*net\s+dpi',
-                r'([\d.]+)\s*[x%]\s*dpi',
-            ]
-        }
-        
-        if metric_name.lower() not in patterns:
+        # One scan finds where the earliest match of any pattern starts; none means no values
+        first = _METRIC_GATES[metric].search(text_lower)
+        if first is None:
             return []
         
-        values = []
-        seen = set()
-        
-        # Try each pattern and collect all matches as strings
-        for pattern in patterns[metric_name.lower()]:
-            matches = re.finditer(pattern, text_lower)
-            for match in matches:
-                value_str = match.group(1)
-                # Avoid duplicates
-                if value_str not in seen:
-                    values.append(value_str)
-                    seen.add(value_str)
-        
-        return values
+        # Try each pattern from there and collect all matches as strings, deduplicated in order
+        start = first.start()
+        return list(dict.fromkeys(
+            match.group(1)
+            for pattern in _METRIC_PATTERNS[metric]
+            for match in pattern.finditer(text_lower, start)
+        ))
     
     def check_metric_accuracy(self, ground_truth_text: str, predicted_text: str, metric_name: str) -> Tuple[bool, Optional[str], Optional[str]]:
         """
@@ -92,6 +232,10 @@ class EvalHarness:
         Returns:
             Tuple of (is_match, gt_value, pred_value)
         """
+        # Nothing to compare in two empty sections
+        if not ground_truth_text and not predicted_text:
+            return True, None, None
+        
         gt_value_strings = self.extract_metric_value(ground_truth_text, metric_name)
         pred_value_strings = self.extract_metric_value(predicted_text, metric_name)
         
@@ -103,29 +247,29 @@ class EvalHarness:
         if not gt_value_strings or not pred_value_strings:
             return False, gt_value_strings[0] if gt_value_strings else None, pred_value_strings[0] if pred_value_strings else None
         
+        metric = metric_name.lower()
+        # Every extracted value is followed by its unit in the text it came from, so a value
+        # extracted from both texts is a match without searching again
+        pred_value_set = set(pred_value_strings)
+        
         # Check if any ground truth value string appears in predicted text
         # We check both directions: GT value in pred text, and pred value in GT text
         for gt_val_str in gt_value_strings:
-            # Check if this number appears in predicted text (as part of the metric)
-            # Look for the number followed by % or x (for IRR/MOIC/DPI)
-            if metric_name.lower() == 'irr':
-                # For IRR, look for number followed by %
-                pattern = re.escape(gt_val_str) + r'\s*%'
-            else:
-                # For MOIC/DPI, look for number followed by x or %
-                pattern = re.escape(gt_val_str) + r'\s*[x%]'
-            
-            if re.search(pattern, predicted_text, re.IGNORECASE):
+            if gt_val_str in pred_value_set:
+                return True, gt_val_str, gt_val_str
+            # Check if this number appears in predicted text (as part of the metric),
+            # followed by % for IRR or by x/% for MOIC/DPI. Value strings are digits and dots,
+            # so a plain substring test rules most of them out without running the regex
+            if gt_val_str not in predicted_text:
+                continue
+            if _value_pattern(metric, gt_val_str).search(predicted_text):
                 return True, gt_val_str, gt_val_str
         
         # Also check reverse: if any predicted value appears in ground truth
         for pred_val_str in pred_value_strings:
-            if metric_name.lower() == 'irr':
-                pattern = re.escape(pred_val_str) + r'\s*%'
-            else:
-                pattern = re.escape(pred_val_str) + r'\s*[x%]'
-            
-            if re.search(pattern, ground_truth_text, re.IGNORECASE):
+            if pred_val_str not in ground_truth_text:
+                continue
+            if _value_pattern(metric, pred_val_str).search(ground_truth_text):
                 return True, pred_val_str, pred_val_str
         
         # No match found
@@ -148,8 +292,7 @@ class EvalHarness:
         if not ground_truth_file.exists():
             raise FileNotFoundError(f"No ground_truth.json found in {test_case_path}")
         
-        with open(ground_truth_file, 'r') as f:
-            ground_truth = json.load(f)
+        ground_truth = _json_loads(ground_truth_file.read_bytes())
         
         # Find PDF file(s)
         pdf_files = list(test_case_path.glob("*.pdf"))
@@ -164,35 +307,36 @@ class EvalHarness:
             test_case_normalized = test_case_name.lower().replace('_', ' ').replace('-', ' ')
             # Remove common prefixes/suffixes
             test_case_normalized = test_case_normalized.replace('2025 ', '').replace('q3 ', '').replace('q4 ', '')
+            test_words = set(test_case_normalized.split()) - _NAME_MATCH_STOP_WORDS
+            test_words_text = ' '.join(test_words)
             
             best_match = None
             best_score = 0
+            best_key = (0, 0)
             
             for pdf_file in pdf_files:
                 # Normalize PDF name similarly
                 pdf_name_normalized = pdf_file.stem.lower().replace('_', ' ').replace('-', ' ')
                 pdf_name_normalized = pdf_name_normalized.replace('2025.', '').replace('q3 ', '').replace('q4 ', '')
                 
-                # Calculate word overlap score
-                test_words = set(test_case_normalized.split())
-                pdf_words = set(pdf_name_normalized.split())
-                
-                # Remove common stop words
-                stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'update', 'report', 'quarterly', 'performance'}
-                test_words = test_words - stop_words
-                pdf_words = pdf_words - stop_words
+                pdf_words = set(pdf_name_normalized.split()) - _NAME_MATCH_STOP_WORDS
                 
-                if test_words and pdf_words:
-                    common_words = test_words & pdf_words
-                    score = len(common_words) / max(len(test_words), len(pdf_words), 1)
+                if not (test_words and pdf_words):
+                    score = overlap = 0
                 else:
-                    score = 0
+                    # Word overlap score
+                    overlap = len(test_words & pdf_words) / max(len(test_words), len(pdf_words))
+                    # Token-set similarity: tolerant of extra words and small spelling differences. It scores 100
+                    # whenever one word set contains the other, so ties are broken by word overlap, which
+                    # ranks the exact name above a longer one (e.g. "Acme Fund II" over "... Side Letter")
+                    score = fuzz.token_set_ratio(test_words_text, ' '.join(pdf_words)) / 100 if fuzz is not None else overlap
                 
-                if score > best_score:
+                if (score, overlap) > best_key:
+                    best_key = (score, overlap)
                     best_score = score
                     best_match = pdf_file
             
-            if best_match and best_score > 0.2:  # At least 20% word overlap
+            if best_match and best_score > _NAME_MATCH_MIN_SCORE:
                 pdf_path = best_match
                 print(f"  ✓ Selected PDF: {pdf_path.name} (match score: {best_score:.2f})")
             else:
@@ -218,41 +362,56 @@ class EvalHarness:
         Returns:
             The section text, or empty string if not found
         """
-        lines = text.split('\n')
-        section_lines = []
-        in_section = False
-        
-        # Section headers that indicate we should stop (new section names)
-        stop_headers = ['Quantitative Performance:', 'Key Takeaways and Business Updates:', 
-                        'Market Commentary:', 'Key Takeaways:', 'Business Updates/Market Commentary:',
-                        'Business Updates:', 'Investment Performance:']
+        return self.extract_sections(text, [section_name])[section_name]
+    
+    def extract_sections(self, text: str, section_names: List[str]) -> Dict[str, str]:
+        """
+        Extract several sections from formatted update text, preparing the text only once.
         
-        for i, line in enumerate(lines):
-            # Remove markdown bold syntax for matching
-            line_clean = line.replace('**', '').strip()
+        Args:
+            text: The full formatted update text
+            section_names: Names of sections to extract (e.g., ["Quantitative Performance", "Market Commentary"])
             
-            # Check if this is the section we're looking for
-            if section_name in line_clean and ':' in line_clean:
-                in_section = True
-                section_lines.append(line)
+        Returns:
+            Dictionary mapping each section name to its text, or empty string if not found
+        """
+        # Remove markdown bold syntax for matching (never spans lines, so line numbers are kept)
+        clean_text = text.replace('**', '')
+        lines = text.split('\n')
+        clean_lines = clean_text.split('\n')
+        # Offset in text where each line starts (plus one past the end)
+        line_offsets = [0, *itertools.accumulate(len(line) + 1 for line in lines)]
+        
+        sections = {}
+        for section_name in section_names:
+            # Find the section's header line: the first line mentioning the section name and a colon
+            header = _section_header_pattern(section_name).search(clean_text)
+            if header is None:
+                sections[section_name] = ''
                 continue
             
-            if in_section:
-                # Stop at next section header
-                if any(header in line_clean for header in stop_headers if header != section_name):
-                    break
-                # Also stop if we hit a blank line followed by what looks like a new section
-                if i > 0 and not lines[i-1].strip() and ':' in line_clean and not line_clean.startswith('•'):
-                    # Check if it's a section header (not a bullet continuation)
-                    if not line_clean.startswith('  •'):
+            start = clean_text.count('\n', 0, header.start())
+            stop_header = _stop_header_pattern(section_name)
+            
+            # The section is a run of whole lines: find the first line after it and slice once
+            end = start + 1
+            while end < len(lines):
+                line_clean = clean_lines[end].strip()
+                
+                # Repeated header lines for this section stay in it
+                if not (section_name in line_clean and ':' in line_clean):
+                    # Stop at next section header
+                    if stop_header.search(line_clean):
                         break
-                section_lines.append(line)
+                    # Also stop if we hit a blank line followed by what looks like a new section
+                    # (not a bullet continuation)
+                    if not lines[end-1].strip() and ':' in line_clean and not line_clean.startswith('•'):
+                        break
+                end += 1
+            
+            sections[section_name] = text[line_offsets[start]:line_offsets[end]].strip()
         
-        result = '\n'.join(section_lines).strip()
-        # Remove trailing blank lines
-        while result.endswith('\n'):
-            result = result[:-1]
-        return result
+        return sections
     
     def evaluate_test_case(self, test_case_name: str) -> Dict:
         """
@@ -273,12 +432,29 @@ class EvalHarness:
         
         # Extract text from PDF
         print(f"Extracting text from PDF...")
-        pdf_text = extract_text_from_pdf(pdf_path)
+        pdf_text = self.load_pdf_text(pdf_path)
         
         # Run pipeline
         print(f"Running pipeline...")
         predicted_text, metadata, metrics = self.analysis_agent.analyze_update(pdf_text, test_case_name)
         
+        return self.score_test_case(test_case_name, ground_truth, predicted_text, metadata, metrics)
+    
+    def score_test_case(self, test_case_name: str, ground_truth: Dict, predicted_text: str,
+                        metadata: Dict, metrics: Dict) -> Dict:
+        """
+        Score the pipeline output for a test case against its ground truth.
+        
+        Args:
+            test_case_name: Name of the test case
+            ground_truth: Ground truth dictionary from load_test_case
+            predicted_text: Formatted update text produced by the pipeline
+            metadata: Metadata returned by the pipeline
+            metrics: Token/cost/latency metrics returned by the pipeline
+            
+        Returns:
+            Dictionary with evaluation results
+        """
         # Map old section keys to new section names
         section_mapping = {
             'investment_performance': 'Quantitative Performance',
@@ -301,8 +477,11 @@ class EvalHarness:
         if isinstance(ground_truth_section, list):
             ground_truth_section = '\n'.join([f"  • {item}" for item in ground_truth_section])
         
-        # Extract Quantitative Performance section from predicted (using new section name)
-        predicted_section = self.extract_section(predicted_text, 'Quantitative Performance')
+        # Extract every section from predicted in one pass (using new section names)
+        predicted_sections = self.extract_sections(predicted_text, list(section_mapping.values()))
+        
+        # Extract Quantitative Performance section from predicted
+        predicted_section = predicted_sections['Quantitative Performance']
         
         # Check IRR, MOIC, DPI accuracy deterministically - just check if number strings exist
         irr_match, irr_gt, irr_pred = self.check_metric_accuracy(ground_truth_section, predicted_section, 'irr')
@@ -357,7 +536,7 @@ class EvalHarness:
                 if isinstance(ground_truth_section, list):
                     ground_truth_section = '\n'.join([f"  • {item}" for item in ground_truth_section])
                 
-                predicted_section = self.extract_section(predicted_text, section_name)
+                predicted_section = predicted_sections[section_name]
                 
                 results['sections'][section_key] = {
                     'ground_truth': ground_truth_section,
@@ -366,12 +545,97 @@ class EvalHarness:
         
         return results
     
-    def run_evaluation(self, test_case_names: List[str] = None) -> Dict:
+    def iter_evaluation(self, test_case_names: List[str], max_workers: int = EVAL_WORKERS,
+                        batch: bool = False) -> Iterator[Dict]:
+        """
+        Evaluate test cases, yielding each result as soon as it (and every case before it) is done.
+        
+        Test cases are independent, so up to max_workers of them are evaluated at once in threads
+        (PDF reads and LLM calls are I/O-bound). Cases that fail are reported and skipped. Each case's
+        printed report is held back until the case is yielded, so reports come out whole and in order.
+        
+        With batch=True, every test case's PDF text is loaded first and the pipeline runs once over
+        all of them (AnalysisAgent.analyze_updates_batch), sharing extraction and assessment requests
+        between documents; results are then scored as usual.
+        
+        Args:
+            test_case_names: List of test case names to evaluate
+            max_workers: Maximum number of test cases evaluated (or loaded, in batch mode) concurrently
+            batch: Run the pipeline once over all test cases instead of once per test case
+            
+        Yields:
+            Evaluation result dictionaries, in the order of test_case_names
+        """
+        if batch:
+            yield from self._iter_batch_evaluation(test_case_names, max_workers)
+            return
+        
+        def evaluate(test_case_name):
+            try:
+                return self.evaluate_test_case(test_case_name)
+            except Exception as e:
+                print(f"Error evaluating {test_case_name}: {e}")
+                return None
+        
+        # Each case's report is buffered in its worker and printed here, in order, as the case is yielded
+        with _routed_stdout() as router, ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for result, output in executor.map(lambda name: router.capture(evaluate, name), test_case_names):
+                router.write(output)
+                if result is not None:
+                    yield result
+    
+    def _iter_batch_evaluation(self, test_case_names: List[str], max_workers: int) -> Iterator[Dict]:
+        """Batch mode of iter_evaluation: load all test cases, run the pipeline once, score each."""
+        def load(test_case_name):
+            try:
+                pdf_path, ground_truth = self.load_test_case(test_case_name)
+                pdf_text = self.load_pdf_text(pdf_path)
+                if pdf_text is None:
+                    # Reported and skipped here so one unreadable PDF does not fail the whole batch
+                    raise ValueError(f"no text could be extracted from {pdf_path}")
+                return test_case_name, ground_truth, pdf_text
+            except Exception as e:
+                print(f"Error evaluating {test_case_name}: {e}")
+                return None
+        
+        print(f"Loading {len(test_case_names)} test case(s)...")
+        cases = []
+        with _routed_stdout() as router, ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for case, output in executor.map(lambda name: router.capture(load, name), test_case_names):
+                router.write(output)
+                if case is not None:
+                    cases.append(case)
+        if not cases:
+            return
+        
+        print(f"Running pipeline on {len(cases)} test case(s) in one batch...")
+        try:
+            outputs = self.analysis_agent.analyze_updates_batch(
+                [pdf_text for _, _, pdf_text in cases],
+                [test_case_name for test_case_name, _, _ in cases]
+            )
+        except Exception as e:
+            print(f"Error running batch pipeline: {e}")
+            return
+        
+        for (test_case_name, ground_truth, _), (predicted_text, metadata, metrics) in zip(cases, outputs):
+            print(f"\n{'='*80}")
+            print(f"Evaluating: {test_case_name}")
+            print(f"{'='*80}")
+            try:
+                yield self.score_test_case(test_case_name, ground_truth, predicted_text, metadata, metrics)
+            except Exception as e:
+                print(f"Error evaluating {test_case_name}: {e}")
+    
+    def run_evaluation(self, test_case_names: List[str] = None, max_workers: int = EVAL_WORKERS,
+                       batch: bool = False) -> Dict:
         """
-        Run evaluation on all test cases or specified ones.
+        Run evaluation on all test cases or specified ones (see iter_evaluation).
         
         Args:
             test_case_names: List of test case names to evaluate, or None for all
+            max_workers: Maximum number of test cases evaluated concurrently
+            batch: Run the pipeline once over all test cases instead of once per test case
             
         Returns:
             Dictionary with overall results
@@ -392,23 +656,17 @@ class EvalHarness:
         total_extraction_cost = 0
         total_formatting_cost = 0
         
-        for test_case_name in test_case_names:
-            try:
-                result = self.evaluate_test_case(test_case_name)
-                all_results.append(result)
-                
-                # Collect quantitative performance scores
-                if 'quantitative_performance' in result['sections']:
-                    quantitative_performance_scores.append(result['sections']['quantitative_performance']['score'])
-                
-                # Collect costs
-                metrics = result.get('metrics', {})
-                total_extraction_cost += metrics.get('extraction_cost', 0)
-                total_formatting_cost += metrics.get('formatting_cost', 0)
+        for result in self.iter_evaluation(test_case_names, max_workers, batch):
+            all_results.append(result)
             
-            except Exception as e:
-                print(f"Error evaluating {test_case_name}: {e}")
-                continue
+            # Collect quantitative performance scores
+            if 'quantitative_performance' in result['sections']:
+                quantitative_performance_scores.append(result['sections']['quantitative_performance']['score'])
+            
+            # Collect costs
+            metrics = result.get('metrics', {})
+            total_extraction_cost += metrics.get('extraction_cost', 0)
+            total_formatting_cost += metrics.get('formatting_cost', 0)
         
         # Calculate averages
         summary = {
@@ -425,9 +683,19 @@ class EvalHarness:
         return summary
     
     def save_results(self, results: Dict, output_file: str = "eval_results.json"):
-        """Save evaluation results to JSON file."""
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        """Save evaluation results to JSON file (serialized with orjson when available)."""
+        data = None
+        if orjson:
+            try:
+                data = orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            except TypeError:  # Anything orjson rejects goes through the stdlib encoder
+                pass
+        if data is not None:
+            with open(output_file, 'wb') as f:
+                f.write(data)
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(results, f, indent=2)
         print(f"\n✅ Results saved to {output_file}")
     
     def save_results_csv(self, results: Dict, output_file: str = "eval_results.csv"):
@@ -444,31 +712,19 @@ class EvalHarness:
         """
         import csv
         
-        # Collect latencies for P95 calculation
-        extraction_latencies = []
-        formatting_latencies = []
+        detailed_results = results.get('detailed_results', [])
         
-        for result in results.get('detailed_results', []):
-            metrics = result.get('metrics', {})
-            if 'extraction_latency_ms' in metrics:
-                extraction_latencies.append(metrics['extraction_latency_ms'])
-            if 'formatting_latency_ms' in metrics:
-                formatting_latencies.append(metrics['formatting_latency_ms'])
-        
-        # Calculate P95 latencies (95th percentile)
-        def percentile(data, p):
-            if not data:
-                return 0
-            sorted_data = sorted(data)
-            k = (len(sorted_data) - 1) * p / 100
-            f = int(k)
-            c = k - f
-            if f + 1 < len(sorted_data):
-                return sorted_data[f] * (1 - c) + sorted_data[f + 1] * c
-            return sorted_data[f]
-        
-        extraction_p95 = percentile(extraction_latencies, 95)
-        formatting_p95 = percentile(formatting_latencies, 95)
+        # P95 latencies (95th percentile, linear interpolation) - every row repeats them, so they come first
+        extraction_latencies = np.fromiter(
+            (r['metrics']['extraction_latency_ms'] for r in detailed_results if 'extraction_latency_ms' in r.get('metrics', {})),
+            dtype=np.float64
+        )
+        formatting_latencies = np.fromiter(
+            (r['metrics']['formatting_latency_ms'] for r in detailed_results if 'formatting_latency_ms' in r.get('metrics', {})),
+            dtype=np.float64
+        )
+        extraction_p95 = float(np.percentile(extraction_latencies, 95)) if extraction_latencies.size else 0.0
+        formatting_p95 = float(np.percentile(formatting_latencies, 95)) if formatting_latencies.size else 0.0
         
         with open(output_file, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
@@ -493,7 +749,7 @@ class EvalHarness:
             ])
             
             # Write data rows
-            for result in results.get('detailed_results', []):
+            for result in detailed_results:
                 test_case = result.get('test_case', '')
                 sections = result.get('sections', {})
                 metrics = result.get('metrics', {})
@@ -513,12 +769,12 @@ class EvalHarness:
                 writer.writerow([
                     test_case,
                     f"{qp_section.get('score', 0):.1f}",
-                    qp_section.get('predicted', '').replace('\n', ' ').replace('\r', ' '),
-                    qp_section.get('ground_truth', '').replace('\n', ' ').replace('\r', ' '),
-                    kt_section.get('predicted', '').replace('\n', ' ').replace('\r', ' '),
-                    kt_section.get('ground_truth', '').replace('\n', ' ').replace('\r', ' '),
-                    mc_section.get('predicted', '').replace('\n', ' ').replace('\r', ' '),
-                    mc_section.get('ground_truth', '').replace('\n', ' ').replace('\r', ' '),
+                    _one_line(qp_section.get('predicted', '')),
+                    _one_line(qp_section.get('ground_truth', '')),
+                    _one_line(kt_section.get('predicted', '')),
+                    _one_line(kt_section.get('ground_truth', '')),
+                    _one_line(mc_section.get('predicted', '')),
+                    _one_line(mc_section.get('ground_truth', '')),
                     extraction_tokens,
                     f"{extraction_cost:.4f}",
                     f"{extraction_p95:.2f}",
@@ -539,10 +795,13 @@ def main():
     parser = argparse.ArgumentParser(description='Run evaluation harness on test cases')
     parser.add_argument('test_cases', nargs='*', help='Specific test case names to evaluate (optional)')
     parser.add_argument('--limit', type=int, help='Limit to first N test cases (ignored if specific test cases are provided)')
+    parser.add_argument('--no-cache', action='store_true', help='Re-extract PDF text and re-run the pipeline even for inputs with cached results')
+    parser.add_argument('--workers', type=int, default=EVAL_WORKERS, help=f'Number of test cases to evaluate concurrently (default: {EVAL_WORKERS})')
+    parser.add_argument('--batch', action='store_true', help='Run the pipeline once over all test cases, sharing LLM requests between them')
     
     args = parser.parse_args()
     
-    harness = EvalHarness()
+    harness = EvalHarness(use_cache=not args.no_cache)
     
     # Determine which test cases to evaluate
     if args.test_cases:
@@ -563,7 +822,7 @@ def main():
     print("🚀 Starting Evaluation Harness")
     print("=" * 80)
     
-    results = harness.run_evaluation(test_case_names=test_cases)
+    results = harness.run_evaluation(test_case_names=test_cases, max_workers=args.workers, batch=args.batch)
     
     # Print summary
     print("\n" + "=" * 80)
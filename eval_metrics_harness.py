@@ -16,13 +16,22 @@ Pricing sources:
 """
 
 import csv
+import functools
 import json
 import logging
 import os
 import random
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from config import LLM_CACHE_BYPASS, LLM_CACHE_DIR, LLM_CACHE_TTL_DAYS
+from response_cache import ResponseCache, cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -30,11 +39,39 @@ logger = logging.getLogger(__name__)
 _FAILURE_LOG_COUNT = 0
 _FAILURE_LOG_MAX = 5
 
-from dotenv import load_dotenv
-
+# Only import dotenv when there is a .env to load (local development). This stays at import time
+# because PROVIDER_CONCURRENCY reads the environment when the module loads.
 if os.path.exists(".env"):
+    from dotenv import load_dotenv
     load_dotenv()
 
+try:
+    import orjson
+except ImportError:  # Optional C-accelerated JSON parser; fall back to the stdlib one
+    orjson = None
+
+_json_loads = orjson.loads if orjson else json.loads
+
+try:
+    import ijson
+except ImportError:  # Optional incremental JSON parser for large ground truth files; fall back to json.load
+    ijson = None
+
+# Extracted PDF text, keyed by a digest of the PDF bytes (shared with eval_harness.py)
+PDF_TEXT_CACHE_DIR = Path(".cache") / "pdf_text"
+
+# Reuse cached PDF text and model responses; off with LLM_CACHE_BYPASS=1 or --no-cache
+USE_CACHE = not LLM_CACHE_BYPASS
+
+# Ground truth JSON files larger than this are parsed incrementally (when ijson is installed)
+GROUND_TRUTH_STREAM_MIN_BYTES = 5 * 1024 * 1024
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional: without it numbers in text are extracted with the regex alone
+    NUMBA_AVAILABLE = False
+
 # -----------------------------------------------------------------------------
 # Pricing per 1M tokens (USD). Standard tier for OpenAI; base rates for Anthropic.
 # OpenAI: https://developers.openai.com/api/docs/pricing
@@ -68,15 +105,24 @@ MODELS = [
 ]
 
 
+# (provider, model_id) -> (input, output) price, plus the fallback for models missing from a provider's table
+_PRICING: Dict[Tuple[str, str], Tuple[float, float]] = {
+    (provider, model_id): (d["input"], d["output"])
+    for provider, table in (("openai", OPENAI_STANDARD), ("anthropic", ANTHROPIC_BASE), ("gemini", GEMINI_BASE))
+    for model_id, d in table.items()
+}
+_DEFAULT_PRICING = {
+    "openai": _PRICING[("openai", "gpt-5.2")],
+    "anthropic": _PRICING[("anthropic", "claude-3-haiku-20240307")],
+    "gemini": _PRICING[("gemini", "gemini-2.5-flash")],
+}
+
+
 def get_pricing(model_id: str, provider: str) -> Tuple[float, float]:
-    """Return (input $/1M tokens, output $/1M tokens)."""
-    if provider == "openai":
-        d = OPENAI_STANDARD.get(model_id) or OPENAI_STANDARD.get("gpt-5.2")
-    elif provider == "gemini":
-        d = GEMINI_BASE.get(model_id) or GEMINI_BASE.get("gemini-2.5-flash")
-    else:
-        d = ANTHROPIC_BASE.get(model_id) or ANTHROPIC_BASE.get("claude-3-haiku-20240307")
-    return d["input"], d["output"]
+    """Return (input $/1M tokens, output $/1M tokens). Providers other than openai/gemini use Anthropic prices."""
+    if provider not in ("openai", "gemini"):
+        provider = "anthropic"
+    return _PRICING.get((provider, model_id)) or _DEFAULT_PRICING[provider]
 
 
 # Extraction prompt: three document states — (1) IRR/MOIC/DPI (or TVPI), (2) other performance metrics, (3) no metrics.
@@ -141,39 +187,45 @@ IMPORTANT:
 
 
 
+# Net IRR / Gross IRR / IRR: 15% or ~32%
+_PERF_IRR_RE = re.compile(
+    r"(?:Net|Gross)\s+IRR[:\s]+~?([\d.]+)\s*%|IRR[:\s]+~?([\d.]+)\s*%|"
+    r"Fund Performance:.*?([\d.]+)\s*%\s*Gross IRR|~?([\d.]+)\s*%\s*Gross IRR",
+    re.I
+)
+# Net MOIC/TVPI / Gross TVPI / 2.2× TVPI
+_PERF_MOIC_RE = re.compile(
+    r"(?:Net\s+)?(?:MOIC|TVPI)[:\s]+([\d.]+)\s*[x×]|(?:Gross\s+)?TVPI[:\s]+([\d.]+)\s*[x×]|"
+    r"([\d.]+)\s*[x×]\s*(?:Gross\s+)?(?:TVPI|MOIC)|Fund Performance:\s*([\d.]+)\s*[x×]",
+    re.I
+)
+# Net DPI / DPI
+_PERF_DPI_RE = re.compile(r"Net\s+DPI[:\s]+([\d.]+)\s*[x%]|DPI[:\s]+([\d.]+)\s*[x%]", re.I)
+
+
 def _parse_metrics_from_performance_list(perf: List[str]) -> Dict[str, Optional[float]]:
     """Extract first IRR, MOIC/TVPI, DPI from investment_performance—Net or Gross, MOIC or TVPI."""
+    # Each alternative of the _PERF_* patterns has exactly one (non-empty) group, so lastindex is the value
     out = {"net_irr": None, "net_moic": None, "net_dpi": None}
     for line in perf:
         line = (line or "").strip()
         if not line:
             continue
-        # Net IRR / Gross IRR / IRR: 15% or ~32%
-        m = re.search(
-            r"(?:Net|Gross)\s+IRR[:\s]+~?([\d.]+)\s*%|IRR[:\s]+~?([\d.]+)\s*%|"
-            r"Fund Performance:.*?([\d.]+)\s*%\s*Gross IRR|~?([\d.]+)\s*%\s*Gross IRR",
-            line, re.I
-        )
-        if m and out["net_irr"] is None:
-            val = next((x for x in (m.group(1), m.group(2), m.group(3), m.group(4)) if x), None)
-            if val:
-                out["net_irr"] = float(val.replace(",", ""))
-        # Net MOIC/TVPI / Gross TVPI / 2.2× TVPI
-        m = re.search(
-            r"(?:Net\s+)?(?:MOIC|TVPI)[:\s]+([\d.]+)\s*[x×]|(?:Gross\s+)?TVPI[:\s]+([\d.]+)\s*[x×]|"
-            r"([\d.]+)\s*[x×]\s*(?:Gross\s+)?(?:TVPI|MOIC)|Fund Performance:\s*([\d.]+)\s*[x×]",
-            line, re.I
-        )
-        if m and out["net_moic"] is None:
-            val = next((x for x in (m.group(1), m.group(2), m.group(3), m.group(4)) if x), None)
-            if val:
-                out["net_moic"] = float(val.replace(",", ""))
-        # Net DPI / DPI
-        m = re.search(r"Net\s+DPI[:\s]+([\d.]+)\s*[x%]|DPI[:\s]+([\d.]+)\s*[x%]", line, re.I)
-        if m and out["net_dpi"] is None:
-            val = m.group(1) or m.group(2)
-            if val:
-                out["net_dpi"] = float(val.replace(",", ""))
+        # Each metric keeps its first value, so only search for the ones still missing
+        if out["net_irr"] is None:
+            m = _PERF_IRR_RE.search(line)
+            if m:
+                out["net_irr"] = float(m.group(m.lastindex).replace(",", ""))
+        if out["net_moic"] is None:
+            m = _PERF_MOIC_RE.search(line)
+            if m:
+                out["net_moic"] = float(m.group(m.lastindex).replace(",", ""))
+        if out["net_dpi"] is None:
+            m = _PERF_DPI_RE.search(line)
+            if m:
+                out["net_dpi"] = float(m.group(m.lastindex).replace(",", ""))
+        if None not in out.values():
+            break
     return out
 
 
@@ -183,8 +235,8 @@ def load_ground_truth(path: str) -> Dict[str, Optional[float]]:
     1) Explicit: {"net_irr": 15.5, "net_moic": 2.5, "net_dpi": 1.2} (or null)
     2) Existing: {"investment_performance": ["Net IRR: 15%", "Net MOIC: 1.2x", ...]}
     """
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        data = _json_loads(f.read())
     if "net_irr" in data or "net_moic" in data or "net_dpi" in data:
         out = {
             "net_irr": data.get("net_irr") if data.get("net_irr") is not None else None,
@@ -213,6 +265,34 @@ def _cell_looks_like_metric_label(cell: Any) -> bool:
     )
 
 
+# Cell text (stripped, lowercased) that means "no value"
+_MISSING_VALUE_TEXT = frozenset(("", "n/a", "na", "null", "none"))
+
+
+def _metric_key_for_label(label_upper: str) -> Optional[str]:
+    """Ground-truth field for an uppercased metric label: net_irr, net_moic (MOIC/TVPI), net_dpi, or None."""
+    if "IRR" in label_upper and "MOIC" not in label_upper and "TVPI" not in label_upper:
+        return "net_irr"
+    if "MOIC" in label_upper or "TVPI" in label_upper:
+        return "net_moic"
+    if "DPI" in label_upper:
+        return "net_dpi"
+    return None
+
+
+def _stem(key: str) -> str:
+    """Same as Path(key).stem, without building a Path for plain file names."""
+    if "/" in key or key == ".":
+        return Path(key).stem
+    i = key.rfind(".")
+    return key[:i] if 0 < i < len(key) - 1 else key
+
+
+# float() accepts digit-free text only for these spellings (after an optional sign, any case)
+_DIGIT_RE = re.compile(r"\d")
+_NON_DIGIT_FLOAT_TEXT = frozenset(("inf", "infinity", "nan"))
+
+
 def _cell_looks_like_value(cell: Any) -> bool:
     """True if cell looks like a numeric value (for ground truth)."""
     if cell is None:
@@ -220,10 +300,15 @@ def _cell_looks_like_value(cell: Any) -> bool:
     if isinstance(cell, (int, float)):
         return True
     s = str(cell).strip()
-    if not s or s.lower() in ("n/a", "na", "null", "none", ""):
+    if s.lower() in _MISSING_VALUE_TEXT:
         return False
+    s = s.replace(",", "").replace("%", "").replace("x", "").strip()
+    if not _DIGIT_RE.search(s):
+        # Most label/text cells end here, without raising and catching a ValueError
+        t = s.lower()
+        return (t[1:] if t[:1] in ("+", "-") else t) in _NON_DIGIT_FLOAT_TEXT
     try:
-        float(s.replace(",", "").replace("%", "").replace("x", "").strip())
+        float(s)
         return True
     except ValueError:
         return False
@@ -264,12 +349,9 @@ def _parse_one_sheet_metrics(data_rows: List[Tuple[Any, ...]]) -> Dict[str, Opti
         label_str = str(label_cell).strip() if label_cell else ""
         label_upper = label_str.upper()
         if label_str and _cell_looks_like_metric_label(label_cell):
-            if "IRR" in label_upper and "MOIC" not in label_upper and "TVPI" not in label_upper:
-                metrics["net_irr"] = val
-            elif "MOIC" in label_upper or "TVPI" in label_upper:
-                metrics["net_moic"] = val
-            elif "DPI" in label_upper:
-                metrics["net_dpi"] = val
+            key = _metric_key_for_label(label_upper)
+            if key:
+                metrics[key] = val
             else:
                 metrics["other_metric_label"] = label_str
                 metrics["other_metric_value"] = val
@@ -292,9 +374,8 @@ def _parse_alternating_label_value_ground_truth(rows: List[Tuple[Any, ...]]) ->
     first_cell = rows[0][0] if rows[0] else None
     if not _cell_looks_like_metric_label(first_cell):
         start = 1
-    rows = rows[start:]
     ordered_metrics = []
-    for i in range(0, len(rows) - 1, 2):
+    for i in range(start, len(rows) - 1, 2):
         label_row = rows[i]
         value_row = rows[i + 1]
         if not label_row:
@@ -307,12 +388,9 @@ def _parse_alternating_label_value_ground_truth(rows: List[Tuple[Any, ...]]) ->
         label_str = str(label_cell).strip() if label_cell else ""
         label_upper = label_str.upper()
         if label_str and _cell_looks_like_metric_label(label_cell):
-            if "IRR" in label_upper and "MOIC" not in label_upper and "TVPI" not in label_upper:
-                metrics["net_irr"] = val
-            elif "MOIC" in label_upper or "TVPI" in label_upper:
-                metrics["net_moic"] = val
-            elif "DPI" in label_upper:
-                metrics["net_dpi"] = val
+            key = _metric_key_for_label(label_upper)
+            if key:
+                metrics[key] = val
             else:
                 metrics["other_metric_label"] = label_str
                 metrics["other_metric_value"] = val
@@ -348,31 +426,23 @@ def _parse_transposed_ground_truth(rows: List[Tuple[Any, ...]]) -> Tuple[Dict[st
         doc_id = str(c).strip() if c is not None else ""
         doc_ids.append(doc_id)
     ordered_metrics = [{"net_irr": None, "net_moic": None, "net_dpi": None} for _ in range(n_docs)]
-    for row in rows[1:]:
+    for row in islice(rows, 1, None):
         if not row:
             continue
         label_cell = row[0]
         if not _cell_looks_like_metric_label(label_cell):
             continue
-        label = str(label_cell).strip().upper()
-        for j in range(n_docs):
-            col_idx = j + 1
-            if col_idx >= len(row):
-                continue
-            val = normalize_value(row[col_idx])
-            if "IRR" in label and "MOIC" not in label and "TVPI" not in label:
-                ordered_metrics[j]["net_irr"] = val
-            elif "MOIC" in label or "TVPI" in label:
-                ordered_metrics[j]["net_moic"] = val
-            elif "DPI" in label:
-                ordered_metrics[j]["net_dpi"] = val
+        # The label decides the field for the whole row; a metric label always maps to one
+        key = _metric_key_for_label(str(label_cell).strip().upper())
+        for metrics, cell in zip(ordered_metrics, row[1:n_docs + 1]):
+            metrics[key] = normalize_value(cell)
     result = {}
     gtpdf_values = []
     for j, metrics in enumerate(ordered_metrics):
         doc_id = doc_ids[j] if j < len(doc_ids) else ""
         if doc_id:
             result[doc_id] = metrics
-            stem = Path(doc_id).stem
+            stem = _stem(doc_id)
             if stem != doc_id:
                 result[stem] = metrics
             gtpdf_values.append((doc_id, stem, metrics))
@@ -386,25 +456,28 @@ def _metrics_dict_from_json_metrics(raw: Dict[str, Any]) -> Dict[str, Any]:
     """
     out = {"net_irr": None, "net_moic": None, "net_dpi": None, "other_metric_label": None, "other_metric_value": None}
     for key, val in (raw or {}).items():
-        if key in ("GTPDF", "gtpdf", "pdf", "filename"):
-            continue
-        key_upper = str(key).strip().upper()
-        if val is None:
+        if val is None or key in ("GTPDF", "gtpdf", "pdf", "filename"):
             continue
-        v = val
-        if isinstance(v, str):
-            v = v.strip().rstrip("xX%").strip()
-        num = normalize_value(v)  # handles "1.09x", 0.103, etc.
-        if ("IRR" in key_upper or key_upper.strip().endswith(" IR")) and "MOIC" not in key_upper and "TVPI" not in key_upper:
+        key_str = str(key).strip()
+        key_upper = key_str.upper()
+        # Same classification as the Excel labels, plus truncated "... IR" keys count as IRR
+        if key_upper.endswith(" IR") and "MOIC" not in key_upper and "TVPI" not in key_upper:
+            field = "net_irr"
+        else:
+            field = _metric_key_for_label(key_upper)
+        if field is None and (out["other_metric_value"] is not None or out["other_metric_label"] is not None):
+            continue  # Only the first other metric is kept, so don't normalize the rest
+        if isinstance(val, str):
+            val = val.strip().rstrip("xX%").strip()
+        num = normalize_value(val)  # handles "1.09x", 0.103, etc.
+        if field == "net_irr":
             if num is not None and abs(num) <= 2 and (num != 0):
                 num = round(num * 100, 2)  # 0.103 -> 10.3
             out["net_irr"] = num
-        elif "MOIC" in key_upper or "TVPI" in key_upper:
-            out["net_moic"] = num
-        elif "DPI" in key_upper:
-            out["net_dpi"] = num
+        elif field is not None:
+            out[field] = num
         elif out["other_metric_value"] is None and out["other_metric_label"] is None:
-            out["other_metric_label"] = str(key).strip()
+            out["other_metric_label"] = key_str
             out["other_metric_value"] = num
     return out
 
@@ -415,14 +488,23 @@ def load_ground_truth_from_json(json_path: str) -> Tuple[Dict[str, Dict[str, Opt
     Expected format: { "DocName": { "metrics": { "GTPDF": "filename.pdf", "Net IRR": 0.1, "Net MOIC": "1.2x", ... } }, ... }
     Returns (lookup_dict, gtpdf_values, ordered_metrics) same as Excel loader.
     """
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if ijson is not None and os.path.getsize(json_path) > GROUND_TRUTH_STREAM_MIN_BYTES:
+        # Large file: parse one top-level entry at a time instead of materializing the whole document
+        with open(json_path, "rb") as f:
+            return _ground_truth_from_json_entries(value for _, value in ijson.kvitems(f, "", use_float=True))
+    with open(json_path, "rb") as f:
+        data = _json_loads(f.read())
     if not isinstance(data, dict):
         return {}, [], []
+    return _ground_truth_from_json_entries(data.values())
+
+
+def _ground_truth_from_json_entries(entries: Iterable[Any]) -> Tuple[Dict[str, Dict[str, Optional[float]]], List[Tuple[str, str, Dict[str, Optional[float]]]], List[Dict[str, Optional[float]]]]:
+    """Build (lookup_dict, gtpdf_values, ordered_metrics) from the top-level values of a ground truth JSON."""
     result = {}
     gtpdf_values = []
     ordered_metrics = []
-    for entry in data.values():
+    for entry in entries:
         if not isinstance(entry, dict):
             continue
         metrics_raw = entry.get("metrics") or entry
@@ -435,7 +517,7 @@ def load_ground_truth_from_json(json_path: str) -> Tuple[Dict[str, Dict[str, Opt
         metrics = _metrics_dict_from_json_metrics(metrics_raw)
         ordered_metrics.append(metrics)
         result[key] = metrics
-        stem = Path(key).stem if "." in key else key
+        stem = _stem(key) if "." in key else key
         if stem != key:
             result[stem] = metrics
         gtpdf_values.append((key, stem, metrics))
@@ -444,6 +526,12 @@ def load_ground_truth_from_json(json_path: str) -> Tuple[Dict[str, Dict[str, Opt
     return result, gtpdf_values, ordered_metrics
 
 
+def _peek_rows(ws: Any, n: int) -> Tuple[List[Tuple[Any, ...]], Iterator[Tuple[Any, ...]]]:
+    """First n rows of a worksheet as a list, plus the iterator positioned at the row after them."""
+    it = ws.iter_rows(values_only=True)
+    return list(islice(it, n)), it
+
+
 def load_ground_truth_from_excel(excel_path: str) -> Tuple[Dict[str, Dict[str, Optional[float]]], List[Tuple[str, str, Dict[str, Optional[float]]]], List[Dict[str, Optional[float]]]]:
     """
     Load ground truth from an Excel file. Returns (lookup_dict, gtpdf_values, ordered_metrics).
@@ -468,11 +556,11 @@ def load_ground_truth_from_excel(excel_path: str) -> Tuple[Dict[str, Dict[str, O
         skipped_no_rows = 0
         used_sheet_title = 0
         for ws in sheets:
-            rows = list(ws.iter_rows(values_only=True))
-            if not rows:
+            head, rest = _peek_rows(ws, 1)
+            if not head:
                 skipped_no_rows += 1
                 continue
-            raw_key = rows[0][0] if rows[0] else None
+            raw_key = head[0][0] if head[0] else None
             if raw_key is not None:
                 key = str(raw_key).strip()
             else:
@@ -481,10 +569,10 @@ def load_ground_truth_from_excel(excel_path: str) -> Tuple[Dict[str, Dict[str, O
                 # Fallback: use sheet title so we don't skip tabs with empty A1 (e.g. read_only or blank cell)
                 key = (ws.title or "").strip() or f"Sheet_{len(gtpdf_values)}"
                 used_sheet_title += 1
-            metrics = _parse_one_sheet_metrics(rows[1:])
+            metrics = _parse_one_sheet_metrics(list(rest))
             ordered_metrics.append(metrics)
             result[key] = metrics
-            stem = Path(key).stem if "." in key else key
+            stem = _stem(key) if "." in key else key
             if stem != key:
                 result[stem] = metrics
             gtpdf_values.append((key, stem, metrics))
@@ -498,7 +586,8 @@ def load_ground_truth_from_excel(excel_path: str) -> Tuple[Dict[str, Dict[str, O
         return result, gtpdf_values, ordered_metrics
 
     # Single sheet: standard table (GTPDF column) or alternating/transposed
-    rows = list(wb.active.iter_rows(values_only=True))
+    # Layout detection only needs the first three rows; the standard layout streams the rest
+    rows, rest = _peek_rows(wb.active, 3)
     if not rows:
         wb.close()
         return {}, [], []
@@ -517,13 +606,18 @@ def load_ground_truth_from_excel(excel_path: str) -> Tuple[Dict[str, Dict[str, O
         irr_col = col_index("net_irr") or next((i for i, h in enumerate(header) if h and "irr" in h), None)
         moic_col = col_index("net_moic") or next((i for i, h in enumerate(header) if h and ("moic" in h or "tvpi" in h)), None)
         dpi_col = col_index("net_dpi") or next((i for i, h in enumerate(header) if h and "dpi" in h), None)
+        # -1 = no such column, so the row loop only needs a bounds check
+        irr_col = -1 if irr_col is None else irr_col
+        moic_col = -1 if moic_col is None else moic_col
+        dpi_col = -1 if dpi_col is None else dpi_col
         result = {}
         gtpdf_values = []
         ordered_metrics = []
-        for row in rows[1:]:
-            irr = normalize_value(row[irr_col] if irr_col is not None and irr_col < len(row) else None)
-            moic = normalize_value(row[moic_col] if moic_col is not None and moic_col < len(row) else None)
-            dpi = normalize_value(row[dpi_col] if dpi_col is not None and dpi_col < len(row) else None)
+        for row in chain(islice(rows, 1, None), rest):
+            n = len(row)
+            irr = normalize_value(row[irr_col]) if 0 <= irr_col < n else None
+            moic = normalize_value(row[moic_col]) if 0 <= moic_col < n else None
+            dpi = normalize_value(row[dpi_col]) if 0 <= dpi_col < n else None
             metrics = {"net_irr": irr, "net_moic": moic, "net_dpi": dpi}
             ordered_metrics.append(metrics)
             if not row or id_col >= len(row):
@@ -535,7 +629,7 @@ def load_ground_truth_from_excel(excel_path: str) -> Tuple[Dict[str, Dict[str, O
             if not key:
                 continue
             result[key] = metrics
-            stem = Path(key).stem if "." in key else key
+            stem = _stem(key) if "." in key else key
             if stem != key:
                 result[stem] = metrics
             gtpdf_values.append((key, stem, metrics))
@@ -551,7 +645,8 @@ def load_ground_truth_from_excel(excel_path: str) -> Tuple[Dict[str, Dict[str, O
         return sum(1 for c in (row or []) if _cell_looks_like_value(c))
     row0_label = rows[0][0] if rows[0] else None
     row1_label = rows[1][0] if len(rows) > 1 and rows[1] else None
-    n_cols = max(len(r) for r in rows) if rows else 0
+    # The remaining layouts parse the whole sheet
+    rows.extend(rest)
     if _cell_looks_like_metric_label(row0_label) and len(rows) > 1 and _value_in_row(rows[1]):
         print("Using Excel alternating layout (for each PDF: one row = metric label, next row = value).")
         wb.close()
@@ -564,7 +659,7 @@ def load_ground_truth_from_excel(excel_path: str) -> Tuple[Dict[str, Dict[str, O
         print("Using Excel alternating layout (for each PDF: one row = metric label, next row = value).")
         wb.close()
         return _parse_alternating_label_value_ground_truth(rows)
-    if _cell_looks_like_metric_label(row1_label) and n_cols > 2:
+    if _cell_looks_like_metric_label(row1_label) and max(len(r) for r in rows) > 2:
         print("Using Excel label-value layout (metric names in first column, one document per column).")
         wb.close()
         return _parse_transposed_ground_truth(rows)
@@ -582,7 +677,7 @@ def normalize_value(val: Any) -> Optional[float]:
         return float(val) if (val == val) else None  # skip NaN
     if isinstance(val, str):
         s = val.strip().lower()
-        if s in ("", "n/a", "na", "null", "none"):
+        if s in _MISSING_VALUE_TEXT:
             return None
         try:
             return float(s.replace(",", "").rstrip("xX%").strip())
@@ -621,24 +716,50 @@ OTHER_LABEL_TO_CANONICAL: Dict[str, str] = {
     "gmv": "gmv",
     "spread": "yield",  # spread in bps often reported as yield-like
 }
+# OTHER_LABEL_TO_CANONICAL keyed by lookup form (see _normalize_label_for_lookup): a direct underscore
+# key wins, otherwise the space-separated key it stands for
+_OTHER_LABEL_LOOKUP: Dict[str, str] = {k: v for k, v in OTHER_LABEL_TO_CANONICAL.items() if " " not in k}
+for _label, _key in OTHER_LABEL_TO_CANONICAL.items():
+    if "_" not in _label:
+        _OTHER_LABEL_LOOKUP.setdefault(_label.replace(" ", "_"), _key)
+del _label, _key
+
+_LABEL_PUNCTUATION_RE = re.compile(r"[^\w\s]")
 
 
 def canonicalize_label(label: str) -> str:
     """Normalize GT and model labels: lowercase, strip punctuation, collapse whitespace. For lookup only."""
     if not label or not str(label).strip():
         return ""
-    s = re.sub(r"[^\w\s]", " ", str(label).lower())
-    return " ".join(s.split()).strip()
+    s = _LABEL_PUNCTUATION_RE.sub(" ", str(label).lower())
+    return " ".join(s.split())
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalize_label_for_lookup(label: str) -> str:
-    """Normalize a metric label for lookup in OTHER_LABEL_TO_CANONICAL (canonicalize then underscore)."""
+    """Normalize a metric label for lookup in OTHER_LABEL_TO_CANONICAL (canonicalize then underscore). Memoized: labels repeat across documents and models."""
     c = canonicalize_label(label)
     if not c:
         return ""
     return c.replace(" ", "_")
 
 
+# New-schema metric fields read straight into the canonical dict by normalize_prediction
+_NEW_SCHEMA_KEYS = (
+    "current_yield", "income_distribution_rate", "gross_annualized_debt_itd_portfolio_yield",
+    "total_distributions", "unrealized_value", "closing_date_dec_3_month", "yield", "ytd_whcm", "gmv",
+)
+
+
+def _first_normalized_value(d: Dict[str, Any], *keys: str) -> Optional[float]:
+    """normalize_value of the first of keys whose value normalizes to a number (0 included), else None."""
+    for key in keys:
+        value = normalize_value(d.get(key))
+        if value is not None:
+            return value
+    return None
+
+
 def normalize_prediction(pred_json: Dict[str, Any]) -> Dict[str, Optional[float]]:
     """
     Map raw model JSON (old or new schema) to canonical dict with keys in CANONICAL_KEYS.
@@ -648,30 +769,24 @@ def normalize_prediction(pred_json: Dict[str, Any]) -> Dict[str, Optional[float]
     if not pred_json or not isinstance(pred_json, dict):
         return {k: None for k in CANONICAL_KEYS}
     out: Dict[str, Optional[float]] = {k: None for k in CANONICAL_KEYS}
-    # Core metrics: new key else old key
-    out["irr"] = normalize_value(pred_json.get("irr") or pred_json.get("net_irr"))
-    out["moic"] = normalize_value(pred_json.get("moic") or pred_json.get("net_moic"))
-    out["dpi"] = normalize_value(pred_json.get("dpi") or pred_json.get("net_dpi"))
-    out["tvpi"] = normalize_value(pred_json.get("tvpi") or pred_json.get("net_tvpi"))
+    # Core metrics: new key else old key (a reported 0 is a value, so only a missing/unparseable new key falls back)
+    out["irr"] = _first_normalized_value(pred_json, "irr", "net_irr")
+    out["moic"] = _first_normalized_value(pred_json, "moic", "net_moic")
+    out["dpi"] = _first_normalized_value(pred_json, "dpi", "net_dpi")
+    out["tvpi"] = _first_normalized_value(pred_json, "tvpi", "net_tvpi")
     # New-schema named fields
-    for key in ["current_yield", "income_distribution_rate", "gross_annualized_debt_itd_portfolio_yield",
-                "total_distributions", "unrealized_value", "closing_date_dec_3_month", "yield", "ytd_whcm", "gmv"]:
-        if key in pred_json and pred_json[key] is not None:
-            out[key] = normalize_value(pred_json[key])
+    for key in _NEW_SCHEMA_KEYS:
+        value = pred_json.get(key)
+        if value is not None:
+            out[key] = normalize_value(value)
     # Old other_metric_label / other_metric_value -> map to canonical key
     ol = pred_json.get("other_metric_label")
     ov = pred_json.get("other_metric_value")
     if ol is not None and str(ol).strip() and ov is not None:
-        norm_label = _normalize_label_for_lookup(str(ol))
-        canonical_key = OTHER_LABEL_TO_CANONICAL.get(norm_label)
+        # Also matches labels like "current yield" -> current_yield via the space-separated keys
+        canonical_key = _OTHER_LABEL_LOOKUP.get(_normalize_label_for_lookup(str(ol)))
         if canonical_key and out.get(canonical_key) is None:
             out[canonical_key] = normalize_value(ov)
-        # Also try label as "current yield" -> current_yield via space-sep
-        if not canonical_key:
-            space_key = norm_label.replace("_", " ")
-            canonical_key = OTHER_LABEL_TO_CANONICAL.get(space_key)
-            if canonical_key and out.get(canonical_key) is None:
-                out[canonical_key] = normalize_value(ov)
     return out
 
 
@@ -679,13 +794,19 @@ def resolve_other_pred_from_canon(canon: Dict[str, Optional[float]], gt_other_la
     """Given GT's other_metric_label, return the predicted value from canonical dict."""
     if not gt_other_label or not str(gt_other_label).strip():
         return None
-    norm = _normalize_label_for_lookup(str(gt_other_label))
-    key = OTHER_LABEL_TO_CANONICAL.get(norm) or OTHER_LABEL_TO_CANONICAL.get(norm.replace("_", " "))
+    key = _OTHER_LABEL_LOOKUP.get(_normalize_label_for_lookup(str(gt_other_label)))
     if key:
         return canon.get(key)
     return None
 
 
+# Metric kinds reported as percentages, where pred and gt may disagree on fraction vs percent
+_RATE_METRICS = frozenset({
+    "irr", "current_yield", "income_distribution_rate", "gross_annualized_debt_itd_portfolio_yield",
+    "yield", "ytd_whcm", "total_distributions", "unrealized_value", "closing_date_dec_3_month",
+})
+
+
 def unit_normalize_pred(
     pred_val: Optional[float],
     gt_val: Optional[float],
@@ -701,12 +822,10 @@ def unit_normalize_pred(
     """
     if pred_val is None:
         return None
-    rate_metrics = {"irr", "current_yield", "income_distribution_rate", "gross_annualized_debt_itd_portfolio_yield",
-                    "yield", "ytd_whcm", "total_distributions", "unrealized_value", "closing_date_dec_3_month"}
     # bps: raw label/text includes "bp" or "bps" -> pred is in bps, convert to percent
-    if label_hint and ("bp" in label_hint.lower() or "bps" in label_hint.lower()):
+    if label_hint and "bp" in label_hint.lower():
         pred_val = pred_val / 100.0
-    if metric_kind not in rate_metrics:
+    if metric_kind not in _RATE_METRICS:
         return pred_val
     if gt_val is None:
         return pred_val
@@ -731,23 +850,92 @@ def values_match(gt: Optional[float], pred: Optional[float], tolerance: float =
 
 
 # Regex to find numeric values in text (percent, multiple, or plain float). Liberal extraction for scoring.
-_RE_NUMERIC_IN_TEXT = re.compile(
-    r"-?\d+(?:,\d{3})*(?:\.\d+)?\s*[%x×]?|-?\d+\.\d+"
-)
+# Only the number itself: a unit suffix (%, x, ×) never starts a number, so leaving it unmatched finds the same values
+_RE_NUMERIC_IN_TEXT = re.compile(r"-?\d+(?:,\d{3})*(?:\.\d+)?")
+
+
+# Strings at least this long (e.g. whole raw responses) are scanned by the Numba kernel when available
+_NUMBA_SCAN_MIN_CHARS = 128
+_ASCII_BYTES = bytes(range(128))
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _scan_numbers_nb(buf):
+        """
+        Byte-level equivalent of _RE_NUMERIC_IN_TEXT.finditer over ASCII digits.
+
+        Args:
+            buf: uint8 array of UTF-8 text
+
+        Returns:
+            (values, starts, ends, exact): float64 value, byte span and whether the value is exactly
+            rounded (at most 15 significant digits) for each match, in order
+        """
+        n = buf.shape[0]
+        cap = n // 2 + 1
+        values = np.empty(cap, dtype=np.float64)
+        starts = np.empty(cap, dtype=np.int64)
+        ends = np.empty(cap, dtype=np.int64)
+        exact = np.empty(cap, dtype=np.bool_)
+        count = 0
+        i = 0
+        while i < n:
+            start = i
+            negative = False
+            if buf[i] == 45 and i + 1 < n and 48 <= buf[i + 1] <= 57:  # "-" before a digit
+                negative = True
+                i += 1
+            elif not 48 <= buf[i] <= 57:
+                i += 1
+                continue
+            mantissa = 0
+            digits = 0
+            while i < n and 48 <= buf[i] <= 57:
+                if digits < 18:
+                    mantissa = mantissa * 10 + (buf[i] - 48)
+                digits += 1
+                i += 1
+            # Thousands groups: "," followed by exactly three digits
+            while (i + 3 < n and buf[i] == 44 and 48 <= buf[i + 1] <= 57
+                   and 48 <= buf[i + 2] <= 57 and 48 <= buf[i + 3] <= 57):
+                for k in range(1, 4):
+                    if digits < 18:
+                        mantissa = mantissa * 10 + (buf[i + k] - 48)
+                    digits += 1
+                i += 4
+            fraction_digits = 0
+            if i + 1 < n and buf[i] == 46 and 48 <= buf[i + 1] <= 57:
+                i += 1
+                while i < n and 48 <= buf[i] <= 57:
+                    if digits < 18:
+                        mantissa = mantissa * 10 + (buf[i] - 48)
+                    digits += 1
+                    fraction_digits += 1
+                    i += 1
+            value = mantissa / 10.0 ** fraction_digits
+            values[count] = -value if negative else value
+            starts[count] = start
+            ends[count] = i
+            exact[count] = digits <= 15
+            count += 1
+        return values[:count], starts[:count], ends[:count], exact[:count]
 
 
 def _numbers_from_string(s: str) -> List[float]:
     """Extract numeric values from a string (e.g. 'Net IRR: 15.5%' or 'MOIC 1.2x'). Returns list of floats."""
-    out: List[float] = []
     if not s or not isinstance(s, str):
-        return out
-    for m in _RE_NUMERIC_IN_TEXT.finditer(s):
-        raw = m.group(0).strip().rstrip("%x×X").replace(",", "").strip()
-        try:
-            out.append(float(raw))
-        except ValueError:
-            continue
-    return out
+        return []
+    if NUMBA_AVAILABLE and len(s) >= _NUMBA_SCAN_MIN_CHARS:
+        buf = s.encode("utf-8")
+        # The kernel only knows ASCII digits; \d also matches other Unicode digits, so leave those to the regex
+        if s.isascii() or not _DIGIT_RE.search(buf.translate(None, _ASCII_BYTES).decode("utf-8")):
+            values, starts, ends, exact = _scan_numbers_nb(np.frombuffer(buf, dtype=np.uint8))
+            numbers = values.tolist()
+            # Long digit runs can't be built exactly in a float64 mantissa; parse those spans with float()
+            for k in np.flatnonzero(~exact).tolist():
+                numbers[k] = float(buf[starts[k]:ends[k]].replace(b",", b""))
+            return numbers
+    return [float(m.group().replace(",", "")) for m in _RE_NUMERIC_IN_TEXT.finditer(s)]
 
 
 def extract_all_performance_numbers(data: Dict[str, Any]) -> List[float]:
@@ -777,27 +965,68 @@ def extract_all_performance_numbers(data: Dict[str, Any]) -> List[float]:
     return numbers
 
 
+# Below this many extracted numbers a plain loop beats building and scanning a NumPy array
+_VECTOR_MATCH_MIN_NUMBERS = 32
+
+
+def _match_numbers(numbers: List[float]) -> Union[List[float], np.ndarray]:
+    """Numbers in the form gt_value_appears_in_set scans fastest (float64 array for long lists); convert once per row."""
+    if len(numbers) >= _VECTOR_MATCH_MIN_NUMBERS:
+        return np.asarray(numbers, dtype=np.float64)
+    return numbers
+
+
 def gt_value_appears_in_set(
     gt_val: Optional[float],
-    numbers: List[float],
+    numbers: Union[List[float], np.ndarray],
     tolerance: float = 0.01,
     allow_scale_flex: bool = False,
 ) -> bool:
     """
     True if gt_val is None or if some value in numbers matches gt_val within tolerance.
     allow_scale_flex: for rate-like metrics (IRR, yield), also accept n*100 or n/100 as match.
+    numbers: list of floats, or a float64 array (see _match_numbers) for long lists.
     """
     if gt_val is None:
         return True
+    if isinstance(numbers, np.ndarray) or len(numbers) >= _VECTOR_MATCH_MIN_NUMBERS:
+        arr = np.asarray(numbers, dtype=np.float64)
+        # inf/NaN in the extracted numbers just fail to match, as in the scalar loop
+        with np.errstate(invalid="ignore", over="ignore"):
+            hit = np.abs(arr - gt_val) <= tolerance
+            if allow_scale_flex:
+                hit |= np.abs(arr * 100.0 - gt_val) <= tolerance
+                hit |= np.abs(arr / 100.0 - gt_val) <= tolerance
+        return bool(hit.any())
     for n in numbers:
-        if values_match(gt_val, n, tolerance):
+        if abs(gt_val - n) <= tolerance:
             return True
         if allow_scale_flex:
-            if values_match(gt_val, n * 100.0, tolerance) or values_match(gt_val, n / 100.0, tolerance):
+            if abs(gt_val - n * 100.0) <= tolerance or abs(gt_val - n / 100.0) <= tolerance:
                 return True
     return False
 
 
+# GT fields scored by liberal matching (net IRR, MOIC, DPI and the "other" metric value)
+_GT_METRIC_KEYS = ("net_irr", "net_moic", "net_dpi", "other_metric_value")
+
+
+def gt_matches_in_numbers(gt: Dict[str, Any], numbers: List[float], tolerance: float = 0.01) -> Tuple[int, int, int, int]:
+    """
+    Binary (irr, moic, dpi, other) matches of the GT values against numbers; 1 when that GT value is None.
+    IRR and the other metric accept n*100 or n/100 (see gt_value_appears_in_set).
+    """
+    match_numbers = _match_numbers(numbers)
+    return tuple(
+        1 if gt_value_appears_in_set(gt.get(key), match_numbers, tolerance, allow_scale_flex=flex) else 0
+        for key, flex in zip(_GT_METRIC_KEYS, (True, False, False, True))
+    )
+
+
+# Whole lines models put before the JSON object (compared lowercased and stripped)
+_JSON_PREFIX_NOISE = frozenset({"[json]", "json", "json:", "here is the json:", "here is the data:"})
+
+
 def _strip_json_prefixed_junk(text: str) -> str:
     """Remove common non-JSON prefixes so the first { is the start of the object."""
     if not text:
@@ -806,7 +1035,7 @@ def _strip_json_prefixed_junk(text: str) -> str:
     lines = text.split("\n")
     while lines:
         line = lines[0].strip().lower()
-        if not line or line in ("[json]", "json", "json:", "here is the json:", "here is the data:"):
+        if not line or line in _JSON_PREFIX_NOISE:
             lines.pop(0)
             continue
         if line.startswith("json:") or line.startswith("```json"):
@@ -818,8 +1047,12 @@ def _strip_json_prefixed_junk(text: str) -> str:
     return "\n".join(lines).strip()
 
 
-def _extract_first_json_object(text: str) -> Optional[str]:
-    """Extract the first complete JSON object (handles nested braces). Returns substring or None."""
+_RE_BRACE = re.compile(r"[{}]")
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _json_search_text(text: str) -> str:
+    """Response text with code fences and leading "json:"-style junk removed, so the object is the first {."""
     text = (text or "").strip()
     if "```json" in text.lower():
         start = text.lower().find("```json") + 7
@@ -833,18 +1066,24 @@ def _extract_first_json_object(text: str) -> Optional[str]:
         if end == -1:
             end = len(text)
         text = text[start:end].strip()
-    text = _strip_json_prefixed_junk(text)
+    return _strip_json_prefixed_junk(text)
+
+
+def _extract_first_json_object(text: str) -> Optional[str]:
+    """Extract the first complete JSON object (handles nested braces). Returns substring or None."""
+    text = _json_search_text(text)
     start = text.find("{")
     if start == -1:
         return None
+    # Visit only the braces (the regex engine skips everything in between)
     depth = 0
-    for i in range(start, len(text)):
-        if text[i] == "{":
+    for m in _RE_BRACE.finditer(text, start):
+        if m.group() == "{":
             depth += 1
-        elif text[i] == "}":
+        else:
             depth -= 1
             if depth == 0:
-                return text[start : i + 1]
+                return text[start : m.end()]
     return None
 
 
@@ -859,19 +1098,30 @@ def _try_parse_json(snippet: str) -> Tuple[Optional[Dict[str, Any]], Optional[st
         return None, str(e)
 
 
+# JSON repair patterns used by extract_json_from_response
+_RE_INVALID_ESCAPE = re.compile(r'\\(?!["\\/bfnrt]|u[0-9a-fA-F]{4})(.)')
+# Trailing comma before a closing brace / bracket (common LLM mistake)
+_RE_TRAILING_COMMA_OBJ = re.compile(r",\s*}")
+_RE_TRAILING_COMMA_ARR = re.compile(r",\s*]")
+# "net_irr": 26.0 or "net_irr": null, for truncated responses
+_RE_PARTIAL_KEY = {
+    key: re.compile(rf'"{re.escape(key)}"\s*:\s*(-?\d+\.?\d*|null)')
+    for key in ("net_irr", "net_moic", "net_dpi")
+}
+
+
 def _repair_invalid_escapes(snippet: str) -> str:
     """Fix Invalid \\escape: in JSON only \\ \" \\/ \\b \\f \\n \\r \\t \\uXXXX are valid. Replace \\+other with the other character."""
     # Match \ not followed by valid escape; replace with just the next char. Allow \u only when +4 hex digits.
-    return re.sub(r'\\(?!["\\/bfnrt]|u[0-9a-fA-F]{4})(.)', r'\1', snippet)
+    return _RE_INVALID_ESCAPE.sub(r'\1', snippet)
 
 
 def _extract_partial_json(raw: str) -> Dict[str, Any]:
     """When response is truncated (no complete { }), extract net_irr, net_moic, net_dpi from raw text with regex."""
     out: Dict[str, Any] = {}
     # Prefer the first occurrence of each key (in case of duplicated/malformed content)
-    for key in ("net_irr", "net_moic", "net_dpi"):
-        # Match "net_irr": 26.0 or "net_irr": null
-        m = re.search(rf'"{re.escape(key)}"\s*:\s*(-?\d+\.?\d*|null)', raw)
+    for key, pattern in _RE_PARTIAL_KEY.items():
+        m = pattern.search(raw)
         if m:
             val = m.group(1)
             if val == "null":
@@ -888,6 +1138,20 @@ def extract_json_from_response(content: str) -> Tuple[Dict[str, Any], Optional[s
     """Parse JSON from model response. Returns (data, parse_error). parse_error is None on success.
     Tries: extract object, parse; fix trailing commas; fix invalid escapes; if no object, extract partial (truncated)."""
     raw = (content or "").strip()
+    # Well-formed responses: parse the first object in one pass, ignoring anything after it
+    text = _json_search_text(raw)
+    start = text.find("{")
+    if start != -1:
+        # Usually the reply is exactly the object: orjson (when installed) parses it about twice as fast
+        if orjson is not None and text.endswith("}"):
+            try:
+                return orjson.loads(text[start:] if start else text), None
+            except orjson.JSONDecodeError:
+                pass  # Trailing prose, NaN, lone surrogates, ...: raw_decode below decides
+        try:
+            return _JSON_DECODER.raw_decode(text, start)[0], None
+        except ValueError:
+            pass  # Malformed; fall through to brace matching and the repairs below
     snippet = _extract_first_json_object(raw)
     if not snippet:
         # Truncated response: try to extract net_irr, net_moic, net_dpi from raw text
@@ -908,8 +1172,8 @@ def extract_json_from_response(content: str) -> Tuple[Dict[str, Any], Optional[s
         if data is not None:
             return data, None
     # Common LLM mistake: trailing comma before } or ]
-    fixed = re.sub(r",\s*}", "}", snippet)
-    fixed = re.sub(r",\s*]", "]", fixed)
+    fixed = _RE_TRAILING_COMMA_OBJ.sub("}", snippet)
+    fixed = _RE_TRAILING_COMMA_ARR.sub("]", fixed)
     data, _ = _try_parse_json(fixed)
     if data is not None:
         return data, None
@@ -931,17 +1195,37 @@ def extract_numbers_from_raw_response(raw_response: str) -> List[float]:
     return _numbers_from_string(raw_response or "")
 
 
-def run_openai(
+# Document text beyond this many characters is not sent to the models
+MAX_DOCUMENT_CHARS = 200000
+
+
+def _document_user_content(pdf_text: str) -> str:
+    """User message for one document. The text is sliced (copied) only when it exceeds MAX_DOCUMENT_CHARS."""
+    if len(pdf_text) > MAX_DOCUMENT_CHARS:
+        pdf_text = pdf_text[:MAX_DOCUMENT_CHARS]
+    return f"Document text:\n\n{pdf_text}"
+
+
+def _run_completion(
     model_id: str,
-    pdf_text: str,
+    provider: str,
+    user_content: str,
     api_key: Optional[str] = None,
-) -> Tuple[Dict[str, Optional[float]], int, int]:
-    """Call OpenAI chat completion. Returns (parsed_metrics, input_tokens, output_tokens)."""
+) -> Tuple[Dict[str, Optional[float]], int, int, str, bool, Optional[str], Dict[str, Any]]:
+    """Send user_content and parse the reply. Returns (parsed_metrics, input_tokens, output_tokens, raw_response, parse_ok, parse_error, raw_parsed_data)."""
+    text, in_t, out_t = _complete(model_id, provider, user_content, api_key=api_key)
+    data, parse_error = extract_json_from_response(text)
+    parse_ok = parse_error is None
+    canon = normalize_prediction(data)
+    return canon, in_t, out_t, text, parse_ok, parse_error, data
+
+
+def _complete_openai(model_id: str, user_content: str, api_key: Optional[str] = None) -> Tuple[str, int, int]:
+    """Send EXTRACTION_PROMPT + user_content to OpenAI chat completion. Returns (response_text, input_tokens, output_tokens)."""
     import openai
     client = openai.OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
     if not client.api_key:
         raise ValueError("OPENAI_API_KEY not set")
-    user_content = f"Document text:\n\n{pdf_text[:200000]}"
     # gpt-5-mini and gpt-5-nano only support default temperature (1), not 0
     kwargs = {
         "model": model_id,
@@ -957,26 +1241,27 @@ def run_openai(
     usage = getattr(response, "usage", None)
     input_tokens = getattr(usage, "prompt_tokens", 0) or 0
     output_tokens = getattr(usage, "completion_tokens", 0) or 0
-    data, parse_error = extract_json_from_response(content)
-    parse_ok = parse_error is None
-    canon = normalize_prediction(data)
-    return canon, input_tokens, output_tokens, content, parse_ok, parse_error, data
+    return content, input_tokens, output_tokens
 
 
-def run_anthropic(
+def run_openai(
     model_id: str,
     pdf_text: str,
     api_key: Optional[str] = None,
 ) -> Tuple[Dict[str, Optional[float]], int, int]:
-    """Call Anthropic messages API. Returns (parsed_metrics, input_tokens, output_tokens)."""
+    """Call OpenAI chat completion. Returns (parsed_metrics, input_tokens, output_tokens)."""
+    return _run_completion(model_id, "openai", _document_user_content(pdf_text), api_key)
+
+
+def _complete_anthropic(model_id: str, user_content: str, api_key: Optional[str] = None, max_tokens: int = 1024) -> Tuple[str, int, int]:
+    """Send EXTRACTION_PROMPT + user_content to the Anthropic messages API. Returns (response_text, input_tokens, output_tokens)."""
     import anthropic
     client = anthropic.Anthropic(api_key=api_key or os.getenv("ANTHROPIC_API_KEY"))
     if not client.api_key:
         raise ValueError("ANTHROPIC_API_KEY not set")
-    user_content = f"Document text:\n\n{pdf_text[:200000]}"
     message = client.messages.create(
         model=model_id,
-        max_tokens=1024,
+        max_tokens=max_tokens,
         system=EXTRACTION_PROMPT,
         messages=[{"role": "user", "content": user_content}],
     )
@@ -991,22 +1276,23 @@ def run_anthropic(
         out_t = getattr(input_tokens, "output_tokens", 0) or 0
     else:
         in_t, out_t = 0, 0
-    data, parse_error = extract_json_from_response(text)
-    parse_ok = parse_error is None
-    canon = normalize_prediction(data)
-    return canon, in_t, out_t, text, parse_ok, parse_error, data
+    return text, in_t, out_t
 
 
-def run_gemini(
+def run_anthropic(
     model_id: str,
     pdf_text: str,
     api_key: Optional[str] = None,
 ) -> Tuple[Dict[str, Optional[float]], int, int]:
-    """Call Google Gemini API. Uses google-genai SDK if available, else google-generativeai."""
+    """Call Anthropic messages API. Returns (parsed_metrics, input_tokens, output_tokens)."""
+    return _run_completion(model_id, "anthropic", _document_user_content(pdf_text), api_key)
+
+
+def _complete_gemini(model_id: str, user_content: str, api_key: Optional[str] = None) -> Tuple[str, int, int]:
+    """Send EXTRACTION_PROMPT + user_content to Google Gemini. Returns (response_text, input_tokens, output_tokens)."""
     key = api_key or os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
     if not key:
         raise ValueError("GOOGLE_API_KEY or GEMINI_API_KEY not set")
-    user_content = f"Document text:\n\n{pdf_text[:200000]}"
     full_prompt = f"{EXTRACTION_PROMPT}\n\n{user_content}"
 
     # Prefer new SDK (google-genai); fall back to deprecated google-generativeai if import fails
@@ -1044,11 +1330,16 @@ def run_gemini(
         usage = getattr(response, "usage_metadata", None)
         in_t = int(getattr(usage, "prompt_token_count", 0) or 0)
         out_t = int(getattr(usage, "candidates_token_count", 0) or getattr(usage, "output_token_count", 0) or 0)
+    return text, in_t, out_t
 
-    data, parse_error = extract_json_from_response(text)
-    parse_ok = parse_error is None
-    canon = normalize_prediction(data)
-    return canon, in_t, out_t, text, parse_ok, parse_error, data
+
+def run_gemini(
+    model_id: str,
+    pdf_text: str,
+    api_key: Optional[str] = None,
+) -> Tuple[Dict[str, Optional[float]], int, int]:
+    """Call Google Gemini API. Uses google-genai SDK if available, else google-generativeai."""
+    return _run_completion(model_id, "gemini", _document_user_content(pdf_text), api_key)
 
 
 def _raise_gemini_quota_if_429(e: Exception) -> None:
@@ -1065,21 +1356,202 @@ def run_model(
     model_id: str,
     provider: str,
     pdf_text: str,
+    user_content: Optional[str] = None,
 ) -> Tuple[Dict[str, Optional[float]], int, int, float, str, bool, Optional[str], Dict[str, Any]]:
-    """Run one model. Returns (canonical_metrics, input_tokens, output_tokens, cost_usd, raw_response, parse_ok, parse_error, raw_parsed_data)."""
-    raw = ""
-    parse_ok = False
-    parse_error: Optional[str] = "unknown"
-    data: Dict[str, Any] = {}
+    """
+    Run one model. Returns (canonical_metrics, input_tokens, output_tokens, cost_usd, raw_response, parse_ok, parse_error, raw_parsed_data).
+    user_content: _document_user_content(pdf_text) when the caller already built it (shared by every model on a document).
+    """
+    if user_content is None:
+        user_content = _document_user_content(pdf_text)
+    canon, in_t, out_t, raw, parse_ok, parse_error, data = _run_completion(model_id, provider, user_content)
+    in_per_m, out_per_m = get_pricing(model_id, provider)
+    cost = (in_t / 1_000_000 * in_per_m) + (out_t / 1_000_000 * out_per_m)
+    return canon, in_t, out_t, cost, raw, parse_ok, parse_error, data
+
+
+# Maximum in-flight requests per provider, shared by every document and model being evaluated
+PROVIDER_CONCURRENCY = {
+    "openai": int(os.getenv("OPENAI_MAX_CONCURRENCY", "8")),
+    "anthropic": int(os.getenv("ANTHROPIC_MAX_CONCURRENCY", "4")),
+    "gemini": int(os.getenv("GEMINI_MAX_CONCURRENCY", "4")),
+}
+_PROVIDER_SEMAPHORES = {provider: threading.BoundedSemaphore(max(1, n)) for provider, n in PROVIDER_CONCURRENCY.items()}
+
+
+def run_models(pdf_text: str) -> List[Union[Tuple[Dict[str, Optional[float]], int, int, float, str, bool, Optional[str], Dict[str, Any]], Exception]]:
+    """
+    Run every model in MODELS on one document concurrently (the calls are network-bound).
+    Returns, in MODELS order, each run_model result or the exception that model raised.
+    """
+    user_content = _document_user_content(pdf_text)
+
+    def run_limited(model_id: str, provider: str):
+        with _PROVIDER_SEMAPHORES.get(provider, _PROVIDER_SEMAPHORES["anthropic"]):
+            return run_model(model_id, provider, pdf_text, user_content)
+
+    with ThreadPoolExecutor(max_workers=len(MODELS)) as executor:
+        futures = [executor.submit(run_limited, model_id, provider) for model_id, provider, _ in MODELS]
+    outcomes = []
+    for future in futures:
+        exc = future.exception()
+        outcomes.append(exc if exc is not None else future.result())
+    return outcomes
+
+
+# Multi-document requests (--batch-size): documents are delimited with "===DOC i===" and the model returns
+# {"results": [...]} with one EXTRACTION_PROMPT object (plus "doc": i) per document
+EXTRACTION_BATCH_SIZE = 8
+MAX_EXTRACTION_BATCH_SIZE = 16
+_BATCH_MAX_CHARS = MAX_DOCUMENT_CHARS  # Same text budget as a single-document request
+_BATCH_USER_PREFIX = (
+    "The following are {n} separate investment update documents, each starting with a ===DOC i=== line. "
+    "Extract information from each one independently, exactly as specified above. Return a JSON object "
+    '{{"results": [...]}} with one object per document, each including "doc": i for its document number.\n\n'
+)
+
+
+_RESPONSE_CACHE: Optional[ResponseCache] = None
+_RESPONSE_CACHE_OPENED = False
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def _get_response_cache() -> Optional[ResponseCache]:
+    """Return the shared persistent LLM response cache, or None when bypassed (see USE_CACHE) or unavailable."""
+    global _RESPONSE_CACHE, _RESPONSE_CACHE_OPENED
+    if not USE_CACHE:
+        return None
+    if not _RESPONSE_CACHE_OPENED:
+        with _RESPONSE_CACHE_LOCK:
+            if not _RESPONSE_CACHE_OPENED:
+                try:
+                    _RESPONSE_CACHE = ResponseCache(LLM_CACHE_DIR, LLM_CACHE_TTL_DAYS * 86400)
+                except Exception as e:
+                    print(f"LLM response cache unavailable ({e}); continuing without it")
+                _RESPONSE_CACHE_OPENED = True
+    return _RESPONSE_CACHE
+
+
+def _complete(
+    model_id: str,
+    provider: str,
+    user_content: str,
+    max_tokens: int = 1024,
+    api_key: Optional[str] = None,
+) -> Tuple[str, int, int]:
+    """
+    Send EXTRACTION_PROMPT + user_content to the provider. Returns (response_text, input_tokens, output_tokens).
+    Identical requests are answered from the persistent LLM response cache (token counts included, so reruns
+    report the same cost); set LLM_CACHE_BYPASS=1 to always call the API.
+    """
+    response_cache = _get_response_cache()
+    key = cache_key("eval_metrics", provider, model_id, str(max_tokens), EXTRACTION_PROMPT, user_content)
+    if response_cache is not None:
+        cached = response_cache.get(key)
+        if cached is not None:
+            return tuple(cached)
     if provider == "openai":
-        canon, in_t, out_t, raw, parse_ok, parse_error, data = run_openai(model_id, pdf_text)
+        result = _complete_openai(model_id, user_content, api_key)
     elif provider == "gemini":
-        canon, in_t, out_t, raw, parse_ok, parse_error, data = run_gemini(model_id, pdf_text)
+        result = _complete_gemini(model_id, user_content, api_key)
     else:
-        canon, in_t, out_t, raw, parse_ok, parse_error, data = run_anthropic(model_id, pdf_text)
+        result = _complete_anthropic(model_id, user_content, api_key, max_tokens=max_tokens)
+    if response_cache is not None:
+        response_cache.set(key, list(result))
+    return result
+
+
+# Output tokens budgeted per document in a batched request (Anthropic max_tokens = this * documents)
+_BATCH_DOC_OUTPUT_TOKENS = 1024
+# Models whose output limit is below _BATCH_DOC_OUTPUT_TOKENS * MAX_EXTRACTION_BATCH_SIZE (others: no cap)
+_MAX_OUTPUT_TOKENS = {
+    "claude-3-haiku-20240307": 4096,
+}
+
+
+def max_batch_documents(model_id: str) -> int:
+    """Most documents one batched request to model_id can cover within its output-token limit."""
+    limit = _MAX_OUTPUT_TOKENS.get(model_id)
+    if limit is None:
+        return MAX_EXTRACTION_BATCH_SIZE
+    return max(1, limit // _BATCH_DOC_OUTPUT_TOKENS)
+
+
+def run_model_batch(
+    model_id: str,
+    provider: str,
+    pdf_texts: List[str],
+) -> List[Tuple[Dict[str, Optional[float]], int, int, float, str, bool, Optional[str], Dict[str, Any]]]:
+    """
+    Run one model on several documents in a single request.
+    Returns one run_model-style tuple per document. Token usage (and so cost) is split evenly across the
+    documents, and each raw_response is that document's own JSON object so liberal matching never sees
+    another document's numbers. Raises ValueError unless the response has exactly one result per document.
+    """
+    n = len(pdf_texts)
+    user_content = _BATCH_USER_PREFIX.format(n=n) + "\n\n".join(
+        f"===DOC {i}===\n{text}" for i, text in enumerate(pdf_texts)
+    )
+    text, in_t, out_t = _complete(model_id, provider, user_content, max_tokens=_BATCH_DOC_OUTPUT_TOKENS * n)
+    data, _ = extract_json_from_response(text)
+    items = data.get("results")
+    by_doc = {item.get("doc"): item for item in items if isinstance(item, dict)} if isinstance(items, list) else {}
+    if set(by_doc) != set(range(n)):
+        raise ValueError(f"Expected results for documents 0..{n - 1}, got {sorted(map(str, by_doc))}")
     in_per_m, out_per_m = get_pricing(model_id, provider)
-    cost = (in_t / 1_000_000 * in_per_m) + (out_t / 1_000_000 * out_per_m)
-    return canon, in_t, out_t, cost, raw, parse_ok, parse_error, data
+    outcomes = []
+    for i in range(n):
+        doc_data = {k: v for k, v in by_doc[i].items() if k != "doc"}
+        # Spread the remainder over the first documents so the shares add up to the request's usage
+        doc_in = in_t // n + (1 if i < in_t % n else 0)
+        doc_out = out_t // n + (1 if i < out_t % n else 0)
+        cost = (doc_in / 1_000_000 * in_per_m) + (doc_out / 1_000_000 * out_per_m)
+        outcomes.append((normalize_prediction(doc_data), doc_in, doc_out, cost, json.dumps(doc_data), True, None, doc_data))
+    return outcomes
+
+
+def run_models_batch(pdf_texts: List[str]) -> List[List[Union[Tuple[Dict[str, Optional[float]], int, int, float, str, bool, Optional[str], Dict[str, Any]], Exception]]]:
+    """
+    Run every model in MODELS on several documents, one request per model covering all of them (several smaller
+    requests for models whose output limit covers fewer documents, see max_batch_documents).
+    A model whose batched request fails (or returns an incomplete result list) falls back to one request per document.
+    Returns, per document, the same list run_models would return for it.
+    """
+    def run_documents(model_id: str, provider: str, texts: List[str], semaphore: threading.BoundedSemaphore) -> List[Any]:
+        outcomes = []
+        for pdf_text in texts:
+            try:
+                with semaphore:
+                    outcomes.append(run_model(model_id, provider, pdf_text))
+            except Exception as e:
+                outcomes.append(e)
+        return outcomes
+
+    def run_limited(model_id: str, provider: str):
+        semaphore = _PROVIDER_SEMAPHORES.get(provider, _PROVIDER_SEMAPHORES["anthropic"])
+        per_request = max_batch_documents(model_id)
+        if per_request <= 1:
+            return run_documents(model_id, provider, pdf_texts, semaphore)
+        outcomes = []
+        # Models with a small output limit take the documents in several smaller batches
+        for start in range(0, len(pdf_texts), per_request):
+            texts = pdf_texts[start:start + per_request]
+            if len(texts) == 1:
+                outcomes.extend(run_documents(model_id, provider, texts, semaphore))
+                continue
+            try:
+                with semaphore:
+                    outcomes.extend(run_model_batch(model_id, provider, texts))
+                continue
+            except Exception as e:
+                print(f"  Batched request to {model_id} failed, falling back to one request per document: {e}")
+            outcomes.extend(run_documents(model_id, provider, texts, semaphore))
+        return outcomes
+
+    with ThreadPoolExecutor(max_workers=len(MODELS)) as executor:
+        futures = [executor.submit(run_limited, model_id, provider) for model_id, provider, _ in MODELS]
+    per_model = [future.result() for future in futures]
+    return [list(doc_outcomes) for doc_outcomes in zip(*per_model)]
 
 
 # Keyword pattern for --debug-dump-text (lines containing any of these)
@@ -1116,6 +1588,18 @@ def compute_score_from_gt_and_matches(
     return irr_in_scope, moic_in_scope, dpi_in_scope, other_in_scope, score_denom, score_num, overall_score, False, 0
 
 
+def load_pdf_text(pdf_path: str) -> Optional[str]:
+    """
+    Extract text from a PDF, reusing the text cached in PDF_TEXT_CACHE_DIR for identical PDF bytes
+    (unless USE_CACHE is off). Returns None if extraction failed (failures are not cached).
+    """
+    from pdf_processor import extract_text_from_pdf, extract_text_from_pdf_cached
+
+    if not USE_CACHE:
+        return extract_text_from_pdf(pdf_path)
+    return extract_text_from_pdf_cached(pdf_path, PDF_TEXT_CACHE_DIR)
+
+
 def evaluate_one(
     pdf_path: str,
     ground_truth_path: Optional[str] = None,
@@ -1125,6 +1609,8 @@ def evaluate_one(
     metrics_in_scope: Optional[List[str]] = None,
     debug_dump_text: bool = False,
     allow_projected_metrics: bool = False,
+    pdf_text: Optional[str] = None,
+    model_outcomes: Optional[List[Any]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Run all models on one PDF and compare to ground truth.
@@ -1132,10 +1618,9 @@ def evaluate_one(
     metrics_in_scope: if set, only these canonical metric names count toward score (e.g. irr,moic,dpi,current_yield).
     debug_dump_text: if True, write extracted text to debug_text/<test_case_id>.txt and print keyword hits.
     allow_projected_metrics: if False, documents labeled estimate/projection/forecast are excluded from score_denom.
+    pdf_text, model_outcomes: already extracted text and run_models-style results (batched runs); computed when None.
     Returns list of row dicts for CSV.
     """
-    from pdf_processor import extract_text_from_pdf
-
     if ground_truth_dict is None and ground_truth_path is None:
         raise ValueError("Provide either ground_truth_path or ground_truth_dict")
     if ground_truth_dict is None:
@@ -1145,7 +1630,8 @@ def evaluate_one(
     if test_case_id is None:
         test_case_id = Path(pdf_path).stem
 
-    pdf_text = extract_text_from_pdf(pdf_path)
+    if pdf_text is None:
+        pdf_text = load_pdf_text(pdf_path)
     if not pdf_text:
         raise ValueError(f"No text extracted from PDF: {pdf_path}")
     if debug_dump_text:
@@ -1169,11 +1655,15 @@ def evaluate_one(
             print(f"    ... and {len(estimate_pct_lines) - 25} more")
     projected = _is_projected_document(pdf_text, test_case_id or "")
     rows = []
-    for model_id, provider, display_name in MODELS:
+    if model_outcomes is None:
+        model_outcomes = run_models(pdf_text)
+    for (model_id, provider, display_name), outcome in zip(MODELS, model_outcomes):
         parse_ok = True
         parse_error: Optional[str] = None
         try:
-            canon, in_t, out_t, cost, raw_response, parse_ok, parse_error, data = run_model(model_id, provider, pdf_text)
+            if isinstance(outcome, Exception):
+                raise outcome
+            canon, in_t, out_t, cost, raw_response, parse_ok, parse_error, data = outcome
         except Exception as e:
             canon = {k: None for k in CANONICAL_KEYS}
             data = {}
@@ -1183,14 +1673,19 @@ def evaluate_one(
             parse_error = str(e)
             print(f"  Error {display_name}: {e}")
         # Liberal matching: GT numerical values can appear anywhere in the JSON or in the raw response text. When no JSON is found (parse_error), we still extract numbers from raw text so we can score.
-        numbers = extract_all_performance_numbers(data)
-        raw_numbers = extract_numbers_from_raw_response(raw_response)
-        numbers = numbers + raw_numbers
-        irr_match = 1 if gt.get("net_irr") is None else (1 if gt_value_appears_in_set(gt.get("net_irr"), numbers, tolerance, allow_scale_flex=True) else 0)
-        moic_match = 1 if gt.get("net_moic") is None else (1 if gt_value_appears_in_set(gt.get("net_moic"), numbers, tolerance, allow_scale_flex=False) else 0)
-        dpi_match = 1 if gt.get("net_dpi") is None else (1 if gt_value_appears_in_set(gt.get("net_dpi"), numbers, tolerance, allow_scale_flex=False) else 0)
         other_gt_val = gt.get("other_metric_value")
-        other_match = 1 if other_gt_val is None else (1 if gt_value_appears_in_set(other_gt_val, numbers, tolerance, allow_scale_flex=True) else 0)
+        if all(gt.get(key) is None for key in _GT_METRIC_KEYS):
+            # Nothing in scope: every match is 1 whatever the response contains, so skip extracting numbers
+            numbers = []
+            irr_match = moic_match = dpi_match = other_match = 1
+        else:
+            numbers = extract_all_performance_numbers(data)
+            matches = gt_matches_in_numbers(gt, numbers, tolerance)
+            # The raw response is only scanned when the JSON numbers leave some GT value unmatched
+            if not all(matches):
+                numbers = numbers + extract_numbers_from_raw_response(raw_response)
+                matches = gt_matches_in_numbers(gt, numbers, tolerance)
+            irr_match, moic_match, dpi_match, other_match = matches
         # Pred values for CSV display (from canonical dict when available)
         irr_pred_raw = canon.get("irr")
         moic_pred_raw = canon.get("moic")
@@ -1203,8 +1698,7 @@ def evaluate_one(
         _ol = gt.get("other_metric_label")
         _ol_str = str(_ol) if _ol else ""
         if _ol:
-            _norm = _normalize_label_for_lookup(_ol_str)
-            _key = OTHER_LABEL_TO_CANONICAL.get(_norm) or OTHER_LABEL_TO_CANONICAL.get(canonicalize_label(_ol_str).replace(" ", "_"))
+            _key = OTHER_LABEL_TO_CANONICAL.get(_normalize_label_for_lookup(_ol_str))
             if _key:
                 other_metric_kind = _key
         if other_gt_val is not None and other_pred_val is not None:
@@ -1410,27 +1904,82 @@ def write_trace_json(rows: List[Dict[str, Any]], trace_path: str) -> None:
     print(f"Wrote LLM trace ({len(trace_entries)} entries) to {trace_path}")
 
 
-def run_on_directory(test_cases_dir: str, output_path: str, tolerance: float = 0.01) -> List[Dict[str, Any]]:
+def _evaluate_documents(jobs: List[Tuple[str, Dict[str, Any]]], workers: int = 1, batch_size: int = 1) -> List[Dict[str, Any]]:
+    """
+    Run evaluate_one for each (name, kwargs) job, up to `workers` documents (or batches) at a time.
+    With batch_size > 1, up to batch_size documents share one request per model (see run_models_batch).
+    Returns all rows in job order; documents that raise are reported and skipped.
+    """
+    def run(job: Tuple[str, Dict[str, Any]], **extra: Any) -> List[Dict[str, Any]]:
+        name, kwargs = job
+        try:
+            return evaluate_one(**kwargs, **extra)
+        except Exception as e:
+            print(f"  Skip {name}: {e}")
+            return []
+
+    def run_one(job: Tuple[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        print(f"Evaluating: {job[0]}")
+        return run(job)
+
+    def run_group(group: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        texts: Dict[int, str] = {}
+        for i, (name, kwargs) in enumerate(group):
+            print(f"Evaluating: {name}")
+            try:
+                texts[i] = load_pdf_text(kwargs["pdf_path"])
+            except Exception as e:
+                print(f"  Skip {name}: {e}")
+        # Pack documents (in order) into requests within the single-document text budget; oversized or
+        # unreadable documents go through evaluate_one on their own
+        batches: List[List[int]] = []
+        batch: List[int] = []
+        batch_chars = 0
+        for i, text in texts.items():
+            if not text or len(text) > _BATCH_MAX_CHARS:
+                continue
+            if batch and batch_chars + len(text) > _BATCH_MAX_CHARS:
+                batches.append(batch)
+                batch, batch_chars = [], 0
+            batch.append(i)
+            batch_chars += len(text)
+        if batch:
+            batches.append(batch)
+        outcomes: Dict[int, List[Any]] = {}
+        for batch in batches:
+            if len(batch) > 1:
+                outcomes.update(zip(batch, run_models_batch([texts[i] for i in batch])))
+        rows: List[Dict[str, Any]] = []
+        for i, text in texts.items():
+            rows.extend(run(group[i], pdf_text=text or "", model_outcomes=outcomes.get(i)))
+        return rows
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        if batch_size <= 1:
+            return [row for rows in executor.map(run_one, jobs) for row in rows]
+        batch_size = min(batch_size, MAX_EXTRACTION_BATCH_SIZE)
+        groups = [jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)]
+        return [row for rows in executor.map(run_group, groups) for row in rows]
+
+
+def run_on_directory(test_cases_dir: str, output_path: str, tolerance: float = 0.01, workers: int = 1, batch_size: int = 1) -> List[Dict[str, Any]]:
     """
     Run eval on every subdir that contains a PDF and ground_truth.json.
-    Each subdir name is used as test_case_id.
+    Each subdir name is used as test_case_id. Up to `workers` documents are evaluated at a time,
+    and up to `batch_size` documents share one request per model.
     """
     root = Path(test_cases_dir)
     if not root.is_dir():
         raise FileNotFoundError(f"Not a directory: {test_cases_dir}")
-    all_rows = []
+    jobs = []
     for subdir in sorted(d for d in root.iterdir() if d.is_dir() and not d.name.startswith(".")):
         gt_file = subdir / "ground_truth.json"
         pdfs = list(subdir.glob("*.pdf"))
         if not gt_file.exists() or not pdfs:
             continue
         pdf_path = str(pdfs[0])
-        print(f"Evaluating: {subdir.name}")
-        try:
-            rows = evaluate_one(pdf_path, ground_truth_path=str(gt_file), test_case_id=subdir.name, tolerance=tolerance)
-            all_rows.extend(rows)
-        except Exception as e:
-            print(f"  Skip {subdir.name}: {e}")
+        jobs.append((subdir.name, dict(pdf_path=pdf_path, ground_truth_path=str(gt_file), test_case_id=subdir.name, tolerance=tolerance)))
+    all_rows = _evaluate_documents(jobs, workers, batch_size)
     if all_rows:
         write_csv(all_rows, output_path)
         trace_path = str(Path(output_path).with_suffix("")) + "_trace.json"
@@ -1495,8 +2044,13 @@ def run_on_pdf_dir_with_ground_truth(
     metrics_in_scope: Optional[List[str]] = None,
     debug_dump_text: bool = False,
     allow_projected_metrics: bool = False,
+    workers: int = 1,
+    batch_size: int = 1,
 ) -> List[Dict[str, Any]]:
-    """Run eval on PDFs in pdf_dir using pre-loaded ground truth (from Excel or JSON)."""
+    """
+    Run eval on PDFs in pdf_dir using pre-loaded ground truth (from Excel or JSON), up to `workers` PDFs at a time.
+    With batch_size > 1, up to batch_size PDFs share one request per model.
+    """
     pdf_path = Path(pdf_dir)
     if not pdf_path.is_dir():
         raise FileNotFoundError(f"Not a directory: {pdf_dir}")
@@ -1542,24 +2096,19 @@ def run_on_pdf_dir_with_ground_truth(
         candidates = sorted(candidates, key=lambda x: x[0].name)
     if metrics_in_scope:
         print(f"Scoring restricted to metrics_in_scope: {metrics_in_scope}")
-    all_rows = []
-    for pdf_file, gt in candidates:
-        name = pdf_file.name
-        stem = pdf_file.stem
-        print(f"Evaluating: {name}")
-        try:
-            rows = evaluate_one(
-                str(pdf_file),
-                ground_truth_dict=gt,
-                test_case_id=stem,
-                tolerance=tolerance,
-                metrics_in_scope=metrics_in_scope,
-                debug_dump_text=debug_dump_text,
-                allow_projected_metrics=allow_projected_metrics,
-            )
-            all_rows.extend(rows)
-        except Exception as e:
-            print(f"  Skip {name}: {e}")
+    jobs = [
+        (pdf_file.name, dict(
+            pdf_path=str(pdf_file),
+            ground_truth_dict=gt,
+            test_case_id=pdf_file.stem,
+            tolerance=tolerance,
+            metrics_in_scope=metrics_in_scope,
+            debug_dump_text=debug_dump_text,
+            allow_projected_metrics=allow_projected_metrics,
+        ))
+        for pdf_file, gt in candidates
+    ]
+    all_rows = _evaluate_documents(jobs, workers, batch_size)
     if all_rows:
         write_csv(all_rows, output_path)
         trace_path = str(Path(output_path).with_suffix("")) + "_trace.json"
@@ -1586,6 +2135,8 @@ def run_on_pdf_dir_with_excel(
     metrics_in_scope: Optional[List[str]] = None,
     debug_dump_text: bool = False,
     allow_projected_metrics: bool = False,
+    workers: int = 1,
+    batch_size: int = 1,
 ) -> List[Dict[str, Any]]:
     """Run eval on PDFs using ground truth from Excel (one tab per doc or GTPDF column)."""
     gt_lookup, gtpdf_values, ordered_metrics = load_ground_truth_from_excel(excel_path)
@@ -1597,6 +2148,8 @@ def run_on_pdf_dir_with_excel(
         metrics_in_scope=metrics_in_scope,
         debug_dump_text=debug_dump_text,
         allow_projected_metrics=allow_projected_metrics,
+        workers=workers,
+        batch_size=batch_size,
     )
 
 
@@ -1612,6 +2165,8 @@ def run_on_pdf_dir_with_json(
     metrics_in_scope: Optional[List[str]] = None,
     debug_dump_text: bool = False,
     allow_projected_metrics: bool = False,
+    workers: int = 1,
+    batch_size: int = 1,
 ) -> List[Dict[str, Any]]:
     """Run eval on PDFs using ground truth from a multi-document JSON (GTPDF + metrics per entry)."""
     gt_lookup, gtpdf_values, ordered_metrics = load_ground_truth_from_json(json_path)
@@ -1623,6 +2178,8 @@ def run_on_pdf_dir_with_json(
         metrics_in_scope=metrics_in_scope,
         debug_dump_text=debug_dump_text,
         allow_projected_metrics=allow_projected_metrics,
+        workers=workers,
+        batch_size=batch_size,
     )
 
 
@@ -1647,8 +2204,14 @@ def main():
     parser.add_argument("--no-fail-fast-parse", action="store_true", dest="no_fail_fast_parse", help="Do not exit when parse_ok rate is below 0.98.")
     parser.add_argument("--metrics-in-scope", dest="metrics_in_scope", default=None, metavar="LIST", help="Comma-separated list of metrics to score (e.g. irr,moic,dpi,current_yield). Default: all GT metrics.")
     parser.add_argument("--debug-dump-text", action="store_true", dest="debug_dump_text", help="Write extracted PDF text to debug_text/<test_case_id>.txt and print lines containing irr|moic|dpi|tvpi|yield|bps|ytd.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of PDFs to evaluate concurrently (default 1). Models always run concurrently per PDF, capped per provider by OPENAI_/ANTHROPIC_/GEMINI_MAX_CONCURRENCY.")
+    parser.add_argument("--batch-size", type=int, default=1, dest="batch_size", help=f"With --dir/--pdf-dir: documents sent to each model per request (default 1; try {EXTRACTION_BATCH_SIZE}, max {MAX_EXTRACTION_BATCH_SIZE}). Token usage and cost of a batched request are split evenly across its documents.")
     parser.add_argument("--allow-projected-metrics", action="store_true", dest="allow_projected_metrics", help="If set, score metrics from documents labeled estimate/projection/forecast. Default: exclude them from score_denom.")
+    parser.add_argument("--no-cache", action="store_true", dest="no_cache", help="Re-extract PDF text and call the models even for inputs with cached results (same as LLM_CACHE_BYPASS=1).")
     args = parser.parse_args()
+    if args.no_cache:
+        global USE_CACHE
+        USE_CACHE = False
     fail_fast_parse_rate: Optional[float] = None if getattr(args, "no_fail_fast_parse", False) else 0.98
     metrics_in_scope: Optional[List[str]] = None
     if getattr(args, "metrics_in_scope", None):
@@ -1658,7 +2221,7 @@ def main():
     if args.test_cases_dir:
         if args.pdf or args.ground_truth or args.pdf_dir or args.ground_truth_excel or getattr(args, "ground_truth_json", None):
             parser.error("Do not mix --dir with --pdf/--ground-truth or --pdf-dir/--ground-truth-excel/--ground-truth-json")
-        run_on_directory(args.test_cases_dir, args.output, tolerance=args.tolerance)
+        run_on_directory(args.test_cases_dir, args.output, tolerance=args.tolerance, workers=args.workers, batch_size=args.batch_size)
         return
     if args.pdf_dir and args.ground_truth_excel:
         if args.pdf or args.ground_truth or getattr(args, "ground_truth_json", None):
@@ -1672,6 +2235,8 @@ def main():
             metrics_in_scope=metrics_in_scope,
             debug_dump_text=debug_dump_text,
             allow_projected_metrics=allow_projected_metrics,
+            workers=args.workers,
+            batch_size=args.batch_size,
         )
         return
     if args.pdf_dir and getattr(args, "ground_truth_json", None):
@@ -1686,6 +2251,8 @@ def main():
             metrics_in_scope=metrics_in_scope,
             debug_dump_text=debug_dump_text,
             allow_projected_metrics=allow_projected_metrics,
+            workers=args.workers,
+            batch_size=args.batch_size,
         )
         return
     if args.pdf and args.ground_truth:
@@ -1,4 +1,5 @@
 """PDF text extraction with fallbacks for non-extractable (e.g. image-only) PDFs."""
+import hashlib
 import os
 import tempfile
 
@@ -99,3 +100,31 @@ def extract_text_from_pdf(pdf_path: str) -> str | None:
     # 4. OCR fallback for image-only / scanned PDFs (optional: needs pytesseract + Pillow + Tesseract)
     text3 = (_extract_ocr(path) or "").strip()
     return text3 or None
+
+
+def extract_text_from_pdf_cached(pdf_path: str, cache_dir) -> str | None:
+    """
+    extract_text_from_pdf, reusing the text cached in cache_dir for identical PDF bytes.
+
+    Cache files are keyed by the SHA-256 of the PDF and written to a temporary file that is then
+    renamed into place, so an interrupted write never leaves a truncated entry behind.
+    Failures (None) are not cached.
+    """
+    with open(pdf_path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    cache_file = os.path.join(cache_dir, f"{digest}.txt")
+    if os.path.exists(cache_file):
+        with open(cache_file, encoding="utf-8") as f:
+            return f.read()
+
+    pdf_text = extract_text_from_pdf(pdf_path)
+    if pdf_text is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=cache_dir, suffix=".tmp", delete=False) as tmp:
+            tmp.write(pdf_text)
+        try:
+            os.replace(tmp.name, cache_file)
+        except OSError:
+            os.remove(tmp.name)
+            raise
+    return pdf_text
@@ -0,0 +1,50 @@
+"""Persistent exact-match cache for LLM responses (SQLite, stdlib only)."""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+def cache_key(*parts):
+    """Stable key for a request: blake2b digest of its parts (prompt text, model, ...)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """
+    Key/value store for LLM responses that survives process restarts.
+
+    Values are stored as JSON and expire after ttl_seconds. Safe to share between threads.
+    """
+
+    def __init__(self, directory, ttl_seconds):
+        os.makedirs(directory, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(directory, 'responses.sqlite3'), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+
+    def get(self, key):
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None or time.time() - row[1] > self.ttl_seconds:
+            return None
+        return json.loads(row[0])
+
+    def set(self, key, value):
+        """Store value (must be JSON-serializable) under key."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time())
+            )
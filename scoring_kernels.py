@@ -0,0 +1,141 @@
+"""Batch performance-summary scoring kernels (Numba-compiled when Numba is installed)."""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional: without it the kernels run as plain Python loops over NumPy arrays
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+    prange = range
+
+# Benchmark percentile categories encoded as small ints, worst to best (-1 = no comparison)
+PERCENTILE_CODES = {
+    'bottom_decile': 0,
+    'bottom_quartile': 1,
+    'below_median': 2,
+    'above_median': 3,
+    'top_quartile': 4,
+    'top_decile': 5,
+}
+
+# Kernel output labels (index into SUMMARY_LABELS); NO_SCORE means no input was available
+NO_SCORE = -1
+UNDERPERFORMING = 0
+AS_EXPECTED = 1
+OUTPERFORMING = 2
+SUMMARY_LABELS = ('Underperforming', 'As Expected', 'Outperforming')
+
+
+@njit(cache=True, parallel=True)
+def score_quant(values, lows, highs):
+    """
+    Score funds from raw metrics against fixed thresholds.
+
+    Args:
+        values: float64 array (n_funds, n_metrics), NaN where a metric is missing
+        lows: float64 array (n_metrics,), below which a metric is underperforming
+        highs: float64 array (n_metrics,), above which a metric is outperforming
+
+    Returns:
+        int8 array (n_funds,) of labels: majority of per-metric scores, ties as expected
+    """
+    n_funds, n_metrics = values.shape
+    out = np.empty(n_funds, dtype=np.int8)
+    for i in prange(n_funds):
+        under = 0
+        over = 0
+        scored = 0
+        for j in range(n_metrics):
+            v = values[i, j]
+            if np.isnan(v):
+                continue
+            scored += 1
+            if v < lows[j]:
+                under += 1
+            elif v > highs[j]:
+                over += 1
+        if scored == 0:
+            out[i] = NO_SCORE
+        elif under > over:
+            out[i] = UNDERPERFORMING
+        elif over > under:
+            out[i] = OUTPERFORMING
+        else:
+            out[i] = AS_EXPECTED
+    return out
+
+
+@njit(cache=True, parallel=True)
+def score_from_percentiles(codes):
+    """
+    Score funds from benchmark percentile codes (see PERCENTILE_CODES).
+
+    Args:
+        codes: int8 array (n_funds, n_metrics), -1 where no benchmark comparison exists
+
+    Returns:
+        int8 array (n_funds,) of labels: outperforming/underperforming when top/bottom quartile
+        comparisons are the strict majority side and cover at least half, otherwise as expected
+    """
+    n_funds, n_metrics = codes.shape
+    out = np.empty(n_funds, dtype=np.int8)
+    for i in prange(n_funds):
+        top = 0
+        bottom = 0
+        compared = 0
+        for j in range(n_metrics):
+            c = codes[i, j]
+            if c < 0:
+                continue
+            compared += 1
+            if c >= 4:
+                top += 1
+            elif c <= 1:
+                bottom += 1
+        if compared == 0:
+            out[i] = NO_SCORE
+        elif top > bottom and 2 * top >= compared:
+            out[i] = OUTPERFORMING
+        elif bottom > top and 2 * bottom >= compared:
+            out[i] = UNDERPERFORMING
+        else:
+            out[i] = AS_EXPECTED
+    return out
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def bucket_batch(thresholds, values):
+        """
+        Benchmark bucket index per fund: the first column whose threshold the value meets.
+
+        Args:
+            thresholds: float64 array (n_funds, n_buckets), best bucket first (-inf = always met, inf = never)
+            values: float64 array (n_funds,)
+
+        Returns:
+            int8 array (n_funds,) of bucket indexes, n_buckets when no threshold is met
+        """
+        n_funds, n_buckets = thresholds.shape
+        out = np.empty(n_funds, dtype=np.int8)
+        for i in prange(n_funds):
+            bucket = n_buckets
+            for j in range(n_buckets):
+                if values[i] >= thresholds[i, j]:
+                    bucket = j
+                    break
+            out[i] = bucket
+        return out
+
+    # Compile (or load from the on-disk cache) now so the first real batch doesn't pay for it
+    bucket_batch(np.zeros((1, 5)), np.zeros(1))
+else:
+    def bucket_batch(thresholds, values):
+        """Vectorized NumPy form of the Numba bucket_batch kernel (same arguments and result)."""
+        hits = values[:, None] >= thresholds
+        return np.where(hits.any(axis=1), hits.argmax(axis=1), thresholds.shape[1]).astype(np.int8)
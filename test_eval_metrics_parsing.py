@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """Unit tests for eval_metrics_harness parsing and canonicalization."""
+import json
+import re
 import sys
+import eval_metrics_harness
 from eval_metrics_harness import (
     extract_json_from_response,
     normalize_prediction,
@@ -10,6 +13,10 @@ from eval_metrics_harness import (
     compute_score_from_gt_and_matches,
     extract_all_performance_numbers,
     gt_value_appears_in_set,
+    gt_matches_in_numbers,
+    _parse_metrics_from_performance_list,
+    run_model_batch,
+    run_models_batch,
     CANONICAL_KEYS,
     OTHER_LABEL_TO_CANONICAL,
 )
@@ -36,6 +43,13 @@ def test_extract_json_strict():
     assert err4 is not None
 
 
+def test_extract_json_brace_in_string():
+    """Braces inside string values do not cut the object short; trailing prose after it is ignored."""
+    out, err = extract_json_from_response('{"key_takeaways": ["Use {curly} or } alone"], "irr": 12.5} Hope this helps {')
+    assert err is None
+    assert out == {"key_takeaways": ["Use {curly} or } alone"], "irr": 12.5}
+
+
 def test_normalize_prediction_old_schema():
     """Input JSON old schema => canonical dict has irr/moic/dpi populated."""
     old = {"net_irr": 10.3, "net_moic": 1.09, "net_dpi": 0.5, "other_metric_label": None, "other_metric_value": None}
@@ -55,6 +69,14 @@ def test_normalize_prediction_new_schema():
     assert canon.get("dpi") == 0.38
 
 
+def test_normalize_prediction_zero_not_replaced_by_old_key():
+    """A reported 0 under the new key is kept; the old key is only used when the new one has no value."""
+    canon = normalize_prediction({"irr": 0, "net_irr": 12.5, "dpi": None, "net_dpi": 0.4, "moic": "N/A", "net_moic": 1.3})
+    assert canon.get("irr") == 0.0
+    assert canon.get("dpi") == 0.4
+    assert canon.get("moic") == 1.3
+
+
 def test_normalize_prediction_other_metric_current_yield():
     """Input with other_metric_label/value ('current yield', 7.84) => canonical current_yield populated."""
     raw = {"other_metric_label": "current yield", "other_metric_value": 7.84}
@@ -186,10 +208,81 @@ def test_extract_all_performance_numbers_and_liberal_match():
     assert not gt_value_appears_in_set(15.5, [0.155], 0.01, allow_scale_flex=False)
 
 
+def test_gt_matches_in_numbers():
+    """Per-metric matches: None GT counts as 1; only IRR and the other metric get scale flexibility."""
+    gt = {"net_irr": 15.5, "net_moic": 1.2, "net_dpi": 0.45, "other_metric_value": None}
+    assert gt_matches_in_numbers(gt, [0.155, 1.2, 45.0]) == (1, 1, 0, 1)
+    assert gt_matches_in_numbers(gt, []) == (0, 0, 0, 1)
+
+
+def test_parse_metrics_from_performance_list():
+    """First IRR / MOIC-TVPI / DPI per metric wins; Net or Gross, either side of the number."""
+    out = _parse_metrics_from_performance_list([
+        "",
+        None,
+        "Fund Performance: ~32% Gross IRR",
+        "Net IRR: 15.5%",
+        "2.2× TVPI",
+        "Net DPI: 0.6x",
+        "Net MOIC: 9.9x",
+    ])
+    assert out == {"net_irr": 32.0, "net_moic": 2.2, "net_dpi": 0.6}
+    assert _parse_metrics_from_performance_list(["Revenue grew 20%"]) == {"net_irr": None, "net_moic": None, "net_dpi": None}
+    # Lines after all three metrics are found are not parsed
+    assert _parse_metrics_from_performance_list(["IRR: 10% | MOIC: 1.5x | DPI: 0.2x", "IRR: .%"])["net_irr"] == 10.0
+
+
+
+def test_run_model_batch_splits_results():
+    """One result per document (any order); usage split evenly; raw_response holds only that document's JSON."""
+    response = '{"results": [{"doc": 1, "moic": "1.5x"}, {"doc": 0, "irr": 12.5, "investment_performance": ["Net IRR: 12.5%"]}]}'
+    original = eval_metrics_harness._complete
+    eval_metrics_harness._complete = lambda model_id, provider, user_content, max_tokens=1024: (response, 101, 7)
+    try:
+        out = run_model_batch("gpt-5.2", "openai", ["doc a", "doc b"])
+        assert [o[0]["irr"] for o in out] == [12.5, None]
+        assert out[1][0]["moic"] == 1.5
+        assert [o[1] for o in out] == [51, 50] and [o[2] for o in out] == [4, 3]
+        assert "12.5" in out[0][4] and "12.5" not in out[1][4]
+        assert out[0][7] == {"irr": 12.5, "investment_performance": ["Net IRR: 12.5%"]}
+        # A missing document fails the whole batch (callers fall back to one request per document)
+        try:
+            run_model_batch("gpt-5.2", "openai", ["doc a", "doc b", "doc c"])
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+    finally:
+        eval_metrics_harness._complete = original
+
+
+def test_run_models_batch_respects_output_limit():
+    """claude-3-haiku (4096 output tokens) gets sub-batches of at most 4 documents; every document gets a result."""
+    requests = []
+
+    def fake_complete(model_id, provider, user_content, max_tokens=1024, api_key=None):
+        requests.append((model_id, max_tokens))
+        n = len(re.findall(r"===DOC \d+===\n", user_content))
+        if not n:
+            return '{"irr": 12.5}', 10, 5
+        return json.dumps({"results": [{"doc": i, "irr": 12.5} for i in range(n)]}), 10 * n, 5 * n
+
+    original = eval_metrics_harness._complete
+    eval_metrics_harness._complete = fake_complete
+    try:
+        out = run_models_batch([f"doc {i}" for i in range(9)])
+    finally:
+        eval_metrics_harness._complete = original
+    assert len(out) == 9 and all(not isinstance(o, Exception) and o[0]["irr"] == 12.5 for doc in out for o in doc)
+    assert max(t for m, t in requests if m == "claude-3-haiku-20240307") <= 4096
+    assert sorted(t for m, t in requests if m == "claude-3-haiku-20240307") == [1024, 4096, 4096]
+
+
 if __name__ == "__main__":
     test_extract_json_strict()
+    test_extract_json_brace_in_string()
     test_normalize_prediction_old_schema()
     test_normalize_prediction_new_schema()
+    test_normalize_prediction_zero_not_replaced_by_old_key()
     test_normalize_prediction_other_metric_current_yield()
     test_resolve_other_pred_from_canon()
     test_canonical_keys_cover_expected()
@@ -200,5 +293,9 @@ if __name__ == "__main__":
     test_wolf_hill_scenario()
     test_no_gt_metrics()
     test_extract_all_performance_numbers_and_liberal_match()
+    test_gt_matches_in_numbers()
+    test_parse_metrics_from_performance_list()
+    test_run_model_batch_splits_results()
+    test_run_models_batch_respects_output_limit()
     print("All tests passed.")
     sys.exit(0)
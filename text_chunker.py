@@ -1,10 +1,13 @@
 """Text chunking utilities for handling large documents."""
+import re
 import tiktoken
 
 
 def estimate_tokens(text, model="gpt-4"):
     """
     Estimate the number of tokens in text.
+    Not memoized: callers pass whole documents, and keeping them alive as cache keys costs more
+    memory than re-encoding saves (constant prompt sizes are computed once by their callers).
     
     Args:
         text: The text to estimate
@@ -73,3 +76,59 @@ def chunk_text(text, max_tokens=6000, model="gpt-4", overlap=200):
                 break
     
     return chunks
+
+
+def chunk_text_by_sections(text, max_tokens=6000, model="gpt-4"):
+    """
+    Split text into chunks on paragraph/section boundaries (blank lines), without overlap.
+    
+    Paragraphs are packed greedily into chunks of at most max_tokens; a single paragraph
+    larger than max_tokens falls back to token-based chunk_text with no overlap.
+    
+    Args:
+        text: The text to chunk
+        max_tokens: Maximum tokens per chunk (leaving room for prompts)
+        model: The model name
+        
+    Returns:
+        List of text chunks
+    """
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+        count = lambda s: len(encoding.encode(s))
+    except Exception:
+        # Fallback: rough estimate (1 token ≈ 4 characters)
+        count = lambda s: len(s) // 4
+    
+    separator = "\n\n"
+    separator_tokens = count(separator)
+    chunks = []
+    current = []
+    current_tokens = 0
+    
+    for paragraph in re.split(r'\n\s*\n', text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        paragraph_tokens = count(paragraph)
+        
+        if paragraph_tokens > max_tokens:
+            # Oversized section: flush what we have, then split it on token boundaries
+            if current:
+                chunks.append(separator.join(current))
+                current, current_tokens = [], 0
+            chunks.extend(chunk_text(paragraph, max_tokens=max_tokens, model=model, overlap=0))
+            continue
+        
+        added_tokens = paragraph_tokens + (separator_tokens if current else 0)
+        if current and current_tokens + added_tokens > max_tokens:
+            chunks.append(separator.join(current))
+            current, current_tokens = [paragraph], paragraph_tokens
+        else:
+            current.append(paragraph)
+            current_tokens += added_tokens
+    
+    if current:
+        chunks.append(separator.join(current))
+    
+    return chunks